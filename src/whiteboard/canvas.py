@@ -5,7 +5,13 @@ This module contains the core canvas infrastructure including the scene and view
 that provide infinite scrolling, zooming, and interactive note management.
 """
 
-from PyQt6.QtCore import Qt, QRectF, QPointF, pyqtSignal
+import logging
+import math
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+from functools import partial
+
+from PyQt6.QtCore import Qt, QRectF, QPointF, QTimer, pyqtSignal
 from PyQt6.QtGui import (
     QPainter,
     QWheelEvent,
@@ -20,6 +26,7 @@ from PyQt6.QtGui import (
     QDragMoveEvent,
     QDropEvent,
     QPixmap,
+    QTransform,
 )
 from PyQt6.QtWidgets import (
     QGraphicsScene,
@@ -39,6 +46,16 @@ from .commands.note_commands import CreateNoteCommand, MoveNoteCommand
 from .commands.connection_commands import CreateConnectionCommand
 from .commands.image_commands import AddImageCommand
 
+# Item signals that indicate an item's scene bounds may have changed
+_GEOMETRY_SIGNALS = ("position_changed", "content_changed", "style_changed")
+
+# Connection preview pens, shared by every canvas
+_PREVIEW_PEN_VALID = QPen(QColor(50, 150, 50), 3, Qt.PenStyle.DashLine)
+_PREVIEW_PEN_INVALID = QPen(Qt.GlobalColor.gray, 2, Qt.PenStyle.DashLine)
+
+# Scene background brush
+_WHITE_BRUSH = QBrush(Qt.GlobalColor.white)
+
 
 class WhiteboardScene(QGraphicsScene):
     """
@@ -56,6 +73,8 @@ class WhiteboardScene(QGraphicsScene):
     scene_bounds_changed = pyqtSignal(QRectF)
     item_added = pyqtSignal(QGraphicsItem)
     item_removed = pyqtSignal(QGraphicsItem)
+    note_added = pyqtSignal(NoteItem)  # Emitted only for NoteItem additions
+    connection_added = pyqtSignal(ConnectionItem)  # Emitted only for connections
 
     def __init__(self, parent=None):
         """
@@ -72,6 +91,12 @@ class WhiteboardScene(QGraphicsScene):
         self._expansion_threshold = 1000  # Distance from edge to trigger expansion
         self._expansion_amount = 5000  # Amount to expand scene by
 
+        # Inner edges (scene rect shrunk by the threshold) that an item must
+        # stay within to avoid expansion; kept in sync with the scene rect
+        self._safe_left = self._safe_top = 0.0
+        self._safe_right = self._safe_bottom = 0.0
+        self.sceneRectChanged.connect(self._update_safe_bounds)
+
         # Set initial scene rectangle (will expand as needed)
         initial_rect = QRectF(
             -self._initial_size / 2,
@@ -82,10 +107,30 @@ class WhiteboardScene(QGraphicsScene):
         self.setSceneRect(initial_rect)
 
         # Scene properties
-        self.setBackgroundBrush(Qt.GlobalColor.white)
+        self.setBackgroundBrush(_WHITE_BRUSH)
 
         # Track items for bounds management
-        self._tracked_items: list[QGraphicsItem] = []
+        # (dict used as an ordered set for O(1) removal)
+        self._tracked_items: dict[QGraphicsItem, None] = {}
+
+        # Notes and connections currently in the scene, in insertion order
+        # (dicts used as ordered sets)
+        self._notes: dict[NoteItem, None] = {}
+        self._connections: dict[ConnectionItem, None] = {}
+
+        # Expansions during bulk additions are reported once they settle
+        self._bounds_emit_timer = QTimer(self)
+        self._bounds_emit_timer.setSingleShot(True)
+        self._bounds_emit_timer.setInterval(16)
+        self._bounds_emit_timer.timeout.connect(self._emit_scene_bounds_changed)
+
+        # Cached union of tracked item bounds, rebuilt only when marked dirty
+        self._content_bounds_cache: QRectF | None = None
+        self._content_bounds_dirty = True
+
+        # Notes are moved constantly; keeping Qt's BSP tree in sync on every
+        # position change costs more than the linear lookups it saves here
+        self.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
 
         self.logger.info(f"WhiteboardScene initialized with bounds: {initial_rect}")
 
@@ -97,13 +142,69 @@ class WhiteboardScene(QGraphicsScene):
             item: Graphics item to add
         """
         super().addItem(item)
-        self._tracked_items.append(item)
+        self._tracked_items[item] = None
+        self._watch_item_geometry(item, True)
+
+        # One bounds query serves both the content cache and scene expansion
+        item_rect = item.sceneBoundingRect()
+        self._extend_content_bounds(item, item_rect)
 
         # Check if scene needs expansion
-        self._check_and_expand_scene(item.sceneBoundingRect())
+        self._check_and_expand_scene(item_rect)
 
+        self._announce_item(item)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Added item to scene: {type(item).__name__}")
+
+    def add_items(self, items: Iterable[QGraphicsItem]) -> None:
+        """
+        Add several items at once, expanding the scene at most once.
+
+        Intended for bulk loads; each item is still tracked and announced
+        exactly as with addItem().
+
+        Args:
+            items: Graphics items to add
+        """
+        items = list(items)
+        coords = []
+        for item in items:
+            super().addItem(item)
+            self._tracked_items[item] = None
+            self._watch_item_geometry(item, True)
+
+            item_rect = item.sceneBoundingRect()
+            self._extend_content_bounds(item, item_rect)
+            if not item_rect.isNull():
+                coords.append(item_rect.getCoords())
+
+        # One expansion check against the union of all new items
+        if coords:
+            lefts, tops, rights, bottoms = zip(*coords)
+            left, top = min(lefts), min(tops)
+            self._check_and_expand_scene(
+                QRectF(left, top, max(rights) - left, max(bottoms) - top)
+            )
+
+        for item in items:
+            self._announce_item(item)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Added {len(items)} items to scene")
+
+    def _announce_item(self, item: QGraphicsItem) -> None:
+        """
+        Index a newly added item by kind and emit the matching signals.
+
+        Args:
+            item: Graphics item that was just added
+        """
         self.item_added.emit(item)
-        self.logger.debug(f"Added item to scene: {type(item).__name__}")
+        if isinstance(item, NoteItem):
+            self._notes[item] = None
+            self.note_added.emit(item)
+        elif isinstance(item, ConnectionItem):
+            self._connections[item] = None
+            self.connection_added.emit(item)
 
     def removeItem(self, item: QGraphicsItem) -> None:
         """
@@ -114,10 +215,82 @@ class WhiteboardScene(QGraphicsScene):
         """
         super().removeItem(item)
         if item in self._tracked_items:
-            self._tracked_items.remove(item)
+            del self._tracked_items[item]
+            self._watch_item_geometry(item, False)
+        self._notes.pop(item, None)
+        self._connections.pop(item, None)
+        self._content_bounds_dirty = True
 
         self.item_removed.emit(item)
-        self.logger.debug(f"Removed item from scene: {type(item).__name__}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Removed item from scene: {type(item).__name__}")
+
+    def _watch_item_geometry(self, item: QGraphicsItem, watch: bool) -> None:
+        """
+        Connect or disconnect an item's change signals to content bounds invalidation.
+
+        Items without such signals are treated as static; callers moving them
+        directly should call invalidate_content_bounds(). Connections are
+        skipped: their geometry follows the watched endpoints, restyles
+        invalidate the bounds themselves, and reading ``signals`` would
+        create their lazy emitter.
+
+        Args:
+            item: Graphics item being tracked or untracked
+            watch: True to connect, False to disconnect
+        """
+        if isinstance(item, ConnectionItem):
+            return
+        holder = getattr(item, "signals", item)
+        for name in _GEOMETRY_SIGNALS:
+            signal = getattr(holder, name, None)
+            if signal is None:
+                continue
+            if watch:
+                signal.connect(self.invalidate_content_bounds)
+            else:
+                try:
+                    signal.disconnect(self.invalidate_content_bounds)
+                except (TypeError, RuntimeError):
+                    pass
+
+    def _extend_content_bounds(self, item: QGraphicsItem, item_rect: QRectF) -> None:
+        """
+        Grow a valid content bounds cache to include a newly added item.
+
+        Additions can only enlarge the union, so the cache stays valid; a
+        stale cache is simply left for the next full recompute.
+
+        Args:
+            item: Graphics item that was just added
+            item_rect: The item's bounding rectangle in scene coordinates
+        """
+        cache = self._content_bounds_cache
+        if self._content_bounds_dirty or cache is None:
+            return
+        if not item.isVisible() or item_rect.isNull():
+            return
+        self._content_bounds_cache = (
+            QRectF(item_rect) if cache.isNull() else cache.united(item_rect)
+        )
+
+    def invalidate_content_bounds(self, *_args) -> None:
+        """Mark the cached content bounds as stale."""
+        self._content_bounds_dirty = True
+
+    def _update_safe_bounds(self, rect: QRectF) -> None:
+        """
+        Cache the edges items must stay within to avoid scene expansion.
+
+        Args:
+            rect: New scene rectangle
+        """
+        margin = self._expansion_threshold
+        left, top, right, bottom = rect.getCoords()
+        self._safe_left = left + margin
+        self._safe_top = top + margin
+        self._safe_right = right - margin
+        self._safe_bottom = bottom - margin
 
     def _check_and_expand_scene(self, item_rect: QRectF) -> None:
         """
@@ -126,6 +299,16 @@ class WhiteboardScene(QGraphicsScene):
         Args:
             item_rect: Bounding rectangle of the item in scene coordinates
         """
+        # Fast path: item is comfortably inside the current scene rect
+        left, top, right, bottom = item_rect.getCoords()
+        if (
+            left >= self._safe_left
+            and right <= self._safe_right
+            and top >= self._safe_top
+            and bottom <= self._safe_bottom
+        ):
+            return
+
         current_rect = self.sceneRect()
         needs_expansion = False
         new_rect = QRectF(current_rect)
@@ -151,13 +334,43 @@ class WhiteboardScene(QGraphicsScene):
 
         if needs_expansion:
             self.setSceneRect(new_rect)
-            self.scene_bounds_changed.emit(new_rect)
-            self.logger.debug(f"Scene expanded to: {new_rect}")
+            if not self._bounds_emit_timer.isActive():
+                self._bounds_emit_timer.start()
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Scene expanded to: {new_rect}")
+
+    def _emit_scene_bounds_changed(self) -> None:
+        """Emit scene_bounds_changed with the current scene rectangle."""
+        self.scene_bounds_changed.emit(self.sceneRect())
 
     def get_content_bounds(self) -> QRectF:
         """
         Get the bounding rectangle of all items in the scene.
 
+        Returns:
+            QRectF containing all scene items, or empty rect if no items
+        """
+        return QRectF(self._cached_content_bounds())
+
+    def _cached_content_bounds(self) -> QRectF:
+        """
+        Get the cached content bounds, recomputing them only when stale.
+
+        The returned rect is the cache itself; internal read-only callers use
+        it to skip the defensive copy made by get_content_bounds().
+
+        Returns:
+            Cached QRectF containing all scene items
+        """
+        if self._content_bounds_dirty or self._content_bounds_cache is None:
+            self._content_bounds_cache = self._compute_content_bounds()
+            self._content_bounds_dirty = False
+        return self._content_bounds_cache
+
+    def _compute_content_bounds(self) -> QRectF:
+        """
+        Compute the union of all tracked item bounds.
+
         Returns:
             QRectF containing all scene items, or empty rect if no items
         """
@@ -165,45 +378,48 @@ class WhiteboardScene(QGraphicsScene):
             self.logger.debug("No tracked items found for content bounds calculation")
             return QRectF()
 
-        # Calculate union of all item bounds
-        content_rect = QRectF()
-        valid_items = []
-        image_count = 0
-        note_count = 0
-        connection_count = 0
+        # Collect (x1, y1, x2, y2) per item with one call each, then reduce
+        # every column at once instead of comparing edges item by item
+        coords = []
+        dead_items = []
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        type_counts: Counter[str] = Counter()
 
         for item in self._tracked_items:
             try:
                 # Check if the item is still valid (not deleted)
                 item_rect = item.sceneBoundingRect()
-                valid_items.append(item)
-
-                # Count different item types for logging
-                item_type = type(item).__name__
-                if "ImageItem" in item_type:
-                    image_count += 1
-                    self.logger.debug(f"Including ImageItem in bounds: {item_rect}")
-                elif "NoteItem" in item_type:
-                    note_count += 1
-                elif "ConnectionItem" in item_type:
-                    connection_count += 1
-
-                if content_rect.isNull():
-                    content_rect = item_rect
-                else:
-                    content_rect = content_rect.united(item_rect)
+
+                # Hidden helpers (e.g. reusable preview lines) are not content
+                if not item.isVisible():
+                    continue
+                if debug:
+                    type_counts[type(item).__name__] += 1
+                if item_rect.isNull():
+                    continue
+                coords.append(item_rect.getCoords())
             except RuntimeError:
                 # Item has been deleted, skip it
                 self.logger.debug(f"Skipping deleted item: {type(item).__name__}")
-                continue
+                dead_items.append(item)
 
-        # Update tracked items to remove any deleted ones
-        self._tracked_items = valid_items
+        # Stop tracking any deleted items
+        for item in dead_items:
+            del self._tracked_items[item]
 
-        self.logger.debug(
-            f"Content bounds calculated: {content_rect} "
-            f"(Images: {image_count}, Notes: {note_count}, Connections: {connection_count})"
-        )
+        if not coords:
+            return QRectF()
+
+        lefts, tops, rights, bottoms = zip(*coords)
+        left, top = min(lefts), min(tops)
+        content_rect = QRectF(left, top, max(rights) - left, max(bottoms) - top)
+
+        if debug:
+            self.logger.debug(
+                f"Content bounds calculated: {content_rect} "
+                f"(Images: {type_counts['ImageItem']}, Notes: {type_counts['NoteItem']}, "
+                f"Connections: {type_counts['ConnectionItem']})"
+            )
 
         return content_rect
 
@@ -214,18 +430,70 @@ class WhiteboardScene(QGraphicsScene):
         Returns:
             QPointF representing the center of all items, or (0,0) if no items
         """
-        content_bounds = self.get_content_bounds()
+        content_bounds = self._cached_content_bounds()
         if content_bounds.isNull():
             return QPointF(0, 0)
 
         return content_bounds.center()
 
+    def item_at(
+        self, pos: QPointF, device_transform: QTransform
+    ) -> QGraphicsItem | None:
+        """
+        Get the topmost item at a scene position, skipping the scan off-content.
+
+        Positions outside the cached content bounds cannot hit a tracked item,
+        so the per-item scan of itemAt() is only run inside them or over the
+        children of selected items, such as image resize handles, which can
+        overhang their parent's edge.
+
+        Args:
+            pos: Position in scene coordinates
+            device_transform: View transform, as for itemAt()
+
+        Returns:
+            Topmost item at the position, or None
+        """
+        if not self._cached_content_bounds().contains(pos) and not any(
+            item.mapRectToScene(item.childrenBoundingRect()).contains(pos)
+            for item in self.selectedItems()
+        ):
+            return None
+        return self.itemAt(pos, device_transform)
+
+    def clear(self) -> None:
+        """
+        Remove all items from the scene and drop them from tracking.
+        """
+        super().clear()
+        self._tracked_items.clear()
+        self._notes.clear()
+        self._connections.clear()
+        self._content_bounds_dirty = True
+
+    def get_notes(self) -> list[NoteItem]:
+        """
+        Get the notes currently in the scene.
+
+        Returns:
+            List of NoteItem objects in the order they were added
+        """
+        return list(self._notes)
+
+    def get_connections(self) -> list[ConnectionItem]:
+        """
+        Get the connections currently in the scene.
+
+        Returns:
+            List of ConnectionItem objects in the order they were added
+        """
+        return list(self._connections)
+
     def clear_all_items(self) -> None:
         """
         Remove all items from the scene and reset tracking.
         """
         self.clear()
-        self._tracked_items.clear()
 
         # Reset scene to initial size
         initial_rect = QRectF(
@@ -245,23 +513,27 @@ class WhiteboardScene(QGraphicsScene):
         Returns:
             Dictionary containing scene statistics
         """
-        content_bounds = self.get_content_bounds()
+        content_bounds = self._cached_content_bounds()
         scene_rect = self.sceneRect()
+        scene_center = scene_rect.center()
+
+        if content_bounds.isNull():
+            content_width = content_height = 0
+            content_center = (0, 0)
+        else:
+            content_width = content_bounds.width()
+            content_height = content_bounds.height()
+            center = content_bounds.center()
+            content_center = (center.x(), center.y())
 
         return {
             "item_count": len(self._tracked_items),
             "scene_width": scene_rect.width(),
             "scene_height": scene_rect.height(),
-            "content_width": content_bounds.width()
-            if not content_bounds.isNull()
-            else 0,
-            "content_height": content_bounds.height()
-            if not content_bounds.isNull()
-            else 0,
-            "scene_center": (scene_rect.center().x(), scene_rect.center().y()),
-            "content_center": (content_bounds.center().x(), content_bounds.center().y())
-            if not content_bounds.isNull()
-            else (0, 0),
+            "content_width": content_width,
+            "content_height": content_height,
+            "scene_center": (scene_center.x(), scene_center.y()),
+            "content_center": content_center,
         }
 
 
@@ -289,6 +561,9 @@ class WhiteboardCanvas(QGraphicsView):
     note_hover_hint = pyqtSignal(str)  # Emits hint text for status bar
     note_hover_ended = pyqtSignal()  # Emits when hover ends
 
+    # Class-level default: QGraphicsView.__init__ may scroll before ours runs
+    _view_center_scene: QPointF | None = None
+
     def __init__(self, scene: WhiteboardScene, parent=None):
         """
         Initialize the whiteboard canvas.
@@ -307,7 +582,7 @@ class WhiteboardCanvas(QGraphicsView):
         self._command_stack = UndoRedoStack()
 
         # Connect to scene signals to handle notes added from other sources
-        self._scene.item_added.connect(self._on_item_added_to_scene)
+        self._scene.note_added.connect(self._on_note_added)
 
         # Zoom configuration
         self._zoom_factor = 1.0
@@ -319,6 +594,18 @@ class WhiteboardCanvas(QGraphicsView):
         self._pan_mode = False
         self._last_pan_point = QPointF()
 
+        # Scroll bars live as long as the view; the widget center only moves
+        # on resize
+        self._h_bar = self.horizontalScrollBar()
+        self._v_bar = self.verticalScrollBar()
+        self._view_center = self.rect().center()
+
+        # Scene position of the view center; delta-updated while scrolling and
+        # recomputed lazily after transform or geometry changes
+        self._view_center_scene: QPointF | None = None
+        self._view_center_scale = 1.0  # View scale the cached center belongs to
+        self._scene.sceneRectChanged.connect(self._invalidate_view_center)
+
         # Zoom selection configuration (Shift+drag)
         self._zoom_selection_mode = False
         self._zoom_selection_start = QPointF()
@@ -332,12 +619,61 @@ class WhiteboardCanvas(QGraphicsView):
             10  # Minimum drag distance to start connection
         )
         self._connection_target_note = None  # Currently highlighted target note
+        # Scene center of the start item; it stays put while the mouse drags
+        self._connection_start_scene_pos: QPointF | None = None
+        self._connection_start_pos = QPointF()  # Drag start in view coordinates
+        self._last_preview_pos = QPointF()  # Mouse position of last preview update
+        self._preview_min_motion = 2  # Manhattan pixels before re-rendering preview
+
+        # Coalesce preview updates to one per event loop pass
+        self._preview_pending_pos: QPointF | None = None
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(0)
+        self._preview_timer.timeout.connect(self._flush_preview)
+
+        # Preview pen state; None forces the first update to set a pen
+        self._preview_has_target: bool | None = None
+
+        # Antialiasing is suspended during pan/zoom gestures and restored after
+        self._aa_restore_delay_ms = 100
+        self._aa_restore_timer = QTimer(self)
+        self._aa_restore_timer.setSingleShot(True)
+        self._aa_restore_timer.setInterval(self._aa_restore_delay_ms)
+        self._aa_restore_timer.timeout.connect(self._restore_antialiasing)
+
+        # Throttle pan_changed to about 60 Hz during continuous panning
+        self._pan_emit_timer = QTimer(self)
+        self._pan_emit_timer.setSingleShot(True)
+        self._pan_emit_timer.setInterval(16)
+        self._pan_emit_timer.timeout.connect(self._emit_pan_changed)
+
+        # Coalesce viewport_changed emissions while the window is being resized
+        self._resize_emit_timer = QTimer(self)
+        self._resize_emit_timer.setSingleShot(True)
+        self._resize_emit_timer.setInterval(16)
+        self._resize_emit_timer.timeout.connect(self._emit_viewport_changed)
+
+        # Keyboard shortcut dispatch tables
+        self._build_shortcut_tables()
+
+        # Canvas context menu, built on first right-click and reused afterwards
+        self._context_menu: QMenu | None = None
+        self._context_template_menu: QMenu | None = None
+        self._template_menu_stale = True
+        self._last_context_scene_pos = QPointF()
 
         # Configure view properties
         self._setup_view()
 
         # Track existing connections to prevent duplicates
         self._connections = []
+        # Endpoint pair -> number of tracked connections joining it
+        self._connection_pairs: Counter[frozenset] = Counter()
+        # Endpoint item -> tracked connections attached to it
+        self._connections_by_item: defaultdict[QGraphicsItem, list[ConnectionItem]] = (
+            defaultdict(list)
+        )
 
         self.logger.info("WhiteboardCanvas initialized")
 
@@ -394,15 +730,40 @@ class WhiteboardCanvas(QGraphicsView):
         # Viewport update strategy and caching to avoid trail artifacts at low zoom
         try:
             self.setViewportUpdateMode(
-                QGraphicsView.ViewportUpdateMode.BoundingRectViewportUpdate
+                QGraphicsView.ViewportUpdateMode.SmartViewportUpdate
             )
             self.setCacheMode(QGraphicsView.CacheModeFlag.CacheNone)
+            # Every item paint() sets the pen and brush it draws with, so state
+            # left by the previous item is harmless
+            self.setOptimizationFlag(
+                QGraphicsView.OptimizationFlag.DontSavePainterState, True
+            )
             self.logger.debug(
-                "WhiteboardCanvas viewport mode set to BoundingRectViewportUpdate and cache disabled"
+                "WhiteboardCanvas viewport mode set to SmartViewportUpdate and cache disabled"
             )
         except Exception as e:
             self.logger.warning(f"Failed to configure viewport/cache settings: {e}")
 
+    def _suspend_antialiasing(self) -> None:
+        """Disable antialiasing while a pan/zoom gesture is in flight.
+
+        Item paint() inherits the view's render hints, so notes, images and
+        connections are drawn aliased until the hint is restored.
+        """
+        self.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+
+    def _restore_antialiasing(self) -> None:
+        """Re-enable antialiasing once the pan/zoom gesture has finished."""
+        self._aa_restore_timer.stop()
+        if self._pan_mode or self.renderHints() & QPainter.RenderHint.Antialiasing:
+            return
+        self.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        # Item caches rebuilt mid-gesture were drawn aliased; repaint the
+        # visible ones so they pick up the restored hint
+        for item in self.items(self.viewport().rect()):
+            if item.cacheMode() != QGraphicsItem.CacheMode.NoCache:
+                item.update()
+
     def wheelEvent(self, event: QWheelEvent) -> None:
         """
         Handle mouse wheel events for zooming with zoom-to-cursor functionality.
@@ -431,6 +792,10 @@ class WhiteboardCanvas(QGraphicsView):
                 new_zoom = max(self._zoom_factor / zoom_delta, self._min_zoom)
 
             if new_zoom != old_zoom:
+                # Render without antialiasing while the scroll burst lasts
+                self._suspend_antialiasing()
+                self._aa_restore_timer.start()
+
                 self._set_zoom(new_zoom)
 
                 # Calculate the new scene position under the mouse after zooming
@@ -442,9 +807,10 @@ class WhiteboardCanvas(QGraphicsView):
                 # Pan the view to compensate for the zoom shift
                 self.pan(-delta.x(), -delta.y())
 
-                self.logger.debug(
-                    f"Zoom-to-cursor (Option): old_zoom={old_zoom:.2f}, new_zoom={self._zoom_factor:.2f}, scene_pos=({scene_pos.x():.1f}, {scene_pos.y():.1f})"
-                )
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(
+                        f"Zoom-to-cursor (Option): old_zoom={old_zoom:.2f}, new_zoom={self._zoom_factor:.2f}, scene_pos=({scene_pos.x():.1f}, {scene_pos.y():.1f})"
+                    )
         else:
             # Default scroll behavior
             super().wheelEvent(event)
@@ -461,6 +827,7 @@ class WhiteboardCanvas(QGraphicsView):
             self._pan_mode = True
             self._last_pan_point = event.position()
             self.setCursor(Qt.CursorShape.ClosedHandCursor)
+            self._suspend_antialiasing()
         elif (
             event.button() == Qt.MouseButton.LeftButton
             and event.modifiers() & Qt.KeyboardModifier.ShiftModifier
@@ -524,14 +891,14 @@ class WhiteboardCanvas(QGraphicsView):
             self._last_pan_point = event.position()
 
             # Apply pan by adjusting scroll bars
-            h_bar = self.horizontalScrollBar()
-            v_bar = self.verticalScrollBar()
+            h_bar = self._h_bar
+            v_bar = self._v_bar
 
             h_bar.setValue(h_bar.value() - int(delta.x()))
             v_bar.setValue(v_bar.value() - int(delta.y()))
 
-            # Emit pan changed signal
-            self.pan_changed.emit(self.mapToScene(self.rect().center()))
+            # Emit pan changed signal (throttled)
+            self._schedule_pan_changed()
         elif self._zoom_selection_mode:
             # Update zoom selection rectangle using scene coordinates
             start_scene = self._zoom_selection_start
@@ -544,8 +911,14 @@ class WhiteboardCanvas(QGraphicsView):
 
             self._zoom_selection_rect_item.setRect(x, y, width, height)
         elif self._connection_mode:
-            # Update connection preview
-            self._update_connection_preview(event.position())
+            # Skip preview updates for sub-pixel jitter to avoid redundant repaints
+            mouse_pos = event.position()
+            if (
+                mouse_pos - self._last_preview_pos
+            ).manhattanLength() < self._preview_min_motion:
+                return
+            self._last_preview_pos = mouse_pos
+            self._update_connection_preview(mouse_pos)
         else:
             super().mouseMoveEvent(event)
 
@@ -562,10 +935,12 @@ class WhiteboardCanvas(QGraphicsView):
             # End panning
             self._pan_mode = False
             self.setCursor(Qt.CursorShape.ArrowCursor)
+            self._restore_antialiasing()
         elif event.button() == Qt.MouseButton.LeftButton and self._zoom_selection_mode:
             # Complete zoom selection
             self._zoom_selection_mode = False
             self._zoom_selection_rect_item.setVisible(False)
+            self._scene.invalidate_content_bounds()
             self.setCursor(Qt.CursorShape.ArrowCursor)
 
             # Get the scene rectangle directly from the item
@@ -594,7 +969,7 @@ class WhiteboardCanvas(QGraphicsView):
             scene_pos = self.mapToScene(event.pos())
 
             # Check if click is on empty canvas (not on an existing item)
-            item_at_pos = self.scene().itemAt(scene_pos, self.transform())
+            item_at_pos = self._scene.item_at(scene_pos, self.transform())
 
             if item_at_pos is None:
                 # Create new note at click position
@@ -634,17 +1009,19 @@ class WhiteboardCanvas(QGraphicsView):
         """Handle note hover end events."""
         self.note_hover_ended.emit()
 
-    def _on_item_added_to_scene(self, item) -> None:
+    def _on_note_added(self, note: NoteItem) -> None:
         """
-        Handle items added to the scene to connect note signals.
+        Prepare a note added to the scene from any source.
+
+        Connects its hover signals and caches its rendering in device
+        coordinates so unchanged notes are blitted instead of repainted.
 
         Args:
-            item: Graphics item added to scene
+            note: Note item added to scene
         """
-        # Connect hover signals if it's a NoteItem
-        if isinstance(item, NoteItem):
-            item.hover_started.connect(self._on_note_hover_started)
-            item.hover_ended.connect(self._on_note_hover_ended)
+        note.hover_started.connect(self._on_note_hover_started)
+        note.hover_ended.connect(self._on_note_hover_ended)
+        note.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
 
     def keyPressEvent(self, event: QKeyEvent) -> None:
         """
@@ -681,64 +1058,71 @@ class WhiteboardCanvas(QGraphicsView):
         if self._handle_context_menu_shortcuts(key, modifiers):
             return
 
-        # Handle zoom shortcuts
-        if self._handle_zoom_shortcuts(key, modifiers):
-            return
-
-        # Handle pan shortcuts
-        if self._handle_pan_shortcuts(key):
-            return
-
-        # Handle other navigation shortcuts
-        if self._handle_navigation_shortcuts(key):
+        # Handle zoom, pan and navigation shortcuts
+        ctrl = bool(modifiers & Qt.KeyboardModifier.ControlModifier)
+        entry = self._view_shortcut_table.get((ctrl, key))
+        if entry is not None:
+            handler_name, args = entry
+            getattr(self, handler_name)(*args)
             return
 
         # Default behavior
         super().keyPressEvent(event)
 
-    def _handle_zoom_shortcuts(self, key: int, modifiers) -> bool:
+    def _build_shortcut_tables(self) -> None:
         """
-        Handle zoom-related keyboard shortcuts.
-
-        Args:
-            key: Key code
-            modifiers: Keyboard modifiers
+        Precompute keyboard shortcut dispatch tables.
 
-        Returns:
-            True if shortcut was handled, False otherwise
+        Tables are keyed by ``(ctrl_pressed, key)`` and map to a handler method
+        name plus its arguments. Handlers are resolved by name at dispatch time
+        so they can still be replaced on the instance (e.g. in tests).
         """
-        if not (modifiers & Qt.KeyboardModifier.ControlModifier):
-            return False
-
-        if key == Qt.Key.Key_Plus or key == Qt.Key.Key_Equal:
-            self.zoom_in()
-            return True
-        elif key == Qt.Key.Key_Minus:
-            self.zoom_out()
-            return True
-        elif key == Qt.Key.Key_0:
-            self.reset_zoom()
-            return True
+        any_ctrl = (False, True)
 
-        return False
+        # Context menu shortcuts; handlers return True when the key was consumed
+        self._context_shortcut_table: dict[tuple[bool, int], str] = {}
+        for key in (Qt.Key.Key_Delete, Qt.Key.Key_Backspace):
+            for ctrl in any_ctrl:
+                self._context_shortcut_table[(ctrl, key)] = "_handle_delete_shortcut"
+        for key, handler_name in (
+            (Qt.Key.Key_C, "_handle_copy_shortcut"),
+            (Qt.Key.Key_V, "_handle_paste_shortcut"),
+            (Qt.Key.Key_A, "_handle_select_all_shortcut"),
+            (Qt.Key.Key_N, "_handle_new_note_shortcut"),
+        ):
+            self._context_shortcut_table[(True, key)] = handler_name
+
+        # Zoom, pan and navigation shortcuts; always consume the key
+        self._view_shortcut_table: dict[tuple[bool, int], tuple[str, tuple]] = {
+            (True, Qt.Key.Key_Plus): ("zoom_in", ()),
+            (True, Qt.Key.Key_Equal): ("zoom_in", ()),
+            (True, Qt.Key.Key_Minus): ("zoom_out", ()),
+            (True, Qt.Key.Key_0): ("reset_zoom", ()),
+        }
+        for key, direction in (
+            (Qt.Key.Key_Left, (-1, 0)),
+            (Qt.Key.Key_Right, (1, 0)),
+            (Qt.Key.Key_Up, (0, -1)),
+            (Qt.Key.Key_Down, (0, 1)),
+        ):
+            for ctrl in any_ctrl:
+                self._view_shortcut_table[(ctrl, key)] = (
+                    "_pan_by_shortcut",
+                    direction,
+                )
+        for ctrl in any_ctrl:
+            self._view_shortcut_table[(ctrl, Qt.Key.Key_Home)] = (
+                "center_on_content",
+                (),
+            )
 
     def _handle_context_menu_shortcuts(self, key: int, modifiers) -> bool:
         """Handle context menu shortcuts."""
-        if key in (Qt.Key.Key_Delete, Qt.Key.Key_Backspace):
-            return self._handle_delete_shortcut()
-
-        ctrl = Qt.KeyboardModifier.ControlModifier
-        if (modifiers & ctrl) == ctrl:
-            if key == Qt.Key.Key_C:
-                return self._handle_copy_shortcut()
-            if key == Qt.Key.Key_V:
-                return self._handle_paste_shortcut()
-            if key == Qt.Key.Key_A:
-                return self._handle_select_all_shortcut()
-            if key == Qt.Key.Key_N:
-                return self._handle_new_note_shortcut()
-
-        return False
+        ctrl = bool(modifiers & Qt.KeyboardModifier.ControlModifier)
+        handler_name = self._context_shortcut_table.get((ctrl, key))
+        if handler_name is None:
+            return False
+        return getattr(self, handler_name)()
 
     def _handle_delete_shortcut(self) -> bool:
         """Handle delete key shortcut for selected items."""
@@ -902,10 +1286,9 @@ class WhiteboardCanvas(QGraphicsView):
 
     def _handle_select_all_shortcut(self) -> bool:
         """Handle select all shortcut."""
-        # Select all items in the scene
-        for item in self.scene().items():
-            if hasattr(item, "_note_id") or hasattr(item, "_connection_id"):
-                item.setSelected(True)
+        # Select all notes and connections in the scene
+        scene = self.scene()
+        self._select_items(scene, [*scene.get_notes(), *scene.get_connections()])
 
         self.logger.debug("Selected all items via keyboard shortcut")
         return True
@@ -913,69 +1296,31 @@ class WhiteboardCanvas(QGraphicsView):
     def _handle_new_note_shortcut(self) -> bool:
         """Handle new note shortcut - create note at center of view."""
         # Get center of current view
-        center_point = self.mapToScene(self.rect().center())
+        center_point = self._get_view_center_scene()
 
         # Create note at center
         self._create_note_at_position(center_point)
         return True
 
-    def _handle_pan_shortcuts(self, key: int) -> bool:
+    def _pan_by_shortcut(self, x_direction: int, y_direction: int) -> None:
         """
-        Handle pan-related keyboard shortcuts with enhanced user experience.
+        Pan in the given direction with a zoom-adapted distance.
 
         Args:
-            key: Key code
-
-        Returns:
-            True if shortcut was handled, False otherwise
+            x_direction: -1, 0 or 1 for left, none or right
+            y_direction: -1, 0 or 1 for up, none or down
         """
         # Adaptive pan distance based on zoom level for better UX
         base_pan_distance = 50
         zoom_adjusted_distance = base_pan_distance / max(self._zoom_factor, 0.1)
         pan_distance = max(20, min(zoom_adjusted_distance, 200))  # Clamp between 20-200
 
-        if key == Qt.Key.Key_Left:
-            self.pan(-pan_distance, 0)
-            self.logger.debug(
-                f"Pan left by {pan_distance:.1f} pixels (zoom: {self._zoom_factor:.2f})"
-            )
-            return True
-        elif key == Qt.Key.Key_Right:
-            self.pan(pan_distance, 0)
+        self.pan(x_direction * pan_distance, y_direction * pan_distance)
+        if self.logger.isEnabledFor(logging.DEBUG):
             self.logger.debug(
-                f"Pan right by {pan_distance:.1f} pixels (zoom: {self._zoom_factor:.2f})"
+                f"Pan by ({x_direction}, {y_direction}) x {pan_distance:.1f} pixels "
+                f"(zoom: {self._zoom_factor:.2f})"
             )
-            return True
-        elif key == Qt.Key.Key_Up:
-            self.pan(0, -pan_distance)
-            self.logger.debug(
-                f"Pan up by {pan_distance:.1f} pixels (zoom: {self._zoom_factor:.2f})"
-            )
-            return True
-        elif key == Qt.Key.Key_Down:
-            self.pan(0, pan_distance)
-            self.logger.debug(
-                f"Pan down by {pan_distance:.1f} pixels (zoom: {self._zoom_factor:.2f})"
-            )
-            return True
-
-        return False
-
-    def _handle_navigation_shortcuts(self, key: int) -> bool:
-        """
-        Handle other navigation shortcuts.
-
-        Args:
-            key: Key code
-
-        Returns:
-            True if shortcut was handled, False otherwise
-        """
-        if key == Qt.Key.Key_Home:
-            self.center_on_content()
-            return True
-
-        return False
 
     def _handle_paste_shortcut(self) -> bool:
         """
@@ -1046,15 +1391,13 @@ class WhiteboardCanvas(QGraphicsView):
                 return False
 
             # Get paste position (center of current view)
-            paste_position = self.mapToScene(self.rect().center())
+            paste_position = self._get_view_center_scene()
 
             # Add image to canvas using existing command system
             cmd = AddImageCommand(self._scene, self, temp_file, paste_position)
             self.execute_command(cmd)
 
             # Clean up temporary file after a delay
-            from PyQt6.QtCore import QTimer
-
             QTimer.singleShot(5000, lambda: self._cleanup_temp_file(temp_file))
 
             self.logger.info("Successfully pasted image from clipboard")
@@ -1077,7 +1420,7 @@ class WhiteboardCanvas(QGraphicsView):
             True if images were pasted successfully, False otherwise
         """
         try:
-            paste_position = self.mapToScene(self.rect().center())
+            paste_position = self._get_view_center_scene()
             processed_count = 0
 
             # Offset subsequent images to avoid stacking
@@ -1139,7 +1482,7 @@ class WhiteboardCanvas(QGraphicsView):
         if new_zoom != old_zoom:
             self._set_zoom(new_zoom)
             self.logger.info(f"Zoomed in from {old_zoom:.1f}x to {new_zoom:.1f}x")
-        else:
+        elif self.logger.isEnabledFor(logging.DEBUG):
             self.logger.debug(f"Maximum zoom level reached: {self._max_zoom:.1f}x")
 
     def zoom_out(self) -> None:
@@ -1150,7 +1493,7 @@ class WhiteboardCanvas(QGraphicsView):
         if new_zoom != old_zoom:
             self._set_zoom(new_zoom)
             self.logger.info(f"Zoomed out from {old_zoom:.1f}x to {new_zoom:.1f}x")
-        else:
+        elif self.logger.isEnabledFor(logging.DEBUG):
             self.logger.debug(f"Minimum zoom level reached: {self._min_zoom:.1f}x")
 
     def reset_zoom(self) -> None:
@@ -1169,7 +1512,7 @@ class WhiteboardCanvas(QGraphicsView):
         old_zoom = self._zoom_factor
         clamped_zoom = max(self._min_zoom, min(zoom_factor, self._max_zoom))
 
-        if clamped_zoom != zoom_factor:
+        if clamped_zoom != zoom_factor and self.logger.isEnabledFor(logging.DEBUG):
             self.logger.debug(
                 f"Zoom factor {zoom_factor:.2f} clamped to {clamped_zoom:.2f}"
             )
@@ -1190,27 +1533,24 @@ class WhiteboardCanvas(QGraphicsView):
             return
 
         # Store center point before zoom for better user experience
-        center_before = self.mapToScene(self.rect().center())
+        center_before = self._get_view_center_scene()
 
-        # Calculate scale factor relative to current zoom
-        scale_factor = zoom_factor / self._zoom_factor
+        # Previous zoom, used to report the scale factor when debugging
+        old_zoom = self._zoom_factor
 
-        # Apply scaling transformation
-        self.scale(scale_factor, scale_factor)
+        # Apply the absolute zoom as a fresh transform rather than composing
+        # with the current one, so no drift accumulates across zoom steps
+        self.setTransform(QTransform.fromScale(zoom_factor, zoom_factor))
 
         # Update zoom factor
         self._zoom_factor = zoom_factor
+        self._view_center_scene = None
 
         # Adapt viewport update mode based on zoom to prevent artifacts
         self._update_viewport_mode_for_zoom()
 
         # Maintain center point after zoom for consistent experience
-        center_after = self.mapToScene(self.rect().center())
-        delta = center_after - center_before
-        if not (
-            abs(delta.x()) < 1 and abs(delta.y()) < 1
-        ):  # Only adjust if significant drift
-            self.pan(-delta.x(), -delta.y())
+        self.centerOn(center_before)
 
         # Emit zoom changed signal
         self.zoom_changed.emit(self._zoom_factor)
@@ -1218,13 +1558,15 @@ class WhiteboardCanvas(QGraphicsView):
         # Emit viewport changed signal for minimap updates
         viewport_rect = self.mapToScene(self.viewport().rect()).boundingRect()
         self.viewport_changed.emit(viewport_rect)
-        self.logger.debug(
-            f"Viewport changed signal emitted after zoom: {viewport_rect}"
-        )
 
-        self.logger.debug(
-            f"Zoom applied: {self._zoom_factor:.3f}x (scale factor: {scale_factor:.3f})"
-        )
+        if self.logger.isEnabledFor(logging.DEBUG):
+            scale_factor = zoom_factor / old_zoom
+            self.logger.debug(
+                f"Viewport changed signal emitted after zoom: {viewport_rect}"
+            )
+            self.logger.debug(
+                f"Zoom applied: {self._zoom_factor:.3f}x (scale factor: {scale_factor:.3f})"
+            )
 
     def _update_viewport_mode_for_zoom(self) -> None:
         """Adapt the viewport update mode based on current zoom factor to reduce redraw trails."""
@@ -1232,14 +1574,15 @@ class WhiteboardCanvas(QGraphicsView):
             if self._zoom_factor <= 0.3:
                 desired = QGraphicsView.ViewportUpdateMode.FullViewportUpdate
             else:
-                desired = QGraphicsView.ViewportUpdateMode.BoundingRectViewportUpdate
+                desired = QGraphicsView.ViewportUpdateMode.SmartViewportUpdate
 
             current = self.viewportUpdateMode()
             if current != desired:
                 self.setViewportUpdateMode(desired)
-                self.logger.debug(
-                    f"ViewportUpdateMode changed to {desired.name} (zoom={self._zoom_factor:.2f})"
-                )
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(
+                        f"ViewportUpdateMode changed to {desired.name} (zoom={self._zoom_factor:.2f})"
+                    )
         except Exception as e:
             self.logger.warning(f"Failed to adapt viewport mode: {e}")
 
@@ -1251,8 +1594,8 @@ class WhiteboardCanvas(QGraphicsView):
             dx: Horizontal pan distance in pixels
             dy: Vertical pan distance in pixels
         """
-        h_bar = self.horizontalScrollBar()
-        v_bar = self.verticalScrollBar()
+        h_bar = self._h_bar
+        v_bar = self._v_bar
 
         # Store old values for logging
         old_h = h_bar.value()
@@ -1269,52 +1612,63 @@ class WhiteboardCanvas(QGraphicsView):
         actual_dx = new_h - old_h
         actual_dy = new_v - old_v
 
-        if actual_dx != 0 or actual_dy != 0:
+        if (actual_dx != 0 or actual_dy != 0) and self.logger.isEnabledFor(
+            logging.DEBUG
+        ):
             self.logger.debug(
                 f"Pan applied: dx={actual_dx}, dy={actual_dy} (requested: dx={dx:.1f}, dy={dy:.1f})"
             )
 
-        # Emit pan changed signal
-        center_point = self.mapToScene(self.rect().center())
-        self.pan_changed.emit(center_point)
+        # Emit pan changed signal (throttled)
+        self._schedule_pan_changed()
 
         # Emit viewport changed signal for minimap updates
-        viewport_rect = self.mapToScene(self.viewport().rect()).boundingRect()
-        self.viewport_changed.emit(viewport_rect)
+        self._emit_viewport_changed()
+
+    def _schedule_pan_changed(self) -> None:
+        """Queue a pan_changed emission unless one is already pending."""
+        if not self._pan_emit_timer.isActive():
+            self._pan_emit_timer.start()
+
+    def _emit_pan_changed(self) -> None:
+        """Emit pan_changed with the latest view center."""
+        self.pan_changed.emit(self._get_view_center_scene())
 
     def center_on_content(self) -> None:
         """Center the view on all content in the scene with enhanced feedback."""
         content_center = self._scene.center_on_content()
-        old_center = self.mapToScene(self.rect().center())
+        old_center = self._get_view_center_scene()
 
         self.centerOn(content_center)
         self.pan_changed.emit(content_center)
 
         # Calculate distance moved for user feedback
-        distance = (
-            (content_center.x() - old_center.x()) ** 2
-            + (content_center.y() - old_center.y()) ** 2
-        ) ** 0.5
-        self.logger.info(
-            f"Centered on content at ({content_center.x():.0f}, {content_center.y():.0f}), moved {distance:.0f} pixels"
-        )
+        if self.logger.isEnabledFor(logging.INFO):
+            distance = math.hypot(
+                content_center.x() - old_center.x(),
+                content_center.y() - old_center.y(),
+            )
+            self.logger.info(
+                f"Centered on content at ({content_center.x():.0f}, {content_center.y():.0f}), moved {distance:.0f} pixels"
+            )
 
     def center_on_point(self, x: float, y: float) -> None:
         """Center the view on a specific point with enhanced feedback."""
         target_point = QPointF(x, y)
-        old_center = self.mapToScene(self.rect().center())
+        old_center = self._get_view_center_scene()
 
         self.centerOn(target_point)
         self.pan_changed.emit(target_point)
 
         # Calculate distance moved for user feedback
-        distance = (
-            (target_point.x() - old_center.x()) ** 2
-            + (target_point.y() - old_center.y()) ** 2
-        ) ** 0.5
-        self.logger.info(
-            f"Centered on point ({target_point.x():.0f}, {target_point.y():.0f}), moved {distance:.0f} pixels"
-        )
+        if self.logger.isEnabledFor(logging.INFO):
+            distance = math.hypot(
+                target_point.x() - old_center.x(),
+                target_point.y() - old_center.y(),
+            )
+            self.logger.info(
+                f"Centered on point ({target_point.x():.0f}, {target_point.y():.0f}), moved {distance:.0f} pixels"
+            )
 
     def fit_content_in_view(self) -> None:
         """Fit all content to be visible in the current view with enhanced feedback."""
@@ -1334,6 +1688,7 @@ class WhiteboardCanvas(QGraphicsView):
 
         # Fit the content bounds in view
         self.fitInView(content_bounds, Qt.AspectRatioMode.KeepAspectRatio)
+        self._view_center_scene = None
 
         # Update zoom factor based on the new view
         transform = self.transform()
@@ -1341,9 +1696,10 @@ class WhiteboardCanvas(QGraphicsView):
 
         # Emit zoom changed signal and log the change
         self.zoom_changed.emit(self._zoom_factor)
-        self.logger.info(
-            f"Fitted content in view: zoom changed from {old_zoom:.2f}x to {self._zoom_factor:.2f}x"
-        )
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                f"Fitted content in view: zoom changed from {old_zoom:.2f}x to {self._zoom_factor:.2f}x"
+            )
 
     def _zoom_to_selection(self, scene_rect) -> None:
         """
@@ -1386,6 +1742,35 @@ class WhiteboardCanvas(QGraphicsView):
             f"selection={scene_rect.width():.0f}x{scene_rect.height():.0f}"
         )
 
+    def _get_view_center_scene(self) -> QPointF:
+        """
+        Get the view center in scene coordinates, using the cached value when valid.
+
+        Returns:
+            Copy of the cached center point
+        """
+        scale = self.transform().m11()
+        if self._view_center_scene is None or scale != self._view_center_scale:
+            self._view_center_scene = self.mapToScene(self._view_center)
+            self._view_center_scale = scale
+        return QPointF(self._view_center_scene)
+
+    def _invalidate_view_center(self, *_args) -> None:
+        """Drop the cached view center so it is re-mapped on next use."""
+        self._view_center_scene = None
+
+    def scrollContentsBy(self, dx: int, dy: int) -> None:
+        """
+        Shift the cached view center by the scroll delta instead of re-mapping it.
+
+        Args:
+            dx: Horizontal content shift in viewport pixels
+            dy: Vertical content shift in viewport pixels
+        """
+        super().scrollContentsBy(dx, dy)
+        if self._view_center_scene is not None:
+            self._view_center_scene -= QPointF(dx, dy) / self._view_center_scale
+
     def get_zoom_factor(self) -> float:
         """
         Get current zoom factor.
@@ -1402,7 +1787,7 @@ class WhiteboardCanvas(QGraphicsView):
         Returns:
             Center point of the current view
         """
-        return self.mapToScene(self.rect().center())
+        return self._get_view_center_scene()
 
     def get_canvas_statistics(self) -> dict:
         """
@@ -1436,7 +1821,15 @@ class WhiteboardCanvas(QGraphicsView):
         self._connection_start_note = (
             start_item  # Keeping variable name for compatibility
         )
-        self._last_pan_point = mouse_pos  # Store initial position for drag threshold
+        self._connection_start_scene_pos = start_item.mapToScene(
+            start_item.boundingRect().center()
+        )
+        # Store initial position for drag threshold
+        self._connection_start_pos = QPointF(mouse_pos)
+        self._last_preview_pos = QPointF(mouse_pos)
+
+        # Reuse a single preview line across gestures
+        self._ensure_connection_preview_line()
 
         # Change cursor to indicate connection mode
         self.setCursor(Qt.CursorShape.CrossCursor)
@@ -1454,23 +1847,33 @@ class WhiteboardCanvas(QGraphicsView):
 
     def _update_connection_preview(self, mouse_pos: QPointF) -> None:
         """
-        Update the connection preview line during dragging.
+        Schedule a connection preview update for the latest mouse position.
+
+        Updates are coalesced so at most one preview refresh runs per event
+        loop pass, using only the most recent position.
 
         Args:
             mouse_pos: Current mouse position in view coordinates
         """
-        if not self._connection_start_note:
+        self._preview_pending_pos = QPointF(mouse_pos)
+        if not self._preview_timer.isActive():
+            self._preview_timer.start()
+
+    def _flush_preview(self) -> None:
+        """Update the connection preview line for the pending mouse position."""
+        mouse_pos = self._preview_pending_pos
+        self._preview_pending_pos = None
+        start_note = self._connection_start_note
+        if mouse_pos is None or not start_note:
             return
 
         # Check if we've moved enough to start showing preview
-        drag_distance = (mouse_pos - self._last_pan_point).manhattanLength()
+        drag_distance = (mouse_pos - self._connection_start_pos).manhattanLength()
         if drag_distance < self._connection_drag_threshold:
             return
 
         # Convert positions to scene coordinates
-        start_scene_pos = self._connection_start_note.mapToScene(
-            self._connection_start_note.boundingRect().center()
-        )
+        start_scene_pos = self._connection_start_scene_pos
         end_scene_pos = self.mapToScene(mouse_pos.toPoint())
 
         # Check if mouse is over a valid target item
@@ -1482,49 +1885,61 @@ class WhiteboardCanvas(QGraphicsView):
         from .image_item import ImageItem
 
         # Allow connections between NoteItem and ImageItem in any direction
-        if (
-            isinstance(item_at_pos, (NoteItem, ImageItem))
-            and item_at_pos != self._connection_start_note
-        ):
+        if isinstance(item_at_pos, (NoteItem, ImageItem)) and item_at_pos != start_note:
             # Check if connection doesn't already exist
-            if not self._connection_exists(self._connection_start_note, item_at_pos):
+            if not self._connection_exists(start_note, item_at_pos):
                 target_item = item_at_pos
 
         # Update target item highlighting
         self._update_target_item_highlight(target_item)
 
-        # Create or update preview line
-        if not self._connection_preview_line:
-            from PyQt6.QtWidgets import QGraphicsLineItem
-
-            self._connection_preview_line = QGraphicsLineItem()
-            self._connection_preview_line.setZValue(
-                -0.5
-            )  # Behind notes but above background
-            self.scene().addItem(self._connection_preview_line)
-
-        # Update preview line style based on whether we have a valid target
-        if target_item:
-            # Green dashed line when over valid target
-            pen = QPen(QColor(50, 150, 50), 3, Qt.PenStyle.DashLine)
-            # Emit hint for status bar
-            self.note_hover_hint.emit("🔗 Release to create connection")
-        else:
-            # Gray dashed line when not over valid target
-            pen = QPen(Qt.GlobalColor.gray, 2, Qt.PenStyle.DashLine)
-            # Emit hint for status bar
-            self.note_hover_hint.emit("🔗 Drag to another item to create connection")
-
-        self._connection_preview_line.setPen(pen)
+        # Show the (lazily created) preview line
+        self._ensure_connection_preview_line()
+        preview = self._connection_preview_line
+        preview.setVisible(True)
+
+        # Update preview line style only when target validity flips
+        has_target = target_item is not None
+        if has_target != self._preview_has_target:
+            self._preview_has_target = has_target
+            if has_target:
+                # Green dashed line when over valid target
+                preview.setPen(_PREVIEW_PEN_VALID)
+                self.note_hover_hint.emit("🔗 Release to create connection")
+            else:
+                # Gray dashed line when not over valid target
+                preview.setPen(_PREVIEW_PEN_INVALID)
+                self.note_hover_hint.emit(
+                    "🔗 Drag to another item to create connection"
+                )
 
         # Update preview line position
-        self._connection_preview_line.setLine(
+        preview.setLine(
             start_scene_pos.x(),
             start_scene_pos.y(),
             end_scene_pos.x(),
             end_scene_pos.y(),
         )
 
+    def _ensure_connection_preview_line(self) -> None:
+        """Create the connection preview line on first use and keep it in the scene."""
+        line = self._connection_preview_line
+        if line is not None:
+            try:
+                if line.scene() is self.scene():
+                    return
+            except RuntimeError:
+                # Underlying item was destroyed (e.g. by scene.clear())
+                pass
+
+        from PyQt6.QtWidgets import QGraphicsLineItem
+
+        line = QGraphicsLineItem()
+        line.setZValue(-0.5)  # Behind notes but above background
+        line.setVisible(False)
+        self.scene().addItem(line)
+        self._connection_preview_line = line
+
     def _update_target_item_highlight(self, target_item) -> None:
         """
         Update the visual highlighting of the target item during connection creation.
@@ -1558,12 +1973,13 @@ class WhiteboardCanvas(QGraphicsView):
         Args:
             mouse_pos: Final mouse position in view coordinates
         """
-        if not self._connection_start_note:
+        start_note = self._connection_start_note
+        if not start_note:
             self._cancel_connection_creation()
             return
 
         # Check if we've moved enough to create a connection
-        drag_distance = (mouse_pos - self._last_pan_point).manhattanLength()
+        drag_distance = (mouse_pos - self._connection_start_pos).manhattanLength()
         if drag_distance < self._connection_drag_threshold:
             self._cancel_connection_creation()
             return
@@ -1577,14 +1993,11 @@ class WhiteboardCanvas(QGraphicsView):
         from .image_item import ImageItem
 
         # Allow connections between NoteItem and ImageItem in any direction
-        if (
-            isinstance(item_at_pos, (NoteItem, ImageItem))
-            and item_at_pos != self._connection_start_note
-        ):
+        if isinstance(item_at_pos, (NoteItem, ImageItem)) and item_at_pos != start_note:
             # Create connection between items
-            if not self._connection_exists(self._connection_start_note, item_at_pos):
+            if not self._connection_exists(start_note, item_at_pos):
                 cmd = CreateConnectionCommand(
-                    self._scene, self, self._connection_start_note, item_at_pos
+                    self._scene, self, start_note, item_at_pos
                 )
                 self.execute_command(cmd)
                 self.logger.info("Created connection via command")
@@ -1615,6 +2028,10 @@ class WhiteboardCanvas(QGraphicsView):
         """Cancel connection creation and clean up."""
         self._connection_mode = False
         self._connection_start_note = None
+        self._connection_start_scene_pos = None
+        self._preview_timer.stop()
+        self._preview_pending_pos = None
+        self._preview_has_target = None
 
         # Clear target note highlight
         if self._connection_target_note:
@@ -1622,10 +2039,10 @@ class WhiteboardCanvas(QGraphicsView):
             self._connection_target_note.update()
             self._connection_target_note = None
 
-        # Remove preview line if it exists
+        # Hide preview line so it can be reused by the next gesture
         if self._connection_preview_line:
-            self.scene().removeItem(self._connection_preview_line)
-            self._connection_preview_line = None
+            self._connection_preview_line.setVisible(False)
+            self._scene.invalidate_content_bounds()
 
         # Clear status bar hint
         self.note_hover_ended.emit()
@@ -1644,12 +2061,7 @@ class WhiteboardCanvas(QGraphicsView):
         Returns:
             True if connection exists, False otherwise
         """
-        for connection in self._connections:
-            if connection.is_connected_to_note(
-                item1
-            ) and connection.is_connected_to_note(item2):
-                return True
-        return False
+        return self._connection_pairs[frozenset((item1, item2))] > 0
 
     def _create_connection(self, start_item, end_item) -> ConnectionItem:
         """
@@ -1671,6 +2083,10 @@ class WhiteboardCanvas(QGraphicsView):
 
             # Track connection
             self._connections.append(connection)
+            self._connection_pairs[frozenset((start_item, end_item))] += 1
+            self._connections_by_item[start_item].append(connection)
+            if end_item is not start_item:
+                self._connections_by_item[end_item].append(connection)
 
             # Connect to deletion signal to remove from tracking
             connection.signals.connection_deleted.connect(
@@ -1695,9 +2111,22 @@ class WhiteboardCanvas(QGraphicsView):
         """
         if connection in self._connections:
             self._connections.remove(connection)
-            self.logger.debug(
-                f"Removed connection {connection.get_connection_id()} from tracking"
-            )
+            pair = frozenset((connection.get_start_item(), connection.get_end_item()))
+            self._connection_pairs[pair] -= 1
+            if self._connection_pairs[pair] <= 0:
+                del self._connection_pairs[pair]
+            for item in pair:
+                attached = self._connections_by_item.get(item)
+                if attached is None:
+                    continue
+                if connection in attached:
+                    attached.remove(connection)
+                if not attached:
+                    del self._connections_by_item[item]
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    f"Removed connection {connection.get_connection_id()} from tracking"
+                )
 
     def get_connections(self) -> list[ConnectionItem]:
         """
@@ -1725,10 +2154,8 @@ class WhiteboardCanvas(QGraphicsView):
         Args:
             item: Item whose connections should be deleted (NoteItem or ImageItem)
         """
-        # Create a copy of the list to avoid modification during iteration
-        connections_to_delete = [
-            conn for conn in self._connections if conn.is_connected_to_note(item)
-        ]
+        # Copy the indexed list; deleting connections mutates it
+        connections_to_delete = list(self._connections_by_item.get(item, ()))
 
         for connection in connections_to_delete:
             connection.delete_connection()
@@ -1762,18 +2189,21 @@ class WhiteboardCanvas(QGraphicsView):
         # For now, we use Ctrl+click for connection creation
 
     def resizeEvent(self, event) -> None:
-        """Handle resize events and emit viewport changes."""
+        """Handle resize events and schedule a viewport change notification."""
         super().resizeEvent(event)
+        self._view_center = self.rect().center()
+        self._view_center_scene = None
 
-        # Emit viewport changed signal when view is resized
-        # Emit viewport changed signal with current scene bounds
-        current_bounds = self.scene().get_content_bounds()
-        self.viewport_changed.emit(current_bounds)
-        self.logger.debug(
-            f"Viewport changed signal emitted with bounds: {current_bounds}"
-        )
+        # Interactive resizes arrive in bursts; emit once after they settle
+        self._resize_emit_timer.start()
 
-        self.logger.debug(f"Canvas resized to {event.size()}, viewport updated")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Canvas resized to {event.size()}, viewport updated")
+
+    def _emit_viewport_changed(self) -> None:
+        """Emit viewport_changed with the visible scene rectangle."""
+        viewport_rect = self.mapToScene(self.viewport().rect()).boundingRect()
+        self.viewport_changed.emit(viewport_rect)
 
     def contextMenuEvent(self, event: QContextMenuEvent) -> None:
         """
@@ -1791,7 +2221,33 @@ class WhiteboardCanvas(QGraphicsView):
             super().contextMenuEvent(event)
             return
 
-        # Create canvas context menu
+        self._last_context_scene_pos = scene_pos
+        menu = self._context_menu
+        if menu is None:
+            self._build_context_menu()
+            menu = self._context_menu
+        if self._template_menu_stale:
+            template_menu = self._context_template_menu
+            template_menu.clear()
+            self._populate_canvas_template_menu(template_menu)
+            self._template_menu_stale = False
+
+        # Show menu at cursor position
+        menu.exec(event.globalPos())
+
+        # Accept the event to prevent propagation
+        event.accept()
+
+    def _build_context_menu(self) -> None:
+        """
+        Build the canvas context menu once so right-clicks only have to show it.
+
+        Actions act on ``_last_context_scene_pos``, which is updated by
+        contextMenuEvent before the menu is shown. The template submenu is
+        repopulated lazily whenever the style manager's templates change.
+        """
+        from .style_manager import get_style_manager
+
         menu = QMenu(self)
 
         # Note creation section
@@ -1800,13 +2256,10 @@ class WhiteboardCanvas(QGraphicsView):
         # Quick note creation
         quick_note_action = create_menu.addAction("✏️ Quick Note")
         quick_note_action.setShortcut(QKeySequence("Ctrl+N"))
-        quick_note_action.triggered.connect(
-            lambda: self._create_note_at_position(scene_pos)
-        )
+        quick_note_action.triggered.connect(self._create_note_at_context_position)
 
         # Template notes
-        template_menu = create_menu.addMenu("📋 From Template")
-        self._populate_canvas_template_menu(template_menu, scene_pos)
+        self._context_template_menu = create_menu.addMenu("📋 From Template")
 
         menu.addSeparator()
 
@@ -1861,11 +2314,30 @@ class WhiteboardCanvas(QGraphicsView):
         info_action = menu.addAction("ℹ️ Canvas Info")
         info_action.triggered.connect(self._show_canvas_info)
 
-        # Show menu at cursor position
-        menu.exec(event.globalPos())
+        self._context_menu = menu
+        self._template_menu_stale = True
 
-        # Accept the event to prevent propagation
-        event.accept()
+        style_manager = get_style_manager()
+        style_manager.template_added.connect(self._mark_template_menu_stale)
+        style_manager.template_removed.connect(self._mark_template_menu_stale)
+
+    def _mark_template_menu_stale(self, *_args) -> None:
+        """Schedule the template submenu to be rebuilt on the next right-click."""
+        self._template_menu_stale = True
+
+    def _create_note_at_context_position(self, *_args) -> None:
+        """Create a quick note where the context menu was last opened."""
+        self._create_note_at_position(self._last_context_scene_pos)
+
+    def _create_note_from_context_template(self, template_name: str, *_args) -> None:
+        """
+        Create a templated note where the context menu was last opened.
+
+        Args:
+            template_name: Name of the template to use
+            *_args: Ignored ``checked`` flag passed by ``QAction.triggered``
+        """
+        self._create_note_from_template(template_name, self._last_context_scene_pos)
 
     def _create_note_at_position(
         self, scene_pos: QPointF, text: str = "New Note"
@@ -1882,15 +2354,14 @@ class WhiteboardCanvas(QGraphicsView):
             self.note_created.emit(note)
         return note
 
-    def _populate_canvas_template_menu(
-        self, template_menu: QMenu, scene_pos: QPointF
-    ) -> None:
+    def _populate_canvas_template_menu(self, template_menu: QMenu) -> None:
         """
         Populate the template menu with available note templates.
 
+        Notes are created at the position the context menu was last opened.
+
         Args:
             template_menu: Menu to populate
-            scene_pos: Position where note will be created
         """
         from .style_manager import get_style_manager
 
@@ -1905,9 +2376,7 @@ class WhiteboardCanvas(QGraphicsView):
         for template_name in template_names:
             action = template_menu.addAction(f"📄 {template_name}")
             action.triggered.connect(
-                lambda checked,
-                name=template_name,
-                pos=scene_pos: self._create_note_from_template(name, pos)
+                partial(self._create_note_from_context_template, template_name)
             )
 
     def _create_note_from_template(
@@ -1949,12 +2418,30 @@ class WhiteboardCanvas(QGraphicsView):
 
     def _select_all_notes(self) -> None:
         """Select all notes on the canvas."""
-        for item in self._scene.items():
-            if isinstance(item, NoteItem):
-                item.setSelected(True)
+        self._select_items(self._scene, self._scene.get_notes())
 
         self.logger.debug("Selected all notes on canvas")
 
+    def _select_items(self, scene, items) -> None:
+        """
+        Select items while emitting the scene's selectionChanged at most once.
+
+        Args:
+            scene: Scene owning the items
+            items: Items to select
+        """
+        changed = False
+        was_blocked = scene.blockSignals(True)
+        try:
+            for item in items:
+                if not item.isSelected():
+                    item.setSelected(True)
+                    changed = True
+        finally:
+            scene.blockSignals(was_blocked)
+        if changed:
+            scene.selectionChanged.emit()
+
     def _clear_selection(self) -> None:
         """Clear all selections on the canvas."""
         self._scene.clearSelection()
@@ -1964,9 +2451,10 @@ class WhiteboardCanvas(QGraphicsView):
         """Center the view on all content."""
         content_center = self._scene.center_on_content()
         self.centerOn(content_center)
-        self.logger.debug(
-            f"Centered view on content at ({content_center.x():.1f}, {content_center.y():.1f})"
-        )
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                f"Centered view on content at ({content_center.x():.1f}, {content_center.y():.1f})"
+            )
 
     def _fit_all_content(self) -> None:
         """Fit all content in the view."""
@@ -1978,14 +2466,16 @@ class WhiteboardCanvas(QGraphicsView):
                 -padding, -padding, padding, padding
             )
             self.fitInView(padded_bounds, Qt.AspectRatioMode.KeepAspectRatio)
+            self._view_center_scene = None
 
             # Update zoom factor based on the new view
             self._zoom_factor = self.transform().m11()
             self.zoom_changed.emit(self._zoom_factor)
 
-            self.logger.debug(
-                f"Fitted all content in view, new zoom: {self._zoom_factor:.2f}"
-            )
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    f"Fitted all content in view, new zoom: {self._zoom_factor:.2f}"
+                )
 
     def _show_canvas_info(self) -> None:
         """Show canvas information in the status bar."""
@@ -2000,7 +2490,8 @@ class WhiteboardCanvas(QGraphicsView):
         # Emit as hover hint to show in status bar
         self.note_hover_hint.emit(info_text)
 
-        self.logger.debug(f"Canvas info: {stats}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Canvas info: {stats}")
 
     def _connect_note_signals(self, note) -> None:
         """
@@ -2022,6 +2513,8 @@ class WhiteboardCanvas(QGraphicsView):
 
     def _on_note_text_changed(self, text: str) -> None:
         """Handle note text changes."""
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         try:
             preview = text[:50] if text is not None else ""
             self.logger.debug(f"Note text changed: {preview}...")
@@ -2030,12 +2523,15 @@ class WhiteboardCanvas(QGraphicsView):
 
     def _on_note_position_changed(self, position) -> None:
         """Handle note position changes."""
-        self.logger.debug(
-            f"Note position changed to ({position.x():.1f}, {position.y():.1f})"
-        )
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                f"Note position changed to ({position.x():.1f}, {position.y():.1f})"
+            )
 
     def _on_note_style_changed(self, style: dict) -> None:
         """Handle note style changes."""
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         try:
             self.logger.debug(f"Note style changed: {style}")
         except Exception as e:
@@ -10,13 +10,19 @@ from typing import Any
 from dataclasses import dataclass, field
 from PyQt6.QtCore import QPointF
 
+# Seconds within which consecutive edits of the same target are merged
+MERGE_WINDOW = 0.5
 
-@dataclass
+
+@dataclass(slots=True)
 class Command:
     """Abstract base class for all commands.
 
     Each command implements execute(), undo(), and redo() and may provide
     a serializable payload that captures the state necessary to reverse the action.
+
+    Commands are slotted to keep long undo histories compact; subclasses
+    declare their own ``__slots__`` for the state they add.
     """
 
     description: str = ""
@@ -32,6 +38,17 @@ class Command:
         # Default redo is to execute again
         self.execute()
 
+    def try_merge(self, other: Command) -> bool:
+        """Absorb a newer command that continues the same edit.
+
+        Args:
+            other: Command executed immediately after this one
+
+        Returns:
+            True if ``other`` was folded into this command
+        """
+        return False
+
     def serialize(self) -> dict[str, Any]:
         """Return a JSON-serializable representation of the command."""
         return {
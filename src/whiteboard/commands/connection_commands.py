@@ -12,8 +12,29 @@ from .base import Command
 # from ..canvas import WhiteboardCanvas, WhiteboardScene
 from ..connection_item import ConnectionItem
 
+_log = get_logger(__name__)
+
+
+def _endpoint_id(obj: Any) -> str:
+    """Return the payload identifier for a connection endpoint."""
+    get_note_id = getattr(obj, "get_note_id", None)
+    if get_note_id is not None:
+        return f"note_{get_note_id()}"
+    get_image_id = getattr(obj, "get_image_id", None)
+    if get_image_id is not None:
+        return f"image_{get_image_id()}"
+    return f"item_{id(obj)}"
+
 
 class CreateConnectionCommand(Command):
+    __slots__ = (
+        "_canvas",
+        "_connection",
+        "_end_item",
+        "_scene",
+        "_start_item",
+    )
+
     def __init__(
         self,
         scene: Any,
@@ -23,39 +44,31 @@ class CreateConnectionCommand(Command):
         description: str = "Create connection",
     ) -> None:
         super().__init__(description=description)
-        self._logger = get_logger(__name__)
         self._scene = scene
         self._canvas = canvas
         self._start_item = start_item
         self._end_item = end_item
         self._connection: ConnectionItem | None = None
         self.payload = {
-            "start_id": self._endpoint_id(self._start_item),
-            "end_id": self._endpoint_id(self._end_item),
+            "start_id": _endpoint_id(self._start_item),
+            "end_id": _endpoint_id(self._end_item),
         }
 
-    def _endpoint_id(self, obj: Any) -> str:
-        if hasattr(obj, "get_note_id"):
-            return f"note_{obj.get_note_id()}"
-        if hasattr(obj, "get_image_id"):
-            return f"image_{obj.get_image_id()}"
-        return f"item_{id(obj)}"
-
     def execute(self) -> None:
         try:
             conn = self._canvas._create_connection(self._start_item, self._end_item)
             self._connection = conn
-            self._logger.info("Connection created via command")
+            _log.info("Connection created via command")
         except Exception as e:
-            self._logger.error(f"Failed to create connection via command: {e}")
+            _log.error(f"Failed to create connection via command: {e}")
 
     def undo(self) -> None:
         try:
             if self._connection:
                 self._canvas.delete_connection(self._connection)
-                self._logger.info("CreateConnectionCommand undone: connection removed")
+                _log.info("CreateConnectionCommand undone: connection removed")
         except Exception as e:
-            self._logger.error(f"Failed to undo connection creation: {e}")
+            _log.error(f"Failed to undo connection creation: {e}")
 
     def redo(self) -> None:
         self.execute()
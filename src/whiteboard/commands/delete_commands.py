@@ -7,18 +7,65 @@ and restore them on undo using serialized state.
 
 from __future__ import annotations
 
+import logging
+from collections.abc import Mapping
 from typing import Any
 from PyQt6.QtCore import QPointF
 
 from ..utils.logging_config import get_logger
 from .base import Command
+from .note_commands import _intern_style
 from ..note_item import NoteItem
+from ..style_manager import get_style_manager
 from ..image_item import ImageItem
 from ..connection_item import ConnectionItem
 from ..canvas import WhiteboardCanvas, WhiteboardScene
 
+_log = get_logger(__name__)
+
+
+def _serialize_note(item: NoteItem) -> tuple[str, dict[str, Any]]:
+    """Serialize a note for restoring on undo."""
+    return "notes", item.get_note_data()
+
+
+def _serialize_image(item: ImageItem) -> tuple[str, dict[str, Any]]:
+    """Serialize an image, including its position and source path."""
+    data = item.get_image_data()
+    pos = item.pos()
+    data["position"] = (pos.x(), pos.y())
+    data["image_path"] = item.get_image_path()
+    return "images", data
+
+
+def _serialize_connection(item: ConnectionItem) -> tuple[str, dict[str, Any]]:
+    """Serialize a connection for restoring on undo."""
+    return "connections", item.get_connection_data()
+
+
+# Serializers by exact item type; each returns (payload bucket, data)
+_SERIALIZERS = {
+    NoteItem: _serialize_note,
+    ImageItem: _serialize_image,
+    ConnectionItem: _serialize_connection,
+}
+
+
+def _find_serializer(item: Any):
+    """Return the serializer for a subclass (or spec'd stand-in) of a known type."""
+    for item_type, serializer in _SERIALIZERS.items():
+        if isinstance(item, item_type):
+            return serializer
+    return None
+
 
 class DeleteItemsCommand(Command):
+    __slots__ = (
+        "_canvas",
+        "_items",
+        "_scene",
+    )
+
     def __init__(
         self,
         scene: WhiteboardScene,
@@ -27,102 +74,143 @@ class DeleteItemsCommand(Command):
         description: str = "Delete items",
     ) -> None:
         super().__init__(description=description)
-        self._logger = get_logger(__name__)
         self._scene = scene
         self._canvas = canvas
         self._items = list(items)
-        # Serialized state for undo
-        self._notes_data: list[dict[str, Any]] = []
-        self._images_data: list[dict[str, Any]] = []
-        self._connections_data: list[dict[str, Any]] = []
 
     def _serialize_items(self) -> None:
-        self._notes_data.clear()
-        self._images_data.clear()
-        self._connections_data.clear()
+        """Capture the state of the items to delete in ``payload`` for undo."""
+        notes: list[dict[str, Any]] = []
+        images: list[dict[str, Any]] = []
+        connections: list[dict[str, Any]] = []
+        buckets = {
+            "notes": notes.append,
+            "images": images.append,
+            "connections": connections.append,
+        }
         for it in self._items:
-            if isinstance(it, NoteItem):
-                self._notes_data.append(it.get_note_data())
-            elif isinstance(it, ImageItem):
-                data = it.get_image_data()
-                pos = it.pos()
-                data["position"] = (pos.x(), pos.y())
-                data["image_path"] = it.get_image_path()
-                self._images_data.append(data)
-            elif isinstance(it, ConnectionItem):
-                self._connections_data.append(it.get_connection_data())
+            serializer = _SERIALIZERS.get(type(it)) or _find_serializer(it)
+            if serializer is not None:
+                bucket, data = serializer(it)
+                buckets[bucket](data)
 
         self.payload = {
-            "notes": self._notes_data,
-            "images": self._images_data,
-            "connections": self._connections_data,
+            "notes": notes,
+            "images": images,
+            "connections": connections,
         }
-        self._logger.debug(
-            f"DeleteItemsCommand payload: notes={len(self._notes_data)}, images={len(self._images_data)}, connections={len(self._connections_data)}"
-        )
+        if notes:
+            # Most notes keep the default style, so only record what differs
+            # from a baseline shared with every other command
+            baseline = _intern_style(get_style_manager().get_default_style())
+            for note_data in notes:
+                note_data["style"] = {
+                    key: value
+                    for key, value in note_data.get("style", {}).items()
+                    if key not in baseline or baseline[key] != value
+                }
+            self.payload["style_baseline"] = baseline
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug(
+                f"DeleteItemsCommand payload: notes={len(notes)}, images={len(images)}, connections={len(connections)}"
+            )
 
     def _delete_connections_first(self) -> None:
         """Delete connection items first to avoid dangling references."""
-        for conn in list(self._connections_data):
-            for item in list(self._items):
-                try:
-                    if isinstance(
-                        item, ConnectionItem
-                    ) and item.get_connection_id() == conn.get("id"):
-                        item.delete_connection()
-                        self._items.remove(item)
-                except Exception as e:
-                    self._logger.error(f"Failed deleting connection: {e}")
+        conn_ids = {conn.get("id") for conn in self.payload.get("connections", ())}
+        remaining = []
+        for item in self._items:
+            if not isinstance(item, ConnectionItem):
+                remaining.append(item)
+                continue
+            try:
+                if item.get_connection_id() in conn_ids:
+                    item.delete_connection()
+                    continue
+            except Exception as e:
+                _log.error(f"Failed deleting connection: {e}")
+            remaining.append(item)
+        self._items = remaining
 
     def _delete_remaining_items(self) -> None:
         """Delete notes and images in a simplified loop."""
-        for item in list(self._items):
+        for item in self._items:
             try:
                 if isinstance(item, NoteItem):
-                    if hasattr(item, "_delete_note"):
-                        item._delete_note()
-                    else:
-                        self._canvas.delete_connections_for_item(item)
-                        if item.scene():
-                            item.scene().removeItem(item)
+                    delete = getattr(item, "_delete_note", None)
                 elif isinstance(item, ImageItem):
-                    if hasattr(item, "_delete_image"):
-                        item._delete_image()
-                    else:
-                        self._canvas.delete_connections_for_item(item)
-                        if item.scene():
-                            item.scene().removeItem(item)
+                    delete = getattr(item, "_delete_image", None)
+                else:
+                    continue
+                if delete is not None:
+                    delete()
+                else:
+                    self._canvas.delete_connections_for_item(item)
+                    if item.scene():
+                        item.scene().removeItem(item)
             except Exception as e:
-                self._logger.error(f"Failed deleting item: {e}")
+                _log.error(f"Failed deleting item: {e}")
 
     def execute(self) -> None:
         # Serialize current state then delete
         self._serialize_items()
         self._delete_connections_first()
         self._delete_remaining_items()
-        self._logger.info("Deleted items via command")
+        _log.info("Deleted items via command")
 
-    def _restore_notes(self, id_map: dict[int, Any]) -> None:
-        for note_data in self._notes_data:
+    def _restore_notes(
+        self,
+        notes_data: list[dict[str, Any]],
+        baseline: Mapping[str, Any],
+        id_map: dict[str, Any],
+    ) -> None:
+        notes = []
+        for note_data in notes_data:
             try:
                 pos_x, pos_y = note_data.get("position", (0, 0))
                 note = NoteItem(note_data.get("text", ""), QPointF(pos_x, pos_y))
-                style = note_data.get("style")
+                style = {**baseline, **note_data.get("style", {})}
                 if style:
                     note.set_style(style)
                 if "id" in note_data:
                     note._note_id = int(note_data["id"])  # restore id
-                self._scene.addItem(note)
-                try:
-                    self._canvas._connect_note_signals(note)
-                except Exception:
-                    pass
-                id_map[note._note_id] = note
+                notes.append(note)
+                id_map[f"note_{note._note_id}"] = note
             except Exception as e:
-                self._logger.error(f"Failed to restore note: {e}")
+                _log.error(f"Failed to restore note: {e}")
+        self._scene.add_items(notes)
+        for note in notes:
+            try:
+                self._canvas._connect_note_signals(note)
+            except Exception:
+                pass
 
-    def _restore_images(self, id_map: dict[int, Any]) -> None:
-        for image_data in self._images_data:
+    def _detached_images(self) -> dict[Any, ImageItem]:
+        """Return deleted images that can be put back as-is, by image id."""
+        detached = {}
+        for item in self._items:
+            if not isinstance(item, ImageItem):
+                continue
+            try:
+                if item.scene() is None:
+                    detached[item.get_image_id()] = item
+            except RuntimeError:
+                # Underlying Qt object is gone; rebuild from data instead
+                continue
+        return detached
+
+    def _restore_images(
+        self, images_data: list[dict[str, Any]], id_map: dict[str, Any]
+    ) -> None:
+        images = []
+        # Re-inserting the original item avoids reloading its pixmap
+        detached = self._detached_images()
+        for image_data in images_data:
+            image = detached.get(image_data.get("id"))
+            if image is not None:
+                images.append(image)
+                id_map[f"image_{image.get_image_id()}"] = image
+                continue
             try:
                 pos_data = image_data.get("position", (0, 0))
                 image = ImageItem(
@@ -133,50 +221,54 @@ class DeleteItemsCommand(Command):
                     image.update_style(style)
                 if "id" in image_data:
                     image._image_id = int(image_data["id"])  # restore id
-                self._scene.addItem(image)
-                id_map[image._image_id] = image
+                images.append(image)
+                id_map[f"image_{image._image_id}"] = image
             except Exception as e:
-                self._logger.error(f"Failed to restore image: {e}")
+                _log.error(f"Failed to restore image: {e}")
+        self._scene.add_items(images)
 
-    def _resolve_endpoint(self, id_map: dict[int, Any], item_id: Any) -> Any | None:
+    def _resolve_endpoint(self, id_map: dict[str, Any], item_id: Any) -> Any | None:
         """Resolve endpoint from serialized generic ID."""
         if not isinstance(item_id, str):
             return None
-        try:
-            if item_id.startswith("note_"):
-                return id_map.get(int(item_id.split("_", 1)[1]))
-            if item_id.startswith("image_"):
-                return id_map.get(int(item_id.split("_", 1)[1]))
-        except Exception:
-            return None
-        return None
+        return id_map.get(item_id)
 
-    def _restore_connections(self, id_map: dict[int, Any]) -> None:
-        for conn_data in self._connections_data:
+    def _restore_connections(
+        self, connections_data: list[dict[str, Any]], id_map: dict[str, Any]
+    ) -> None:
+        connections = []
+        for conn_data in connections_data:
             try:
                 start_item = self._resolve_endpoint(
                     id_map, conn_data.get("start_item_id")
                 )
                 end_item = self._resolve_endpoint(id_map, conn_data.get("end_item_id"))
                 if not start_item or not end_item:
-                    self._logger.warning(
-                        "Skipping connection restore: endpoints not found"
-                    )
+                    _log.warning("Skipping connection restore: endpoints not found")
                     continue
                 connection = ConnectionItem(start_item, end_item)
                 style = conn_data.get("style")
                 if style:
                     connection.set_style(style)
-                self._scene.addItem(connection)
+                connections.append(connection)
             except Exception as e:
-                self._logger.error(f"Failed to restore connection: {e}")
+                _log.error(f"Failed to restore connection: {e}")
+        self._scene.add_items(connections)
 
     def undo(self) -> None:
-        id_map: dict[int, Any] = {}
-        self._restore_notes(id_map)
-        self._restore_images(id_map)
-        self._restore_connections(id_map)
-        self._logger.info("Undo delete: items restored")
+        id_map: dict[str, Any] = {}
+        # Repaint once after everything is back rather than per item
+        self._canvas.setUpdatesEnabled(False)
+        try:
+            payload = self.payload
+            self._restore_notes(
+                payload.get("notes", []), payload.get("style_baseline", {}), id_map
+            )
+            self._restore_images(payload.get("images", []), id_map)
+            self._restore_connections(payload.get("connections", []), id_map)
+        finally:
+            self._canvas.setUpdatesEnabled(True)
+        _log.info("Undo delete: items restored")
 
     def redo(self) -> None:
         self.execute()
@@ -12,8 +12,12 @@ from ..image_item import ImageItem
 # Avoid importing canvas/scene to prevent circulars
 # from ..canvas import WhiteboardCanvas, WhiteboardScene
 
+_log = get_logger(__name__)
+
 
 class AddImageCommand(Command):
+    __slots__ = ("_canvas", "_image", "_image_path", "_position", "_scene")
+
     def __init__(
         self,
         scene: Any,
@@ -23,7 +27,6 @@ class AddImageCommand(Command):
         description: str = "Add image",
     ) -> None:
         super().__init__(description=description)
-        self._logger = get_logger(__name__)
         self._scene = scene
         self._canvas = canvas
         self._image_path = image_path
@@ -39,9 +42,9 @@ class AddImageCommand(Command):
             image_item = ImageItem(image_path=self._image_path, position=self._position)
             self._scene.addItem(image_item)
             self._image = image_item
-            self._logger.info(f"Image added via command: {self._image_path}")
+            _log.info(f"Image added via command: {self._image_path}")
         except Exception as e:
-            self._logger.error(f"Failed to add image via command: {e}")
+            _log.error(f"Failed to add image via command: {e}")
 
     def undo(self) -> None:
         try:
@@ -53,9 +56,9 @@ class AddImageCommand(Command):
                     pass
                 if self._image.scene():
                     self._image.scene().removeItem(self._image)
-                self._logger.info("AddImageCommand undone: image removed")
+                _log.info("AddImageCommand undone: image removed")
         except Exception as e:
-            self._logger.error(f"Failed to undo image add: {e}")
+            _log.error(f"Failed to undo image add: {e}")
 
     def redo(self) -> None:
         self.execute()
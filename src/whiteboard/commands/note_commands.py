@@ -4,17 +4,74 @@ Note-related commands for undo/redo support.
 
 from __future__ import annotations
 
+import logging
+import time
+import weakref
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 from PyQt6.QtCore import QPointF
+from PyQt6.QtGui import QColor
 
 from ..utils.logging_config import get_logger
-from .base import Command, point_to_tuple
+from .base import MERGE_WINDOW, Command, point_to_tuple
 from ..note_item import NoteItem
 # Avoid circular import at runtime; use Any for scene/canvas
 # from ..canvas import WhiteboardCanvas, WhiteboardScene
 
+_log = get_logger(__name__)
+
+
+class _SharedStyle(dict):
+    """Style values shared by every command recording the same change.
+
+    Only exposed through ``view``, a read-only proxy over this dict. The
+    proxy keeps its holder alive, so a style stays interned while any
+    command references it and is collected with the last one.
+    """
+
+    __slots__ = ("__weakref__", "view")
+
+    def __init__(self, style: Mapping[str, Any]) -> None:
+        super().__init__(style)
+        self.view = MappingProxyType(self)
+
+
+# Interned styles by content; entries vanish with their last command
+_STYLE_CACHE: weakref.WeakValueDictionary[tuple, _SharedStyle] = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _intern_style(style: Mapping[str, Any]) -> Mapping[str, Any]:
+    """Return a shared read-only mapping equal to ``style``."""
+    try:
+        key = tuple(
+            sorted(
+                (name, ("rgba", value.rgba()) if isinstance(value, QColor) else value)
+                for name, value in style.items()
+            )
+        )
+        shared = _STYLE_CACHE.get(key)
+    except TypeError:
+        # Unhashable style values; keep a private read-only copy
+        return MappingProxyType(dict(style))
+    if shared is None:
+        shared = _SharedStyle(style)
+        _STYLE_CACHE[key] = shared
+    return shared.view
+
 
 class CreateNoteCommand(Command):
+    __slots__ = (
+        "_canvas",
+        "_note",
+        "_position",
+        "_scene",
+        "_style",
+        "_text",
+    )
+
     def __init__(
         self,
         scene: Any,
@@ -25,7 +82,6 @@ class CreateNoteCommand(Command):
         description: str = "Create note",
     ) -> None:
         super().__init__(description=description)
-        self._logger = get_logger(__name__)
         self._scene = scene
         self._canvas = canvas
         self._position = QPointF(position)
@@ -49,7 +105,7 @@ class CreateNoteCommand(Command):
         except Exception:
             pass
         self._note = note
-        self._logger.info(
+        _log.info(
             f"Note created via command at ({self._position.x():.1f}, {self._position.y():.1f})"
         )
 
@@ -64,7 +120,7 @@ class CreateNoteCommand(Command):
         # Remove from scene
         if self._note.scene():
             self._note.scene().removeItem(self._note)
-        self._logger.info("CreateNoteCommand undone: note removed")
+        _log.info("CreateNoteCommand undone: note removed")
 
     def redo(self) -> None:
         # Re-create note with same payload
@@ -72,6 +128,8 @@ class CreateNoteCommand(Command):
 
 
 class MoveNoteCommand(Command):
+    __slots__ = ("_dx", "_dy", "_note", "_start", "_timestamp")
+
     def __init__(
         self,
         note: NoteItem,
@@ -80,60 +138,139 @@ class MoveNoteCommand(Command):
         description: str = "Move note",
     ) -> None:
         super().__init__(description=description)
-        self._logger = get_logger(__name__)
         self._note = note
-        self._old_pos = QPointF(old_pos)
-        self._new_pos = QPointF(new_pos)
+        # Keep the starting point and the offset as plain floats
+        self._start = point_to_tuple(old_pos)
+        self._dx = new_pos.x() - self._start[0]
+        self._dy = new_pos.y() - self._start[1]
         self.payload = {
             "note_id": getattr(note, "_note_id", id(note)),
-            "old_pos": point_to_tuple(self._old_pos),
-            "new_pos": point_to_tuple(self._new_pos),
+            "start": self._start,
+            "delta": (self._dx, self._dy),
         }
+        self._timestamp = time.monotonic()
 
     def execute(self) -> None:
-        self._note.setPos(self._new_pos)
-        self._logger.debug(
-            f"MoveNoteCommand execute: ({self._old_pos.x():.1f},{self._old_pos.y():.1f}) -> ({self._new_pos.x():.1f},{self._new_pos.y():.1f})"
-        )
+        x, y = self._start
+        self._note.setPos(x + self._dx, y + self._dy)
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug(
+                f"MoveNoteCommand execute: ({x:.1f},{y:.1f}) -> ({x + self._dx:.1f},{y + self._dy:.1f})"
+            )
 
     def undo(self) -> None:
-        self._note.setPos(self._old_pos)
-        self._logger.debug(
-            f"MoveNoteCommand undo: revert to ({self._old_pos.x():.1f},{self._old_pos.y():.1f})"
-        )
+        x, y = self._start
+        self._note.setPos(x, y)
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug(f"MoveNoteCommand undo: revert to ({x:.1f},{y:.1f})")
+
+    def try_merge(self, other: Command) -> bool:
+        """Merge a quick follow-up move of the same note into this one."""
+        if (
+            not isinstance(other, MoveNoteCommand)
+            or other._note is not self._note
+            or other._timestamp - self._timestamp > MERGE_WINDOW
+        ):
+            return False
+        # Keep our start point and take over the newer end point
+        x, y = self._start
+        other_x, other_y = other._start
+        self._dx = other_x + other._dx - x
+        self._dy = other_y + other._dy - y
+        self._timestamp = other._timestamp
+        self.payload["delta"] = (self._dx, self._dy)
+        return True
+
+
+def _text_edit(old_text: str, new_text: str) -> tuple[int, str, str]:
+    """Return (position, removed, inserted) turning ``old_text`` into ``new_text``."""
+    limit = min(len(old_text), len(new_text))
+    prefix = 0
+    while prefix < limit and old_text[prefix] == new_text[prefix]:
+        prefix += 1
+    suffix = 0
+    while (
+        suffix < limit - prefix
+        and old_text[len(old_text) - 1 - suffix] == new_text[len(new_text) - 1 - suffix]
+    ):
+        suffix += 1
+    return (
+        prefix,
+        old_text[prefix : len(old_text) - suffix],
+        new_text[prefix : len(new_text) - suffix],
+    )
 
 
 class UpdateNoteTextCommand(Command):
+    __slots__ = ("_inserted", "_new_text", "_note", "_pos", "_removed", "_timestamp")
+
     def __init__(self, note: NoteItem, old_text: str, new_text: str) -> None:
         super().__init__(description="Update note text")
-        self._logger = get_logger(__name__)
         self._note = note
-        self._old_text = old_text
+        self._record_edit(old_text, new_text)
+        self._timestamp = time.monotonic()
+
+    def _record_edit(self, old_text: str, new_text: str) -> None:
+        """Keep the new text and only the span needed to rebuild the old one."""
         self._new_text = new_text
+        self._pos, self._removed, self._inserted = _text_edit(old_text, new_text)
         self.payload = {
-            "note_id": getattr(note, "_note_id", id(note)),
-            "old_text": old_text,
+            "note_id": getattr(self._note, "_note_id", id(self._note)),
             "new_text": new_text,
+            "pos": self._pos,
+            "removed": self._removed,
+            "inserted": self._inserted,
         }
 
+    def _old_text(self) -> str:
+        """Rebuild the text before the edit from the new text and the span."""
+        new_text = self._new_text
+        return (
+            new_text[: self._pos]
+            + self._removed
+            + new_text[self._pos + len(self._inserted) :]
+        )
+
     def execute(self) -> None:
         self._note.set_text(self._new_text)
-        self._logger.debug("UpdateNoteTextCommand execute")
+        _log.debug("UpdateNoteTextCommand execute")
 
     def undo(self) -> None:
-        self._note.set_text(self._old_text)
-        self._logger.debug("UpdateNoteTextCommand undo")
+        self._note.set_text(self._old_text())
+        _log.debug("UpdateNoteTextCommand undo")
+
+    def try_merge(self, other: Command) -> bool:
+        """Merge a quick follow-up text edit of the same note into this one."""
+        if (
+            not isinstance(other, UpdateNoteTextCommand)
+            or other._note is not self._note
+            or other._timestamp - self._timestamp > MERGE_WINDOW
+        ):
+            return False
+        # Span from our original text straight to the follow-up's result
+        self._record_edit(self._old_text(), other._new_text)
+        self._timestamp = other._timestamp
+        return True
 
 
 class UpdateNoteStyleCommand(Command):
+    __slots__ = ("_new_style", "_note", "_old_style")
+
     def __init__(
         self, note: NoteItem, old_style: dict[str, Any], new_style: dict[str, Any]
     ) -> None:
         super().__init__(description="Update note style")
-        self._logger = get_logger(__name__)
         self._note = note
-        self._old_style = old_style.copy()
-        self._new_style = new_style.copy()
+        # Only keys whose value actually changes need to be replayed
+        changed = [
+            key
+            for key, value in new_style.items()
+            if key not in old_style or old_style[key] != value
+        ]
+        self._old_style = _intern_style(
+            {key: old_style[key] for key in changed if key in old_style}
+        )
+        self._new_style = _intern_style({key: new_style[key] for key in changed})
         self.payload = {
             "note_id": getattr(note, "_note_id", id(note)),
             "old_style": self._old_style,
@@ -142,8 +279,8 @@ class UpdateNoteStyleCommand(Command):
 
     def execute(self) -> None:
         self._note.set_style(self._new_style)
-        self._logger.debug("UpdateNoteStyleCommand execute")
+        _log.debug("UpdateNoteStyleCommand execute")
 
     def undo(self) -> None:
         self._note.set_style(self._old_style)
-        self._logger.debug("UpdateNoteStyleCommand undo")
+        _log.debug("UpdateNoteStyleCommand undo")
@@ -6,11 +6,16 @@ Provides a QObject-backed stack with signals for UI enablement.
 
 from __future__ import annotations
 
+from collections import deque
+
 from PyQt6.QtCore import QObject, pyqtSignal
 
 from ..utils.logging_config import get_logger
 from .base import Command
 
+# Default number of commands kept for undo; older ones are discarded
+MAX_UNDO = 200
+
 
 class UndoRedoStack(QObject):
     """Manage command history and provide undo/redo operations."""
@@ -19,11 +24,15 @@ class UndoRedoStack(QObject):
     can_undo_changed = pyqtSignal(bool)
     can_redo_changed = pyqtSignal(bool)
 
-    def __init__(self):
+    def __init__(self, max_depth: int = MAX_UNDO):
         super().__init__()
         self._logger = get_logger(__name__)
-        self._undo_stack: list[Command] = []
-        self._redo_stack: list[Command] = []
+        # Bounded deques drop the oldest command once the limit is reached
+        self._undo_stack: deque[Command] = deque(maxlen=max_depth)
+        self._redo_stack: deque[Command] = deque(maxlen=max_depth)
+        # Last availability reported, so listeners only hear about flips
+        self._last_can_undo = False
+        self._last_can_redo = False
 
     def push_and_execute(self, command: Command) -> None:
         try:
@@ -31,6 +40,18 @@ class UndoRedoStack(QObject):
                 f"Executing command: {type(command).__name__} - {command.description}"
             )
             command.execute()
+            # Fold rapid follow-ups (e.g. repeated moves of one note) into the
+            # previous command so a single undo reverts the whole gesture
+            if (
+                not self._redo_stack
+                and self._undo_stack
+                and self._undo_stack[-1].try_merge(command)
+            ):
+                self._emit_signals()
+                self._logger.debug(
+                    f"Command merged into previous: {type(command).__name__}"
+                )
+                return
             self._undo_stack.append(command)
             self._redo_stack.clear()
             self._emit_signals()
@@ -72,19 +93,40 @@ class UndoRedoStack(QObject):
         except Exception as e:
             self._logger.error(f"Failed to redo command: {e}")
 
+    def set_history_limit(self, max_depth: int) -> None:
+        """
+        Change how many commands are kept for undo and redo.
+
+        The most recent commands are retained when the limit shrinks.
+
+        Args:
+            max_depth: Maximum number of commands per stack
+        """
+        self._undo_stack = deque(self._undo_stack, maxlen=max_depth)
+        self._redo_stack = deque(self._redo_stack, maxlen=max_depth)
+        self._emit_signals()
+
     def clear(self) -> None:
+        if not self._undo_stack and not self._redo_stack:
+            return
         self._undo_stack.clear()
         self._redo_stack.clear()
         self._emit_signals()
         self._logger.debug("Undo/Redo stack cleared")
 
     def can_undo(self) -> bool:
-        return len(self._undo_stack) > 0
+        return bool(self._undo_stack)
 
     def can_redo(self) -> bool:
-        return len(self._redo_stack) > 0
+        return bool(self._redo_stack)
 
     def _emit_signals(self) -> None:
         self.stack_changed.emit()
-        self.can_undo_changed.emit(self.can_undo())
-        self.can_redo_changed.emit(self.can_redo())
+        can_undo = self.can_undo()
+        if can_undo != self._last_can_undo:
+            self._last_can_undo = can_undo
+            self.can_undo_changed.emit(can_undo)
+        can_redo = self.can_redo()
+        if can_redo != self._last_can_redo:
+            self._last_can_redo = can_redo
+            self.can_redo_changed.emit(can_redo)
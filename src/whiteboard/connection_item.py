@@ -5,10 +5,15 @@ This module contains the ConnectionItem class which represents visual connection
 between items on the whiteboard canvas with arrow rendering and dynamic updates.
 """
 
+import logging
 import math
+import weakref
+from collections.abc import Iterator
+from dataclasses import dataclass, field, fields
 from typing import Any, Protocol
-from PyQt6.QtCore import Qt, QPointF, QRectF, pyqtSignal, QObject
+from PyQt6.QtCore import Qt, QPointF, QRectF, QTimer, pyqtSignal, QObject
 from PyQt6.QtGui import (
+    QAction,
     QPainter,
     QPen,
     QBrush,
@@ -45,6 +50,10 @@ class ConnectionEndpoint(Protocol):
         ...
 
 
+# Endpoint id accessors tried in order, with the prefix used in connection data
+_ITEM_ID_GETTERS = (("get_note_id", "note"), ("get_image_id", "image"))
+
+
 class ConnectionSignals(QObject):
     """Signal emitter for ConnectionItem."""
 
@@ -52,6 +61,29 @@ class ConnectionSignals(QObject):
     style_changed = pyqtSignal(dict)
 
 
+@dataclass(slots=True)
+class ConnectionStyle:
+    """Styling of a connection, slotted for cheap attribute access while painting."""
+
+    line_color: QColor = field(default_factory=lambda: QColor(100, 100, 100))
+    line_width: int = 2
+    arrow_size: int = 12
+    arrow_angle: int = 30  # degrees
+    line_style: Qt.PenStyle = Qt.PenStyle.SolidLine
+    show_arrow: bool = True
+    curve_factor: float = 0.0  # 0 = straight line, >0 = curved
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the style as a plain dictionary keyed by property name."""
+        return {key: getattr(self, key) for key in _STYLE_KEYS}
+
+
+_STYLE_KEYS = tuple(style_field.name for style_field in fields(ConnectionStyle))
+
+# Style keys that only change the pen, not the path geometry
+_PEN_STYLE_KEYS = frozenset({"line_color", "line_width", "line_style"})
+
+
 class ConnectionItem(QGraphicsPathItem):
     """
     Connection line/arrow between two items.
@@ -85,8 +117,13 @@ class ConnectionItem(QGraphicsPathItem):
         super().__init__()
         self.logger = get_logger(__name__)
 
-        # Signal emitter
-        self.signals = ConnectionSignals()
+        # Signal emitter, created on first access since many connections
+        # never get external listeners
+        self._signals: ConnectionSignals | None = None
+
+        # Coalesces endpoint move/style signals into one path update per
+        # event loop turn; created on the first queued update
+        self._path_update_timer: QTimer | None = None
 
         # Connection properties
         self._connection_id = id(self)
@@ -98,20 +135,45 @@ class ConnectionItem(QGraphicsPathItem):
         self._end_point = QPointF()
 
         # Default styling
-        self._style = {
-            "line_color": QColor(100, 100, 100),  # Dark gray
-            "line_width": 2,
-            "arrow_size": 12,
-            "arrow_angle": 30,  # degrees
-            "line_style": Qt.PenStyle.SolidLine,
-            "show_arrow": True,
-            "curve_factor": 0.0,  # 0 = straight line, >0 = curved
-        }
+        self._style = ConnectionStyle()
+
+        # Values derived from the style, refreshed by set_style/_update_pen_style
+        self._update_arrow_angle()
+        self._base_pen = QPen()
+        self._selected_pen: QPen | None = None
+
+        # Arrow head polygon and the geometry/style it was built for
+        self._arrow_cache_key: tuple | None = None
+        self._arrow_polygon: QPolygonF | None = None
+
+        # Connection points per endpoint, keyed by the endpoint's scene outline
+        self._start_cp_cache: tuple[QPolygonF, list[QPointF]] | None = None
+        self._end_cp_cache: tuple[QPolygonF, list[QPointF]] | None = None
+        self._closest_pair: tuple[QPointF, QPointF] | None = None
+
+        # Canvas view found through the scene, held weakly
+        self._canvas_ref: weakref.ref | None = None
+
+        # Context menu, built on first right-click
+        self._context_menu: QMenu | None = None
+        self._show_arrow_action: QAction | None = None
+
+        # Line without arrow head, drawn by paint()
+        self._line_path = QPainterPath()
+
+        # Style the current path was built with, to skip no-op updates
+        self._style_fp: tuple | None = None
+
+        # Bounds and hit-test shape, rebuilt lazily after the path changes
+        self._cached_bounding_rect: QRectF | None = None
+        self._cached_shape: QPainterPath | None = None
 
         # Setup connection
         self._setup_connection()
 
-        # Connect to item position/style changes
+        # Connect to item position/style changes, keeping the connection
+        # handles so they can be released without looking the slots up again
+        self._signal_tokens: list[tuple[Any, Any]] = []
         self._connect_item_signals()
 
         # Set helpful tooltip
@@ -126,6 +188,13 @@ class ConnectionItem(QGraphicsPathItem):
             f"{start_id} and {end_id}"
         )
 
+    @property
+    def signals(self) -> ConnectionSignals:
+        """Signal emitter for this connection, created on first access."""
+        if self._signals is None:
+            self._signals = ConnectionSignals()
+        return self._signals
+
     def _get_item_id(self, item: ConnectionEndpoint) -> str:
         """
         Get a string identifier for an item using duck typing.
@@ -136,13 +205,13 @@ class ConnectionItem(QGraphicsPathItem):
         Returns:
             String identifier for the item
         """
-        # Try different methods to get an ID, falling back to object id
-        if hasattr(item, "get_note_id"):
-            return f"note_{item.get_note_id()}"
-        elif hasattr(item, "get_image_id"):
-            return f"image_{item.get_image_id()}"
-        else:
-            return f"item_{id(item)}"
+        # Try different methods to get an ID, falling back to object id.
+        # Not memoized: note/image ids are reassigned when items are restored.
+        for getter_name, prefix in _ITEM_ID_GETTERS:
+            getter = getattr(item, getter_name, None)
+            if getter is not None:
+                return f"{prefix}_{getter()}"
+        return f"item_{id(item)}"
 
     def _setup_connection(self) -> None:
         """Configure the connection item properties."""
@@ -153,76 +222,84 @@ class ConnectionItem(QGraphicsPathItem):
         # Set Z-value to render behind items
         self.setZValue(-1)
 
+        # Blit the rendered line from a pixmap until the path or style changes
+        self.setCacheMode(QGraphicsPathItem.CacheMode.DeviceCoordinateCache)
+
         # Calculate initial path
         self.update_path()
 
+    def _endpoint_signals(self) -> Iterator[tuple[str, str, str, Any, Any]]:
+        """
+        Yield every endpoint signal this connection listens to.
+
+        Covers both signals defined directly on the item (NoteItem pattern) and
+        signals exposed via a nested QObject, e.g., ImageItem.signals. Holders
+        that announce bounds changes through geometry_changed are not followed
+        on style_changed, since pure restyles do not move the anchors.
+
+        Yields:
+            Tuples of (endpoint label, holder kind, signal name, signal, slot)
+        """
+        slots = (
+            ("position_changed", self.schedule_update_path),
+            ("style_changed", self.schedule_update_path),
+            ("geometry_changed", self.schedule_update_path),
+            ("content_changed", self._on_endpoint_content_changed),
+        )
+        for item, label in (
+            (self._start_item, "start_item"),
+            (self._end_item, "end_item"),
+        ):
+            for kind, holder in (
+                ("direct", item),
+                ("nested", getattr(item, "signals", None)),
+            ):
+                if holder is None:
+                    continue
+                tracks_geometry = hasattr(holder, "geometry_changed")
+                for name, slot in slots:
+                    if name == "style_changed" and tracks_geometry:
+                        continue
+                    signal = getattr(holder, name, None)
+                    if signal is not None:
+                        yield label, kind, name, signal, slot
+
     def _connect_item_signals(self) -> None:
         """Connect to item position/style change signals for dynamic updates."""
-
-        # Helper to connect either direct signals or nested 'signals'
-        def _connect_signals_for(item: ConnectionEndpoint, label: str) -> None:
-            # Direct signals on the item (NoteItem pattern)
-            if hasattr(item, "position_changed"):
-                try:
-                    item.position_changed.connect(self.update_path)
-                    self.logger.debug(f"Connected direct position_changed for {label}")
-                except Exception as e:
-                    self.logger.debug(
-                        f"Failed connecting direct position_changed for {label}: {e}"
-                    )
-            if hasattr(item, "style_changed"):
-                try:
-                    item.style_changed.connect(self.update_path)
-                    self.logger.debug(f"Connected direct style_changed for {label}")
-                except Exception as e:
-                    self.logger.debug(
-                        f"Failed connecting direct style_changed for {label}: {e}"
-                    )
-            if hasattr(item, "content_changed"):
-                try:
-                    item.content_changed.connect(self._on_endpoint_content_changed)
-                    self.logger.debug(f"Connected direct content_changed for {label}")
-                except Exception as e:
+        dbg = self.logger.isEnabledFor(logging.DEBUG)
+        for label, kind, name, signal, slot in self._endpoint_signals():
+            try:
+                self._signal_tokens.append((signal, signal.connect(slot)))
+                if dbg:
+                    self.logger.debug(f"Connected {kind} {name} for {label}")
+            except Exception as e:
+                if dbg:
                     self.logger.debug(
-                        f"Failed connecting direct content_changed for {label}: {e}"
+                        f"Failed connecting {kind} {name} for {label}: {e}"
                     )
 
-            # Signals exposed via a nested QObject, e.g., ImageItem.signals
-            nested = getattr(item, "signals", None)
-            if nested is not None:
-                if hasattr(nested, "position_changed"):
-                    try:
-                        nested.position_changed.connect(self.update_path)
-                        self.logger.debug(
-                            f"Connected nested position_changed for {label}"
-                        )
-                    except Exception as e:
-                        self.logger.debug(
-                            f"Failed connecting nested position_changed for {label}: {e}"
-                        )
-                if hasattr(nested, "style_changed"):
-                    try:
-                        nested.style_changed.connect(self.update_path)
-                        self.logger.debug(f"Connected nested style_changed for {label}")
-                    except Exception as e:
-                        self.logger.debug(
-                            f"Failed connecting nested style_changed for {label}: {e}"
-                        )
-                if hasattr(nested, "content_changed"):
-                    try:
-                        nested.content_changed.connect(
-                            self._on_endpoint_content_changed
-                        )
-                        self.logger.debug(
-                            f"Connected nested content_changed for {label}"
-                        )
-                    except Exception as e:
-                        self.logger.debug(
-                            f"Failed connecting nested content_changed for {label}: {e}"
-                        )
-
-        _connect_signals_for(self._start_item, "start_item")
-        _connect_signals_for(self._end_item, "end_item")
+    def schedule_update_path(self) -> None:
+        """
+        Queue a path update for the next event loop turn.
+
+        Endpoint signals connect here so that a group drag or undo that moves
+        both endpoints several times only recomputes the path once.
+        """
+        timer = self._path_update_timer
+        if timer is None:
+            timer = self._path_update_timer = QTimer()
+            timer.setSingleShot(True)
+            timer.setInterval(0)
+            timer.timeout.connect(self._flush_path_update)
+        if not timer.isActive():
+            timer.start()
+
+    def _flush_path_update(self) -> None:
+        """Run a queued path update, tolerating items destroyed in the meantime."""
+        try:
+            self.update_path()
+        except RuntimeError as e:
+            self.logger.debug(f"Skipped queued path update: {e}")
 
     def _on_endpoint_content_changed(self, _text_or_payload: Any) -> None:
         """Handle content changes on endpoints to recompute path when their bounds change."""
@@ -230,81 +307,42 @@ class ConnectionItem(QGraphicsPathItem):
             self.logger.debug(
                 f"Endpoint content changed; recomputing connection path for {self._connection_id}"
             )
+            self._start_cp_cache = None
+            self._end_cp_cache = None
             self.update_path()
         except Exception as e:
             self.logger.error(f"Error updating path on endpoint content change: {e}")
 
     def delete_connection(self) -> None:
         """Delete this connection from the scene."""
-        # Disconnect from item signals
+        # Disconnect from item signals and drop any queued path update
         self._disconnect_item_signals()
+        if self._path_update_timer is not None:
+            self._path_update_timer.stop()
 
         # Remove from scene
         if self.scene():
             self.scene().removeItem(self)
 
         # Emit deletion signal
-        self.signals.connection_deleted.emit()
+        if self._signals is not None:
+            self._signals.connection_deleted.emit()
 
         self.logger.debug(f"Deleted connection {self._connection_id}")
 
     def _disconnect_item_signals(self) -> None:
         """Disconnect from item position/style change signals (both direct and nested)."""
-
-        def _disconnect_for(item: ConnectionEndpoint, label: str) -> None:
-            try:
-                if hasattr(item, "position_changed"):
-                    item.position_changed.disconnect(self.update_path)
-                    self.logger.debug(
-                        f"Disconnected direct position_changed for {label}"
-                    )
-            except TypeError:
-                pass
-            except Exception as e:
-                self.logger.debug(
-                    f"Failed disconnecting direct position_changed for {label}: {e}"
-                )
-
+        tokens, self._signal_tokens = self._signal_tokens, []
+        for signal, token in tokens:
             try:
-                if hasattr(item, "style_changed"):
-                    item.style_changed.disconnect(self.update_path)
-                    self.logger.debug(f"Disconnected direct style_changed for {label}")
-            except TypeError:
+                signal.disconnect(token)
+            except (TypeError, RuntimeError):
+                # Already disconnected, or the endpoint has been destroyed
                 pass
-            except Exception as e:
-                self.logger.debug(
-                    f"Failed disconnecting direct style_changed for {label}: {e}"
-                )
-
-            nested = getattr(item, "signals", None)
-            if nested is not None:
-                try:
-                    if hasattr(nested, "position_changed"):
-                        nested.position_changed.disconnect(self.update_path)
-                        self.logger.debug(
-                            f"Disconnected nested position_changed for {label}"
-                        )
-                except TypeError:
-                    pass
-                except Exception as e:
-                    self.logger.debug(
-                        f"Failed disconnecting nested position_changed for {label}: {e}"
-                    )
-                try:
-                    if hasattr(nested, "style_changed"):
-                        nested.style_changed.disconnect(self.update_path)
-                        self.logger.debug(
-                            f"Disconnected nested style_changed for {label}"
-                        )
-                except TypeError:
-                    pass
-                except Exception as e:
-                    self.logger.debug(
-                        f"Failed disconnecting nested style_changed for {label}: {e}"
-                    )
-
-        _disconnect_for(self._start_item, "start_item")
-        _disconnect_for(self._end_item, "end_item")
+        if tokens and self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                f"Disconnected {len(tokens)} endpoint signals for connection {self._connection_id}"
+            )
 
     def update_path(self) -> None:
         """
@@ -316,11 +354,22 @@ class ConnectionItem(QGraphicsPathItem):
         # Get optimal connection points
         start_point, end_point = self._calculate_connection_points()
 
+        # Nothing to rebuild if neither the endpoints nor the style changed
+        style_fp = self._style_fingerprint()
+        if (
+            style_fp == self._style_fp
+            and start_point == self._start_point
+            and end_point == self._end_point
+        ):
+            return
+        self._style_fp = style_fp
+
         self._start_point = start_point
         self._end_point = end_point
 
-        # Create the path
-        path = self._create_connection_path(start_point, end_point)
+        # Create the path; the bare line is kept for paint()
+        self._line_path = self._create_line_path_only(start_point, end_point)
+        path = self._create_connection_path(start_point, end_point, self._line_path)
 
         # Prepare geometry change to ensure correct invalidation region and avoid trails
         try:
@@ -330,52 +379,117 @@ class ConnectionItem(QGraphicsPathItem):
 
         # Set the path
         self.setPath(path)
+        self._cached_bounding_rect = None
+        self._cached_shape = None
 
         # Update pen style
         self._update_pen_style()
 
         # Debug bounding rect after update
-        br = self.boundingRect()
-        self.logger.debug(f"ConnectionItem boundingRect after update: {br}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                f"ConnectionItem boundingRect after update: {self.boundingRect()}"
+            )
 
-    def _calculate_connection_points(self) -> tuple[QPointF, QPointF]:
+        # Invalidate the cached pixmap
+        self.update()
+
+    def _style_fingerprint(self) -> tuple:
         """
-        Calculate the optimal connection points on the item boundaries.
+        Return a hashable snapshot of the style values that shape the path.
 
         Returns:
-            Tuple of (start_point, end_point) in scene coordinates
+            Tuple of style values with the line color reduced to its RGBA value
         """
-        # Get item centers in scene coordinates as fallback
-        start_center = self._start_item.mapToScene(
-            self._start_item.boundingRect().center()
+        style = self._style
+        return (
+            style.line_color.rgba(),
+            style.line_width,
+            style.line_style,
+            style.curve_factor,
+            style.show_arrow,
+            style.arrow_size,
+            style.arrow_angle,
         )
-        end_center = self._end_item.mapToScene(self._end_item.boundingRect().center())
 
-        # Get all possible connection points for each item
-        start_points = self._start_item.get_connection_points()
-        end_points = self._end_item.get_connection_points()
+    @staticmethod
+    def _cached_connection_points(
+        item: ConnectionEndpoint, cache: tuple[QPolygonF, list[QPointF]] | None
+    ) -> tuple[QPolygonF, list[QPointF]]:
+        """
+        Return an endpoint's connection points, reusing them while it is unchanged.
 
-        # Find the closest pair of connection points
-        min_distance = float("inf")
-        best_start = start_points[0] if start_points else start_center
-        best_end = end_points[0] if end_points else end_center
+        The item's bounding rect mapped to the scene captures its position,
+        size and transform, so the points are rebuilt only when one changes.
 
-        for start_point in start_points:
-            for end_point in end_points:
-                # Calculate distance between points
-                dx = end_point.x() - start_point.x()
-                dy = end_point.y() - start_point.y()
-                distance = math.sqrt(dx * dx + dy * dy)
+        Args:
+            item: Endpoint item
+            cache: Previously returned (scene outline, points) pair, if any
 
-                if distance < min_distance:
-                    min_distance = distance
-                    best_start = start_point
-                    best_end = end_point
+        Returns:
+            Tuple of (scene outline, connection points in scene coordinates)
+        """
+        outline = item.mapToScene(item.boundingRect())
+        if cache is not None and cache[0] == outline:
+            return cache
+        return outline, item.get_connection_points()
+
+    def _calculate_connection_points(self) -> tuple[QPointF, QPointF]:
+        """
+        Calculate the optimal connection points on the item boundaries.
+
+        Returns:
+            Tuple of (start_point, end_point) in scene coordinates
+        """
+        # Get all possible connection points for each item
+        start_cache = self._cached_connection_points(
+            self._start_item, self._start_cp_cache
+        )
+        end_cache = self._cached_connection_points(self._end_item, self._end_cp_cache)
+
+        # Neither endpoint changed: the previous closest pair still holds
+        if (
+            self._closest_pair is not None
+            and start_cache is self._start_cp_cache
+            and end_cache is self._end_cp_cache
+        ):
+            return self._closest_pair
+
+        self._start_cp_cache = start_cache
+        self._end_cp_cache = end_cache
+        start_points = self._start_cp_cache[1]
+        end_points = self._end_cp_cache[1]
+
+        # Fall back to item centers in scene coordinates
+        if not start_points:
+            start_points = [
+                self._start_item.mapToScene(self._start_item.boundingRect().center())
+            ]
+        if not end_points:
+            end_points = [
+                self._end_item.mapToScene(self._end_item.boundingRect().center())
+            ]
+
+        # Find the closest pair; squared distance keeps the same ordering
+        start_coords = [(p.x(), p.y(), p) for p in start_points]
+        end_coords = [(p.x(), p.y(), p) for p in end_points]
+        _, best_start, best_end = min(
+            (
+                ((ex - sx) * (ex - sx) + (ey - sy) * (ey - sy), start, end)
+                for sx, sy, start in start_coords
+                for ex, ey, end in end_coords
+            ),
+            key=lambda candidate: candidate[0],
+        )
 
-        return best_start, best_end
+        self._closest_pair = (best_start, best_end)
+        return self._closest_pair
 
     def _create_connection_path(
-        self, start_point: QPointF, end_point: QPointF
+        self,
+        start_point: QPointF,
+        end_point: QPointF,
+        line_path: QPainterPath | None = None,
     ) -> QPainterPath:
         """
         Create the visual path for the connection.
@@ -383,25 +497,23 @@ class ConnectionItem(QGraphicsPathItem):
         Args:
             start_point: Starting point of the connection
             end_point: Ending point of the connection
+            line_path: Already built line between the points, if available
 
         Returns:
             QPainterPath representing the connection line and arrow
         """
-        path = QPainterPath()
-
         # Create the main line
-        if self._style["curve_factor"] > 0:
-            # Create curved line
-            path = self._create_curved_path(start_point, end_point)
+        if line_path is None:
+            path = self._create_line_path_only(start_point, end_point)
         else:
-            # Create straight line
-            path.moveTo(start_point)
-            path.lineTo(end_point)
+            path = QPainterPath(line_path)
 
-        # Add arrow head if enabled
-        if self._style["show_arrow"]:
-            arrow_path = self._create_arrow_head(start_point, end_point)
-            path.addPath(arrow_path)
+        # Add arrow head if enabled, straight into the path rather than via
+        # an intermediate arrow path
+        if self._style.show_arrow:
+            arrow_polygon = self._get_arrow_polygon(start_point, end_point)
+            if arrow_polygon is not None:
+                path.addPolygon(arrow_polygon)
 
         return path
 
@@ -430,8 +542,8 @@ class ConnectionItem(QGraphicsPathItem):
         mid_y = start_point.y() + dy / 2
 
         # Perpendicular offset
-        perp_x = -dy * self._style["curve_factor"]
-        perp_y = dx * self._style["curve_factor"]
+        perp_x = -dy * self._style.curve_factor
+        perp_y = dx * self._style.curve_factor
 
         control1 = QPointF(mid_x + perp_x, mid_y + perp_y)
 
@@ -453,45 +565,77 @@ class ConnectionItem(QGraphicsPathItem):
         Returns:
             QPainterPath containing the arrow head
         """
-        # Calculate arrow direction
-        dx = end_point.x() - start_point.x()
-        dy = end_point.y() - start_point.y()
+        arrow_path = QPainterPath()
+        arrow_polygon = self._get_arrow_polygon(start_point, end_point)
+        if arrow_polygon is not None:
+            arrow_path.addPolygon(arrow_polygon)
 
-        # Handle zero-length line
-        if dx == 0 and dy == 0:
-            return QPainterPath()
+        return arrow_path
 
-        # Calculate angle of the line
-        angle = math.atan2(dy, dx)
+    def _get_arrow_polygon(
+        self, start_point: QPointF, end_point: QPointF
+    ) -> QPolygonF | None:
+        """
+        Return the arrow head polygon, rebuilding it only when geometry or style change.
 
-        # Arrow parameters
-        arrow_size = self._style["arrow_size"]
-        arrow_angle_rad = math.radians(self._style["arrow_angle"])
+        Args:
+            start_point: Starting point (for direction calculation)
+            end_point: Ending point where arrow should be drawn
 
-        # Calculate arrow head points
-        arrow_point1 = QPointF(
-            end_point.x() - arrow_size * math.cos(angle - arrow_angle_rad),
-            end_point.y() - arrow_size * math.sin(angle - arrow_angle_rad),
-        )
+        Returns:
+            Arrow head polygon, or None for a zero-length line
+        """
+        end_x = end_point.x()
+        end_y = end_point.y()
+        dx = end_x - start_point.x()
+        dy = end_y - start_point.y()
+        arrow_size = self._style.arrow_size
+        arrow_angle = self._style.arrow_angle
 
-        arrow_point2 = QPointF(
-            end_point.x() - arrow_size * math.cos(angle + arrow_angle_rad),
-            end_point.y() - arrow_size * math.sin(angle + arrow_angle_rad),
-        )
+        key = (end_x, end_y, dx, dy, arrow_size, arrow_angle)
+        if key == self._arrow_cache_key:
+            return self._arrow_polygon
 
-        # Create arrow head path
-        arrow_path = QPainterPath()
-        arrow_polygon = QPolygonF([end_point, arrow_point1, arrow_point2])
-        arrow_path.addPolygon(arrow_polygon)
+        # Handle zero-length line
+        if dx == 0 and dy == 0:
+            polygon = None
+        else:
+            # Line direction as a unit vector, i.e. (cos, sin) of its angle
+            length = math.hypot(dx, dy)
+            cos_line = dx / length
+            sin_line = dy / length
+            cos_arrow = self._cos_arrow_angle
+            sin_arrow = self._sin_arrow_angle
+
+            # Rotate the direction by -/+ arrow_angle via the addition identities
+            along = arrow_size * cos_arrow
+            across = arrow_size * sin_arrow
+            arrow_point1 = QPointF(
+                end_x - (along * cos_line + across * sin_line),
+                end_y - (along * sin_line - across * cos_line),
+            )
+            arrow_point2 = QPointF(
+                end_x - (along * cos_line - across * sin_line),
+                end_y - (along * sin_line + across * cos_line),
+            )
+            polygon = QPolygonF([QPointF(end_point), arrow_point1, arrow_point2])
 
-        return arrow_path
+        self._arrow_cache_key = key
+        self._arrow_polygon = polygon
+        return polygon
+
+    def _update_arrow_angle(self) -> None:
+        """Refresh the arrow angle in radians and its cosine and sine."""
+        self._arrow_angle_rad = math.radians(self._style.arrow_angle)
+        self._cos_arrow_angle = math.cos(self._arrow_angle_rad)
+        self._sin_arrow_angle = math.sin(self._arrow_angle_rad)
 
     def _update_pen_style(self) -> None:
         """Update the pen style based on current styling options."""
         pen = QPen(
-            self._style["line_color"],
-            self._style["line_width"],
-            self._style["line_style"],
+            self._style.line_color,
+            self._style.line_width,
+            self._style.line_style,
         )
 
         # Enable antialiasing for smooth lines
@@ -499,6 +643,22 @@ class ConnectionItem(QGraphicsPathItem):
         pen.setJoinStyle(Qt.PenJoinStyle.RoundJoin)
 
         self.setPen(pen)
+        self._base_pen = pen
+        self._selected_pen = None
+
+    def _get_selected_pen(self) -> QPen:
+        """
+        Return the highlight pen for a selected connection, building it once per style.
+
+        Returns:
+            Lighter, slightly wider copy of the base pen
+        """
+        if self._selected_pen is None:
+            pen = QPen(self._base_pen)
+            pen.setColor(self._style.line_color.lighter(150))
+            pen.setWidth(self._style.line_width + 1)
+            self._selected_pen = pen
+        return self._selected_pen
 
     def paint(
         self, painter: QPainter, option: QStyleOptionGraphicsItem, widget: QWidget
@@ -511,33 +671,33 @@ class ConnectionItem(QGraphicsPathItem):
             option: Style options
             widget: Widget being painted on
         """
-        # Enable antialiasing for smooth lines
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
-
-        # Get current pen and modify if selected
-        pen = self.pen()
-        line_color = self._style["line_color"]
-
-        if self.isSelected():
+        selected = self.isSelected()
+        if selected:
             # Highlight selected connections
-            line_color = line_color.lighter(150)
-            pen.setColor(line_color)
-            pen.setWidth(self._style["line_width"] + 1)
+            pen = self._get_selected_pen()
+            line_color = pen.color()
         else:
-            pen.setColor(line_color)
+            pen = self._base_pen
+            line_color = self._style.line_color
 
         painter.setPen(pen)
-
-        # Draw the line part (without arrow head)
-        line_path = self._create_line_path_only(self._start_point, self._end_point)
-        painter.drawPath(line_path)
+        # The view does not save painter state between items, so clear any
+        # brush left over that would fill the area under a curved line
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+
+        # Draw the line part (without arrow head); straight lines skip the
+        # path rasterizer, curves use the path built by update_path
+        if self._style.curve_factor > 0:
+            painter.drawPath(self._line_path)
+        else:
+            painter.drawLine(self._start_point, self._end_point)
 
         # Draw filled arrow head if enabled
-        if self._style["show_arrow"]:
+        if self._style.show_arrow:
             self._draw_filled_arrow_head(painter, line_color)
 
         # Draw selection indicators if selected
-        if self.isSelected():
+        if selected:
             self._draw_selection_indicators(painter)
 
     def _create_line_path_only(
@@ -556,7 +716,7 @@ class ConnectionItem(QGraphicsPathItem):
         path = QPainterPath()
 
         # Create the main line
-        if self._style["curve_factor"] > 0:
+        if self._style.curve_factor > 0:
             # Create curved line
             path = self._create_curved_path(start_point, end_point)
         else:
@@ -574,44 +734,20 @@ class ConnectionItem(QGraphicsPathItem):
             painter: QPainter for drawing
             color: Color to use for the arrow head
         """
-        # Calculate arrow direction
-        dx = self._end_point.x() - self._start_point.x()
-        dy = self._end_point.y() - self._start_point.y()
+        arrow_polygon = self._get_arrow_polygon(self._start_point, self._end_point)
 
         # Handle zero-length line
-        if dx == 0 and dy == 0:
+        if arrow_polygon is None:
             return
 
-        # Calculate angle of the line
-        angle = math.atan2(dy, dx)
-
-        # Arrow parameters
-        arrow_size = self._style["arrow_size"]
-        arrow_angle_rad = math.radians(self._style["arrow_angle"])
-
-        # Calculate arrow head points
-        arrow_point1 = QPointF(
-            self._end_point.x() - arrow_size * math.cos(angle - arrow_angle_rad),
-            self._end_point.y() - arrow_size * math.sin(angle - arrow_angle_rad),
-        )
-
-        arrow_point2 = QPointF(
-            self._end_point.x() - arrow_size * math.cos(angle + arrow_angle_rad),
-            self._end_point.y() - arrow_size * math.sin(angle + arrow_angle_rad),
-        )
-
-        # Create arrow head polygon
-        arrow_polygon = QPolygonF([self._end_point, arrow_point1, arrow_point2])
-
-        # Set up brush and pen for filled arrow
-        arrow_brush = QBrush(color)
-        arrow_pen = QPen(color, 1)  # Thin pen for clean edges
-
-        painter.setBrush(arrow_brush)
-        painter.setPen(arrow_pen)
+        # Solid fill with a thin 1px outline for clean edges; the QColor
+        # overloads build the brush and pen on the C++ side
+        painter.setBrush(color)
+        painter.setPen(color)
 
-        # Draw filled arrow head
-        painter.drawPolygon(arrow_polygon)
+        # Draw filled arrow head; a triangle is always convex, so skip the
+        # general polygon fill rules
+        painter.drawConvexPolygon(arrow_polygon)
 
     def _draw_selection_indicators(self, painter: QPainter) -> None:
         """
@@ -639,13 +775,34 @@ class ConnectionItem(QGraphicsPathItem):
         Args:
             event: Context menu event
         """
+        menu = self._context_menu
+        if menu is None:
+            self._build_context_menu()
+            menu = self._context_menu
+        self._show_arrow_action.setText(
+            "✅ Show Arrow" if self._style.show_arrow else "☑️ Show Arrow"
+        )
+
+        # Show menu at cursor position
+        menu.exec(event.screenPos())
+
+        # Accept the event to prevent propagation
+        event.accept()
+
+    def _build_context_menu(self) -> None:
+        """
+        Build the connection context menu once so right-clicks only have to show it.
+
+        Style presets carry their style dict as action data and are applied by
+        a single handler; only the arrow toggle label changes between shows.
+        """
         menu = QMenu()
 
         # Delete connection
         delete_action = menu.addAction("🗑️ Delete Connection")
         delete_action.setShortcut(QKeySequence.StandardKey.Delete)
         # Route to centralized deletion on canvas
-        delete_action.triggered.connect(lambda: self._request_centralized_delete())
+        delete_action.triggered.connect(self._request_centralized_delete)
 
         menu.addSeparator()
 
@@ -654,54 +811,52 @@ class ConnectionItem(QGraphicsPathItem):
 
         # Line color options
         color_menu = style_menu.addMenu("Line Color")
-
-        gray_action = color_menu.addAction("⚫ Gray")
-        gray_action.triggered.connect(
-            lambda: self.set_style({"line_color": QColor(100, 100, 100)})
-        )
-
-        blue_action = color_menu.addAction("🔵 Blue")
-        blue_action.triggered.connect(
-            lambda: self.set_style({"line_color": QColor(0, 120, 215)})
-        )
-
-        red_action = color_menu.addAction("🔴 Red")
-        red_action.triggered.connect(
-            lambda: self.set_style({"line_color": QColor(220, 50, 50)})
-        )
-
-        green_action = color_menu.addAction("🟢 Green")
-        green_action.triggered.connect(
-            lambda: self.set_style({"line_color": QColor(50, 150, 50)})
-        )
+        for label, color in (
+            ("⚫ Gray", QColor(100, 100, 100)),
+            ("🔵 Blue", QColor(0, 120, 215)),
+            ("🔴 Red", QColor(220, 50, 50)),
+            ("🟢 Green", QColor(50, 150, 50)),
+        ):
+            color_menu.addAction(label).setData({"line_color": color})
 
         # Line width options
         width_menu = style_menu.addMenu("Line Width")
-
-        thin_action = width_menu.addAction("Thin (1px)")
-        thin_action.triggered.connect(lambda: self.set_style({"line_width": 1}))
-
-        normal_action = width_menu.addAction("Normal (2px)")
-        normal_action.triggered.connect(lambda: self.set_style({"line_width": 2}))
-
-        thick_action = width_menu.addAction("Thick (3px)")
-        thick_action.triggered.connect(lambda: self.set_style({"line_width": 3}))
+        for label, width in (
+            ("Thin (1px)", 1),
+            ("Normal (2px)", 2),
+            ("Thick (3px)", 3),
+        ):
+            width_menu.addAction(label).setData({"line_width": width})
 
         # Arrow options
         arrow_menu = style_menu.addMenu("Arrow")
+        self._show_arrow_action = arrow_menu.addAction("")
+        self._show_arrow_action.triggered.connect(self._toggle_arrow)
 
-        show_arrow_action = arrow_menu.addAction(
-            "✅ Show Arrow" if self._style["show_arrow"] else "☑️ Show Arrow"
-        )
-        show_arrow_action.triggered.connect(
-            lambda: self.set_style({"show_arrow": not self._style["show_arrow"]})
-        )
+        # Submenu triggers bubble up to the style menu
+        style_menu.triggered.connect(self._on_style_action)
 
-        # Show menu at cursor position
-        menu.exec(event.screenPos())
+        self._context_menu = menu
 
-        # Accept the event to prevent propagation
-        event.accept()
+    def _on_style_action(self, action: QAction) -> None:
+        """
+        Apply the style preset carried by a context menu action.
+
+        Args:
+            action: Triggered action; actions without preset data are ignored
+        """
+        preset = action.data()
+        if preset:
+            self.set_style(
+                {
+                    key: QColor(value) if isinstance(value, QColor) else value
+                    for key, value in preset.items()
+                }
+            )
+
+    def _toggle_arrow(self) -> None:
+        """Toggle the arrow head from the context menu."""
+        self.set_style({"show_arrow": not self._style.show_arrow})
 
     def set_style(self, style_dict: dict) -> None:
         """
@@ -712,16 +867,33 @@ class ConnectionItem(QGraphicsPathItem):
         """
         # Update style properties
         for key, value in style_dict.items():
-            if key in self._style:
-                self._style[key] = value
+            if key in _STYLE_KEYS:
+                setattr(self._style, key, value)
+        if "arrow_angle" in style_dict:
+            self._update_arrow_angle()
 
         # Update visual appearance
         self._update_pen_style()
-        self.update_path()  # Recreate path with new styling
+        if style_dict.keys() <= _PEN_STYLE_KEYS:
+            # Pen-only change: the path is unaffected, but the selection
+            # margin and hit-test stroke follow the line width
+            if "line_width" in style_dict:
+                self.prepareGeometryChange()
+                self._cached_bounding_rect = None
+                self._cached_shape = None
+            self._style_fp = self._style_fingerprint()
+        else:
+            self.update_path()  # Recreate path with new styling
         self.update()
 
+        # The scene does not watch connections, so report the bounds change
+        invalidate = getattr(self.scene(), "invalidate_content_bounds", None)
+        if invalidate is not None:
+            invalidate()
+
         # Emit style changed signal
-        self.signals.style_changed.emit(self._style.copy())
+        if self._signals is not None:
+            self._signals.style_changed.emit(self._style.to_dict())
 
         self.logger.debug(
             f"Applied style to connection {self._connection_id}: {style_dict}"
@@ -734,7 +906,7 @@ class ConnectionItem(QGraphicsPathItem):
         Returns:
             Dictionary containing current style properties
         """
-        return self._style.copy()
+        return self._style.to_dict()
 
     def get_start_item(self) -> ConnectionEndpoint:
         """
@@ -811,7 +983,7 @@ class ConnectionItem(QGraphicsPathItem):
             "end_item_id": end_id,
             "start_note_id": start_note_id,  # Legacy compatibility expects int for notes
             "end_note_id": end_note_id,  # Legacy compatibility expects int for notes
-            "style": self._style.copy(),
+            "style": self._style.to_dict(),
             "start_point": (self._start_point.x(), self._start_point.y()),
             "end_point": (self._end_point.x(), self._end_point.y()),
         }
@@ -823,14 +995,33 @@ class ConnectionItem(QGraphicsPathItem):
         Returns:
             QRectF representing the connection's bounds
         """
-        # Get path bounding rect
-        path_rect = self.path().boundingRect()
+        if self._cached_bounding_rect is None:
+            # Get path bounding rect
+            path_rect = self.path().boundingRect()
+
+            # Add some margin for line width and selection indicators
+            margin = max(self._style.line_width, 10)
+            path_rect.adjust(-margin, -margin, margin, margin)
+            self._cached_bounding_rect = path_rect
+
+        return QRectF(self._cached_bounding_rect)
+
+    def shape(self) -> QPainterPath:
+        """
+        Return the widened outline of the connection used for hit testing.
 
-        # Add some margin for line width and selection indicators
-        margin = max(self._style["line_width"], 10)
-        path_rect.adjust(-margin, -margin, margin, margin)
+        Returns:
+            Stroked path around the connection line and arrow head
+        """
+        if self._cached_shape is None:
+            stroker = QPainterPathStroker()
+            stroker.setWidth(
+                max(self._style.line_width + 4, 8)
+            )  # Make it easier to select
+            stroker.setCapStyle(Qt.PenCapStyle.RoundCap)
+            self._cached_shape = stroker.createStroke(self.path())
 
-        return path_rect
+        return self._cached_shape
 
     def contains(self, point: QPointF) -> bool:
         """
@@ -842,15 +1033,7 @@ class ConnectionItem(QGraphicsPathItem):
         Returns:
             True if point is on the connection line
         """
-        # Create a stroked path for hit testing
-        stroker = QPainterPathStroker()
-        stroker.setWidth(
-            max(self._style["line_width"] + 4, 8)
-        )  # Make it easier to select
-        stroker.setCapStyle(Qt.PenCapStyle.RoundCap)
-
-        stroked_path = stroker.createStroke(self.path())
-        return stroked_path.contains(point)
+        return self.shape().contains(point)
 
     def is_connected_to_note(self, note: Any) -> bool:
         """
@@ -894,15 +1077,40 @@ class ConnectionItem(QGraphicsPathItem):
                 f"_disconnect_note_signals encountered non-fatal issue: {e}"
             )
 
+    def _get_canvas(self) -> Any | None:
+        """
+        Return the canvas view showing this connection, if any.
+
+        The canvas is looked up through the scene's views once and then held
+        weakly, so repeated requests skip the scene/view walk without keeping
+        the canvas alive.
+
+        Returns:
+            View providing delete_items_with_confirmation, or None
+        """
+        scene = self.scene()
+        if scene is None:
+            return None
+        canvas = self._canvas_ref() if self._canvas_ref is not None else None
+        if canvas is None or canvas.scene() is not scene:
+            canvas = next(
+                (
+                    view
+                    for view in scene.views()
+                    if hasattr(view, "delete_items_with_confirmation")
+                ),
+                None,
+            )
+            self._canvas_ref = weakref.ref(canvas) if canvas is not None else None
+        return canvas
+
     def _request_centralized_delete(self) -> None:
         """Ask the canvas to delete this connection via centralized confirmation dialog."""
         try:
-            if self.scene() and self.scene().views():
-                view = self.scene().views()[0]
-                canvas = getattr(view, "_canvas", None)
-                if canvas and hasattr(canvas, "delete_items_with_confirmation"):
-                    canvas.delete_items_with_confirmation([self])
-                    return
+            canvas = self._get_canvas()
+            if canvas is not None:
+                canvas.delete_items_with_confirmation([self])
+                return
         except Exception as e:
             self.logger.error(f"Failed to route connection deletion to canvas: {e}")
         # Fallback: direct delete without extra dialog
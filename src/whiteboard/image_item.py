@@ -78,6 +78,7 @@ class ImageItem(QGraphicsPixmapItem):
         self._scale_factor = 1.0
         self._rotation = 0
         self._drag_start_position = QPointF()
+        self._pre_move_scene_rect: QRectF | None = None  # Painted area before a move
 
         # Resize handles
         self._resize_handles: list[ImageResizeHandle] = []
@@ -590,9 +591,6 @@ class ImageItem(QGraphicsPixmapItem):
         # Get bounding rectangle
         rect = self.boundingRect()
 
-        # Setup painter
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
-
         # Clear the background to prevent trailing artifacts
         if self._is_resizing:
             painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Clear)
@@ -867,12 +865,28 @@ class ImageItem(QGraphicsPixmapItem):
         # Check if we need to expand the scene
         self._handle_scene_expansion()
 
-        # Force scene update to prevent trailing lines
-        if self.scene():
-            self.scene().update()
+        # Repaint the vacated and newly covered areas to prevent trailing lines
+        scene = self.scene()
+        if scene:
+            dirty_rect = self._scene_paint_rect()
+            if self._pre_move_scene_rect is not None:
+                dirty_rect = dirty_rect.united(self._pre_move_scene_rect)
+                self._pre_move_scene_rect = None
+            scene.update(dirty_rect.adjusted(-20, -20, 20, 20))
 
         self.logger.debug(f"ImageItem {self._image_id} moved to {new_position}")
 
+    def _scene_paint_rect(self) -> QRectF:
+        """
+        Get the scene area painted by the image and its resize handles.
+
+        Returns:
+            QRectF in scene coordinates
+        """
+        return self.mapRectToScene(
+            self.boundingRect().united(self.childrenBoundingRect())
+        )
+
     def _handle_selection_change(self, selected):
         """Handle selection state changes."""
         if selected:  # Selected
@@ -886,7 +900,10 @@ class ImageItem(QGraphicsPixmapItem):
         """
         Handle item changes including position updates.
         """
-        if change == QGraphicsPixmapItem.GraphicsItemChange.ItemPositionHasChanged:
+        if change == QGraphicsPixmapItem.GraphicsItemChange.ItemPositionChange:
+            if self.scene():
+                self._pre_move_scene_rect = self._scene_paint_rect()
+        elif change == QGraphicsPixmapItem.GraphicsItemChange.ItemPositionHasChanged:
             self._handle_position_change(self.pos())
         elif change == QGraphicsPixmapItem.GraphicsItemChange.ItemSelectedHasChanged:
             self._handle_selection_change(value)
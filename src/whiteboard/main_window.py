@@ -618,6 +618,9 @@ class MainWindow(QMainWindow):
             stack.can_redo_changed.connect(
                 lambda enabled: self._redo_action.setEnabled(enabled)
             )
+            # The stack only reports changes, so start from its current state
+            self._undo_action.setEnabled(stack.can_undo())
+            self._redo_action.setEnabled(stack.can_redo())
         except Exception as e:
             self.logger.debug(f"Failed to bind undo/redo actions to stack: {e}")
         # Connect note creation signals
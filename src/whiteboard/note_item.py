@@ -5,6 +5,8 @@ This module contains the NoteItem class which represents individual editable not
 on the whiteboard canvas with styling and interaction capabilities.
 """
 
+from collections.abc import Mapping
+from functools import lru_cache
 from typing import Any
 from PyQt6.QtCore import Qt, QPointF, QRectF, pyqtSignal
 from PyQt6.QtGui import (
@@ -16,6 +18,7 @@ from PyQt6.QtGui import (
     QTextCursor,
     QTextCharFormat,
     QKeySequence,
+    QTransform,
 )
 from PyQt6.QtWidgets import (
     QGraphicsTextItem,
@@ -32,6 +35,18 @@ from PyQt6.QtWidgets import (
 from .utils.logging_config import get_logger
 
 
+@lru_cache(maxsize=256)
+def _cached_brush(rgba: int) -> QBrush:
+    """Return a shared solid brush for an ARGB color value."""
+    return QBrush(QColor.fromRgba(rgba))
+
+
+@lru_cache(maxsize=256)
+def _cached_pen(rgba: int, width: float = 1) -> QPen:
+    """Return a shared pen for an ARGB color value and width."""
+    return QPen(QColor.fromRgba(rgba), width)
+
+
 class NoteItem(QGraphicsTextItem):
     """
     Individual note item with text editing and styling capabilities.
@@ -55,6 +70,7 @@ class NoteItem(QGraphicsTextItem):
     position_changed = pyqtSignal(QPointF)
     content_changed = pyqtSignal(str)
     style_changed = pyqtSignal(dict)
+    geometry_changed = pyqtSignal()  # Bounds changed by a style update
     editing_started = pyqtSignal()
     editing_finished = pyqtSignal()
     hover_started = pyqtSignal(str)  # Emits hint text
@@ -79,6 +95,11 @@ class NoteItem(QGraphicsTextItem):
         self._original_text = text
         # Track geometry updates to adjust painting behavior and clearing
         self._is_geometry_updating = False
+        # Scene-space connection points shared by every incident connection,
+        # keyed by the geometry they were computed from
+        self._connection_points_cache: (
+            tuple[QRectF, QTransform, list[QPointF]] | None
+        ) = None
 
         # Get default styling from style manager
         from .style_manager import get_style_manager
@@ -308,9 +329,6 @@ class NoteItem(QGraphicsTextItem):
         # Get bounding rectangle
         rect = self.boundingRect()
 
-        # Setup painter
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
-
         # Clear the background slightly larger than rect during geometry updates to avoid trails
         if getattr(self, "_is_geometry_updating", False):
             painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Clear)
@@ -325,9 +343,6 @@ class NoteItem(QGraphicsTextItem):
             # Slightly brighter background when editing
             background_color = background_color.lighter(110)
 
-        brush = QBrush(background_color)
-        painter.setBrush(brush)
-
         # Draw border
         border_color = self._style["border_color"]
         border_width = self._style["border_width"]
@@ -344,19 +359,16 @@ class NoteItem(QGraphicsTextItem):
             # Slightly lighter background on hover to indicate interactivity
             background_color = background_color.lighter(108)
 
-        # Update brush with potentially modified background color
-        brush = QBrush(background_color)
-        painter.setBrush(brush)
-
-        pen = QPen(border_color, border_width)
-        painter.setPen(pen)
+        # Brushes and pens are shared across notes with the same style
+        painter.setBrush(_cached_brush(background_color.rgba()))
+        painter.setPen(_cached_pen(border_color.rgba(), border_width))
 
         # Draw rounded rectangle
         corner_radius = self._style["corner_radius"]
         painter.drawRoundedRect(rect, corner_radius, corner_radius)
 
         # Draw text content
-        painter.setPen(QPen(self._style["text_color"]))
+        painter.setPen(_cached_pen(self._style["text_color"].rgba()))
         super().paint(painter, option, widget)
 
     def _draw_move_grip(self, painter: QPainter, rect: QRectF) -> None:
@@ -378,8 +390,8 @@ class NoteItem(QGraphicsTextItem):
 
         # Set grip color (slightly darker than border)
         grip_color = self._style["border_color"].darker(140)
-        painter.setPen(QPen(grip_color, 1))
-        painter.setBrush(QBrush(grip_color))
+        painter.setPen(_cached_pen(grip_color.rgba(), 1))
+        painter.setBrush(_cached_brush(grip_color.rgba()))
 
         # Draw 3x3 grid of small dots
         for i in range(3):
@@ -1020,13 +1032,15 @@ class NoteItem(QGraphicsTextItem):
             current_text = self.toPlainText()
             self.content_changed.emit(current_text)
 
-    def set_style(self, style_dict: dict[str, Any]) -> None:
+    def set_style(self, style_dict: Mapping[str, Any]) -> None:
         """
         Apply custom styling to the note.
 
         Args:
-            style_dict: Dictionary containing style properties
+            style_dict: Mapping of style properties, read-only mappings included
         """
+        old_rect = self.boundingRect()
+
         # Update style properties
         for key, value in style_dict.items():
             if key in self._style:
@@ -1039,6 +1053,10 @@ class NoteItem(QGraphicsTextItem):
         self._update_geometry()
         self.update()
 
+        # Only restyles that resize the note affect attached connections
+        if self.boundingRect() != old_rect:
+            self.geometry_changed.emit()
+
         # Emit style changed signal
         self.style_changed.emit(self._style.copy())
 
@@ -1085,19 +1103,25 @@ class NoteItem(QGraphicsTextItem):
             List of QPointF representing connection attachment points
         """
         rect = self.boundingRect()
+        transform = self.sceneTransform()
+        cache = self._connection_points_cache
+        if cache is not None and cache[0] == rect and cache[1] == transform:
+            return list(cache[2])
 
         # Return points at the center of each edge
+        center = rect.center()
         points = [
-            QPointF(rect.center().x(), rect.top()),  # Top center
-            QPointF(rect.right(), rect.center().y()),  # Right center
-            QPointF(rect.center().x(), rect.bottom()),  # Bottom center
-            QPointF(rect.left(), rect.center().y()),  # Left center
+            QPointF(center.x(), rect.top()),  # Top center
+            QPointF(rect.right(), center.y()),  # Right center
+            QPointF(center.x(), rect.bottom()),  # Bottom center
+            QPointF(rect.left(), center.y()),  # Left center
         ]
 
         # Convert to scene coordinates
-        scene_points = [self.mapToScene(point) for point in points]
+        scene_points = [transform.map(point) for point in points]
 
-        return scene_points
+        self._connection_points_cache = (rect, transform, scene_points)
+        return list(scene_points)
 
     def get_note_id(self) -> int:
         """
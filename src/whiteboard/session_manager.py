@@ -7,6 +7,7 @@ data serialization, and file operations for saving and loading whiteboard sessio
 
 import json
 import base64
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 from datetime import datetime
@@ -21,6 +22,7 @@ from .utils.exceptions import WhiteboardError
 from .note_item import NoteItem
 from .connection_item import ConnectionItem
 from .image_item import ImageItem
+from .canvas import WhiteboardScene
 
 
 class SessionError(WhiteboardError):
@@ -402,43 +404,54 @@ class SessionManager(QObject):
 
         # Deserialize notes first
         notes_data = session_data.get("notes", [])
+        notes = []
         for note_data in notes_data:
             note = self._deserialize_note(note_data)
-            scene.addItem(note)
             note_id_map[note.get_note_id()] = note
-        self.logger.debug(f"Recreated {len(note_id_map)} notes for deserialization")
+            notes.append(note)
+        self._add_items(scene, notes)
+        self.logger.debug(f"Recreated {len(notes)} notes for deserialization")
 
         # Deserialize images next so connections can resolve them
         images_data = session_data.get("images", [])
-        images_added = 0
+        images = []
         for image_data in images_data:
             try:
                 image = self._deserialize_image(image_data)
                 if image:
-                    scene.addItem(image)
                     image_id_map[image.get_image_id()] = image
-                    images_added += 1
+                    images.append(image)
             except Exception as e:
                 self.logger.error(f"Failed to deserialize image: {e}")
+        self._add_items(scene, images)
+        images_added = len(images)
         self.logger.debug(
             f"Recreated {images_added} images; available image IDs: {list(image_id_map.keys())}"
         )
 
         # Deserialize connections last, when all endpoints exist
         connections_data = session_data.get("connections", [])
-        connections_added = 0
+        connections = []
         for connection_data in connections_data:
             try:
                 connection = self._deserialize_connection(
                     connection_data, note_id_map, image_id_map
                 )
                 if connection is not None:
-                    scene.addItem(connection)
-                    connections_added += 1
+                    connections.append(connection)
             except Exception as e:
                 self.logger.error(f"Failed to deserialize connection: {e}")
+        self._add_items(scene, connections)
 
-        return len(notes_data), connections_added, images_added
+        return len(notes), len(connections), images_added
+
+    def _add_items(self, scene: QGraphicsScene, items: Iterable[Any]) -> None:
+        """Add items to the scene, in one batch when the scene supports it."""
+        if isinstance(scene, WhiteboardScene):
+            scene.add_items(items)
+        else:
+            for item in items:
+                scene.addItem(item)
 
     def _deserialize_note(self, note_data: dict[str, Any]) -> NoteItem:
         """
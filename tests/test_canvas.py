@@ -5,7 +5,8 @@ Unit tests for canvas components (WhiteboardScene and WhiteboardCanvas).
 import unittest
 from unittest.mock import Mock, patch
 from PyQt6.QtWidgets import QApplication, QGraphicsRectItem, QGraphicsEllipseItem
-from PyQt6.QtCore import QPointF, Qt, QRect
+from PyQt6.QtCore import QPointF, Qt, QRect, QRectF
+from PyQt6.QtTest import QTest
 
 from src.whiteboard.canvas import WhiteboardScene, WhiteboardCanvas
 
@@ -43,6 +44,14 @@ class TestWhiteboardScene(unittest.TestCase):
         # Check initial state
         self.assertEqual(len(self.scene._tracked_items), 0)
 
+    def test_scene_uses_no_index(self):
+        """Test that the scene skips Qt's BSP index for frequently moved items."""
+        from PyQt6.QtWidgets import QGraphicsScene
+
+        self.assertEqual(
+            self.scene.itemIndexMethod(), QGraphicsScene.ItemIndexMethod.NoIndex
+        )
+
     def test_add_item_tracking(self):
         """Test that items are properly tracked when added."""
         # Create test item
@@ -81,6 +90,47 @@ class TestWhiteboardScene(unittest.TestCase):
         new_rect = self.scene.sceneRect()
         self.assertGreater(new_rect.width(), initial_rect.width())
 
+    def test_scene_not_expanded_for_interior_items(self):
+        """Test that items well inside the scene leave the scene rect alone."""
+        initial_rect = self.scene.sceneRect()
+
+        item = QGraphicsRectItem(0, 0, 100, 100)
+        self.scene.addItem(item)
+
+        self.assertEqual(self.scene.sceneRect(), initial_rect)
+
+    def test_expansion_check_follows_scene_rect(self):
+        """Test that an externally set scene rect is honored by expansion."""
+        self.scene.setSceneRect(QRectF(0, 0, 3000, 3000))
+
+        # Inside the old rect but too close to the new top-left edge
+        item = QGraphicsRectItem(100, 100, 50, 50)
+        self.scene.addItem(item)
+
+        self.assertLess(self.scene.sceneRect().left(), 0)
+        self.assertLess(self.scene.sceneRect().top(), 0)
+
+    def test_add_items_expands_scene_once(self):
+        """Test that bulk additions track every item and expand once."""
+        added_handler = Mock()
+        rect_handler = Mock()
+        self.scene.item_added.connect(added_handler)
+        self.scene.sceneRectChanged.connect(rect_handler)
+
+        items = [
+            QGraphicsRectItem(4500, 0, 100, 100),
+            QGraphicsRectItem(-4500, 0, 100, 100),
+            QGraphicsRectItem(0, 0, 100, 100),
+        ]
+        self.scene.add_items(items)
+
+        self.assertEqual(list(self.scene._tracked_items), items)
+        self.assertEqual(added_handler.call_count, 3)
+        rect_handler.assert_called_once()
+        scene_rect = self.scene.sceneRect()
+        self.assertLess(scene_rect.left(), -5000)
+        self.assertGreater(scene_rect.right(), 5000)
+
     def test_content_bounds_empty(self):
         """Test content bounds calculation with no items."""
         bounds = self.scene.get_content_bounds()
@@ -103,6 +153,104 @@ class TestWhiteboardScene(unittest.TestCase):
         self.assertGreaterEqual(bounds.width(), 300)  # At least spans both items
         self.assertGreaterEqual(bounds.height(), 300)
 
+    def test_content_bounds_cached_until_change(self):
+        """Test that content bounds are reused until items change."""
+        from src.whiteboard.note_item import NoteItem
+
+        note = NoteItem("Note", QPointF(0, 0))
+        self.scene.addItem(note)
+        first = self.scene.get_content_bounds()
+
+        with patch.object(
+            self.scene,
+            "_compute_content_bounds",
+            wraps=self.scene._compute_content_bounds,
+        ) as mock_compute:
+            self.assertEqual(self.scene.get_content_bounds(), first)
+            self.scene.get_scene_statistics()
+            mock_compute.assert_not_called()
+
+            # Moving a note emits position_changed and invalidates the cache
+            note.setPos(QPointF(500, 500))
+            moved = self.scene.get_content_bounds()
+            mock_compute.assert_called_once()
+
+        self.assertGreaterEqual(moved.right(), 500)
+
+    def test_content_bounds_extended_on_add(self):
+        """Test that adding an item grows cached bounds without a full rebuild."""
+        self.scene.addItem(QGraphicsRectItem(0, 0, 100, 100))
+        self.scene.get_content_bounds()
+
+        with patch.object(
+            self.scene,
+            "_compute_content_bounds",
+            wraps=self.scene._compute_content_bounds,
+        ) as mock_compute:
+            self.scene.addItem(QGraphicsRectItem(300, 200, 50, 50))
+            bounds = self.scene.get_content_bounds()
+            mock_compute.assert_not_called()
+
+        # Rect items include half the default pen width on each side
+        self.assertEqual(bounds, QRectF(-0.5, -0.5, 351, 251))
+
+    def test_item_at_skips_scan_outside_content(self):
+        """Test that item_at only scans items inside the content bounds."""
+        from PyQt6.QtGui import QTransform
+
+        item = QGraphicsRectItem(0, 0, 100, 100)
+        self.scene.addItem(item)
+
+        with patch.object(self.scene, "itemAt", wraps=self.scene.itemAt) as mock_at:
+            self.assertIsNone(self.scene.item_at(QPointF(500, 500), QTransform()))
+            mock_at.assert_not_called()
+
+            self.assertIs(self.scene.item_at(QPointF(50, 50), QTransform()), item)
+            mock_at.assert_called_once()
+
+    def test_item_at_finds_overhanging_resize_handle(self):
+        """Test that item_at hits resize handles outside the content bounds."""
+        from PyQt6.QtGui import QTransform
+        from src.whiteboard.image_item import ImageItem
+        from src.whiteboard.image_resize_handle import ImageResizeHandle
+
+        image = ImageItem("", QPointF(0, 0))
+        self.scene.addItem(image)
+        image.setSelected(True)
+        pos = QPointF(-4, -4)
+        self.assertFalse(self.scene.get_content_bounds().contains(pos))
+
+        hit = self.scene.item_at(pos, QTransform())
+        self.assertIsInstance(hit, ImageResizeHandle)
+        self.assertIs(hit, self.scene.itemAt(pos, QTransform()))
+
+    def test_adding_connection_keeps_signals_lazy(self):
+        """Test that tracking a connection does not allocate its emitter."""
+        from src.whiteboard.connection_item import ConnectionItem
+        from src.whiteboard.note_item import NoteItem
+
+        start = NoteItem("Start", QPointF(0, 0))
+        end = NoteItem("End", QPointF(200, 0))
+        self.scene.add_items([start, end])
+        connection = ConnectionItem(start, end)
+        self.scene.add_items([connection])
+        self.assertIsNone(connection._signals)
+
+        # Restyles still invalidate the cached bounds
+        self.scene.get_content_bounds()
+        connection.set_style({"line_width": 8})
+        self.assertTrue(self.scene._content_bounds_dirty)
+
+        self.scene.removeItem(connection)
+        self.assertIsNone(connection._signals)
+
+    def test_content_bounds_copy_is_independent(self):
+        """Test that callers mutating the returned rect don't corrupt the cache."""
+        self.scene.addItem(QGraphicsRectItem(0, 0, 100, 100))
+        bounds = self.scene.get_content_bounds()
+        bounds.adjust(-50, -50, 50, 50)
+        self.assertNotEqual(self.scene.get_content_bounds(), bounds)
+
     def test_center_on_content_empty(self):
         """Test center calculation with no content."""
         center = self.scene.center_on_content()
@@ -185,14 +333,63 @@ class TestWhiteboardScene(unittest.TestCase):
         item = QGraphicsRectItem(4000, 0, 100, 100)  # Near boundary
         self.scene.addItem(item)
 
-        # Verify signals were emitted
+        # Verify signals were emitted (bounds changes are coalesced)
         item_added_handler.assert_called_once_with(item)
-        bounds_changed_handler.assert_called_once()
+        bounds_changed_handler.assert_not_called()
+        QTest.qWait(50)
+        bounds_changed_handler.assert_called_once_with(self.scene.sceneRect())
 
         # Remove item
         self.scene.removeItem(item)
         item_removed_handler.assert_called_once_with(item)
 
+    def test_note_added_signal_only_for_notes(self):
+        """Test that note_added is emitted for notes but not for other items."""
+        from src.whiteboard.note_item import NoteItem
+
+        note_added_handler = Mock()
+        self.scene.note_added.connect(note_added_handler)
+
+        self.scene.addItem(QGraphicsRectItem(0, 0, 10, 10))
+        note_added_handler.assert_not_called()
+
+        note = NoteItem("Note", QPointF(0, 0))
+        self.scene.addItem(note)
+        note_added_handler.assert_called_once_with(note)
+
+    def test_get_notes_tracks_scene_notes(self):
+        """Test that the note index follows additions, removals and clears."""
+        from src.whiteboard.note_item import NoteItem
+
+        note1 = NoteItem("One", QPointF(0, 0))
+        note2 = NoteItem("Two", QPointF(50, 0))
+        self.scene.addItem(note1)
+        self.scene.addItem(QGraphicsRectItem(0, 0, 10, 10))
+        self.scene.addItem(note2)
+        self.assertEqual(self.scene.get_notes(), [note1, note2])
+
+        self.scene.removeItem(note1)
+        self.assertEqual(self.scene.get_notes(), [note2])
+
+        self.scene.clear()
+        self.assertEqual(self.scene.get_notes(), [])
+
+    def test_get_connections_tracks_scene_connections(self):
+        """Test that the connection index follows additions and removals."""
+        from src.whiteboard.connection_item import ConnectionItem
+        from src.whiteboard.note_item import NoteItem
+
+        note1 = NoteItem("One", QPointF(0, 0))
+        note2 = NoteItem("Two", QPointF(200, 0))
+        self.scene.addItem(note1)
+        self.scene.addItem(note2)
+        connection = ConnectionItem(note1, note2)
+        self.scene.addItem(connection)
+        self.assertEqual(self.scene.get_connections(), [connection])
+
+        self.scene.removeItem(connection)
+        self.assertEqual(self.scene.get_connections(), [])
+
 
 class TestWhiteboardCanvas(unittest.TestCase):
     """Test cases for WhiteboardCanvas class."""
@@ -516,6 +713,142 @@ class TestWhiteboardCanvas(unittest.TestCase):
         # Reset to center
         self.canvas.center_on_content()
 
+    def test_antialiasing_suspended_during_pan(self):
+        """Test that antialiasing is disabled while panning and restored after."""
+        from PyQt6.QtGui import QMouseEvent, QPainter
+
+        def mouse_event(event_type):
+            return QMouseEvent(
+                event_type,
+                QPointF(50, 50),
+                Qt.MouseButton.MiddleButton,
+                Qt.MouseButton.MiddleButton,
+                Qt.KeyboardModifier.NoModifier,
+            )
+
+        antialiasing = QPainter.RenderHint.Antialiasing
+        self.assertTrue(self.canvas.renderHints() & antialiasing)
+
+        self.canvas.mousePressEvent(mouse_event(QMouseEvent.Type.MouseButtonPress))
+        self.assertFalse(self.canvas.renderHints() & antialiasing)
+
+        self.canvas.mouseReleaseEvent(mouse_event(QMouseEvent.Type.MouseButtonRelease))
+        self.assertTrue(self.canvas.renderHints() & antialiasing)
+
+    def test_restoring_antialiasing_repaints_cached_items(self):
+        """Test that item caches drawn aliased mid-gesture are refreshed."""
+        from src.whiteboard.note_item import NoteItem
+
+        note = NoteItem("Cached", QPointF(0, 0))
+        self.scene.addItem(note)
+        self.canvas.centerOn(note)
+
+        self.canvas._suspend_antialiasing()
+        with patch.object(note, "update") as mock_update:
+            self.canvas._restore_antialiasing()
+            mock_update.assert_called_once()
+
+            # Already antialiased: nothing to refresh
+            self.canvas._restore_antialiasing()
+            mock_update.assert_called_once()
+
+    def test_cached_view_center_tracks_pan_and_zoom(self):
+        """Test that the cached view center matches a fresh mapping."""
+
+        def assert_center_matches():
+            cached = self.canvas._get_view_center_scene()
+            actual = self.canvas.mapToScene(self.canvas.rect().center())
+            self.assertAlmostEqual(cached.x(), actual.x(), places=3)
+            self.assertAlmostEqual(cached.y(), actual.y(), places=3)
+
+        assert_center_matches()
+        self.canvas.pan(120, -45)
+        assert_center_matches()
+        self.canvas.set_zoom(2.5)
+        assert_center_matches()
+        self.canvas.pan(-33, 71)
+        assert_center_matches()
+        self.canvas.horizontalScrollBar().setValue(
+            self.canvas.horizontalScrollBar().value() + 17
+        )
+        assert_center_matches()
+
+    def test_notes_use_device_coordinate_cache(self):
+        """Test that notes are cached and the view repaints only damaged regions."""
+        from PyQt6.QtWidgets import QGraphicsItem, QGraphicsView
+        from src.whiteboard.note_item import NoteItem
+
+        note = NoteItem("Cached", QPointF(0, 0))
+        self.scene.addItem(note)
+
+        self.assertEqual(
+            note.cacheMode(), QGraphicsItem.CacheMode.DeviceCoordinateCache
+        )
+        self.assertEqual(
+            self.canvas.viewportUpdateMode(),
+            QGraphicsView.ViewportUpdateMode.SmartViewportUpdate,
+        )
+
+    def test_select_all_notes_emits_one_selection_change(self):
+        """Test that selecting all notes emits selectionChanged only once."""
+        from src.whiteboard.note_item import NoteItem
+
+        notes = [NoteItem(f"Note {i}", QPointF(i * 50, 0)) for i in range(3)]
+        for note in notes:
+            self.scene.addItem(note)
+
+        selection_handler = Mock()
+        self.scene.selectionChanged.connect(selection_handler)
+
+        self.canvas._select_all_notes()
+
+        self.assertTrue(all(note.isSelected() for note in notes))
+        selection_handler.assert_called_once()
+
+        # Nothing left to select, so nothing is reported
+        self.canvas._select_all_notes()
+        selection_handler.assert_called_once()
+
+    def test_pan_changed_is_throttled(self):
+        """Test that consecutive pans emit pan_changed once with the final center."""
+        pan_handler = Mock()
+        self.canvas.pan_changed.connect(pan_handler)
+
+        for _ in range(5):
+            self.canvas.pan(10, 5)
+        pan_handler.assert_not_called()
+
+        QTest.qWait(50)
+        pan_handler.assert_called_once_with(self.canvas.get_center_point())
+
+    def test_view_center_refreshed_on_resize(self):
+        """Test that the cached widget center follows resizes."""
+        self.canvas.resize(640, 480)
+        self.canvas.show()
+        QTest.qWait(10)
+
+        self.assertEqual(self.canvas._view_center, self.canvas.rect().center())
+        self.assertEqual(
+            self.canvas._get_view_center_scene(),
+            self.canvas.mapToScene(self.canvas.rect().center()),
+        )
+        self.canvas.hide()
+
+    def test_resize_viewport_changed_is_coalesced(self):
+        """Test that a burst of resizes emits viewport_changed once."""
+        from PyQt6.QtCore import QSize
+        from PyQt6.QtGui import QResizeEvent
+
+        viewport_handler = Mock()
+        self.canvas.viewport_changed.connect(viewport_handler)
+
+        for width in (800, 810, 820):
+            self.canvas.resizeEvent(QResizeEvent(QSize(width, 600), QSize(800, 600)))
+        viewport_handler.assert_not_called()
+
+        QTest.qWait(50)
+        viewport_handler.assert_called_once()
+
     def test_center_on_content_empty(self):
         """Test center on content with empty scene."""
         # Clear the scene
@@ -661,10 +994,12 @@ class TestWhiteboardCanvas(unittest.TestCase):
         note1 = Mock(spec=NoteItem)
         note1._note_id = "note1"
         note1._delete_note = Mock()
+        note1.get_note_data.return_value = {"id": "note1", "style": {}}
 
         note2 = Mock(spec=NoteItem)
         note2._note_id = "note2"
         note2._delete_note = Mock()
+        note2.get_note_data.return_value = {"id": "note2", "style": {}}
 
         # Mock scene selection
         with patch.object(
@@ -731,17 +1066,23 @@ class TestWhiteboardCanvas(unittest.TestCase):
         connection._connection_id = "conn1"
         connection.setSelected = Mock()
 
+        note.isSelected.return_value = False
+        connection.isSelected.return_value = False
+
         other_item = Mock()  # Item without _note_id or _connection_id
 
-        with patch.object(
-            self.canvas.scene(), "items", return_value=[note, connection, other_item]
+        scene = self.canvas.scene()
+        with (
+            patch.object(scene, "items", return_value=[note, connection, other_item]),
+            patch.object(scene, "get_notes", return_value=[note]),
+            patch.object(scene, "get_connections", return_value=[connection]),
         ):
             result = self.canvas._handle_select_all_shortcut()
 
             self.assertTrue(result)
             note.setSelected.assert_called_once_with(True)
             connection.setSelected.assert_called_once_with(True)
-            # other_item.setSelected should not be called
+            other_item.setSelected.assert_not_called()
 
     def test_new_note_shortcut_handler(self):
         """Test new note shortcut handler functionality."""
@@ -811,5 +1152,82 @@ class TestWhiteboardCanvas(unittest.TestCase):
                         event.accept.assert_called_once()
 
 
+class TestItemPaintState(unittest.TestCase):
+    """Test that item paint() tolerates state left by the previous item.
+
+    The canvas enables DontSavePainterState, so each item must set the
+    painter state it relies on instead of assuming a fresh painter.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up QApplication for testing."""
+        if not QApplication.instance():
+            cls.app = QApplication([])
+        else:
+            cls.app = QApplication.instance()
+
+    def _render(self, item, dirty):
+        """Paint an item into an image, optionally over a dirtied painter."""
+        from PyQt6.QtGui import QColor, QImage, QPainter, QPen
+        from PyQt6.QtWidgets import QStyleOptionGraphicsItem
+
+        bounds = item.boundingRect().adjusted(-10, -10, 10, 10)
+        image = QImage(bounds.size().toSize(), QImage.Format.Format_ARGB32)
+        image.fill(0)
+        painter = QPainter(image)
+        painter.translate(-bounds.topLeft())
+        if dirty:
+            painter.setBrush(QColor(255, 0, 0))
+            painter.setPen(QPen(QColor(0, 255, 0), 9))
+        item.paint(painter, QStyleOptionGraphicsItem(), None)
+        painter.end()
+        return image
+
+    def _items(self):
+        """Build one of each paintable item type on a scene."""
+        from src.whiteboard.connection_item import ConnectionItem
+        from src.whiteboard.image_item import ImageItem
+        from src.whiteboard.image_resize_handle import HandleType, ImageResizeHandle
+        from src.whiteboard.note_item import NoteItem
+
+        self.scene = WhiteboardScene()
+        start = NoteItem("Start", QPointF(0, 0))
+        end = NoteItem("End", QPointF(200, 120))
+        image = ImageItem("", QPointF(0, 300))
+        connection = ConnectionItem(start, end)
+        connection.set_style({"curve_factor": 0.5})
+        self.scene.add_items([start, end, image, connection])
+        return [
+            start,
+            image,
+            ImageResizeHandle(HandleType.TOP_LEFT, image),
+            connection,
+        ]
+
+    def test_items_paint_with_painter_antialiasing(self):
+        """Test that items inherit the antialiasing hint of the view."""
+        from PyQt6.QtGui import QImage, QPainter
+        from PyQt6.QtWidgets import QStyleOptionGraphicsItem
+
+        antialiasing = QPainter.RenderHint.Antialiasing
+        for item in self._items():
+            for enabled in (False, True):
+                with self.subTest(item=type(item).__name__, enabled=enabled):
+                    image = QImage(400, 400, QImage.Format.Format_ARGB32)
+                    painter = QPainter(image)
+                    painter.setRenderHint(antialiasing, enabled)
+                    item.paint(painter, QStyleOptionGraphicsItem(), None)
+                    hints = painter.renderHints()
+                    painter.end()
+                    self.assertEqual(bool(hints & antialiasing), enabled)
+
+    def test_items_paint_same_over_dirty_painter(self):
+        """Test that leftover pen and brush never change an item's pixels."""
+        for item in self._items():
+            with self.subTest(item=type(item).__name__):
+                self.assertEqual(self._render(item, True), self._render(item, False))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -8,7 +8,8 @@ including connection validation and duplicate prevention.
 import unittest
 from unittest.mock import patch
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import QPointF
+from PyQt6.QtCore import QPointF, Qt
+from PyQt6.QtGui import QMouseEvent
 
 from src.whiteboard.canvas import WhiteboardCanvas, WhiteboardScene
 from src.whiteboard.note_item import NoteItem
@@ -98,6 +99,16 @@ class TestConnectionCreation(unittest.TestCase):
         self.assertNotIn(connection1, self.canvas.get_connections())
         self.assertIn(connection2, self.canvas.get_connections())
 
+    def test_connection_exists_cleared_after_deletion(self):
+        """Test that deleting a connection clears its endpoint pair."""
+        connection = self.canvas._create_connection(self.note1, self.note2)
+        self.assertTrue(self.canvas._connection_exists(self.note2, self.note1))
+
+        connection.delete_connection()
+        QApplication.processEvents()
+
+        self.assertFalse(self.canvas._connection_exists(self.note1, self.note2))
+
     def test_delete_connections_for_note(self):
         """Test deleting all connections for a specific note."""
         # Create connections involving note1
@@ -117,6 +128,8 @@ class TestConnectionCreation(unittest.TestCase):
         remaining_connections = self.canvas.get_connections()
         self.assertEqual(len(remaining_connections), 1)
         self.assertEqual(remaining_connections[0], connection3)
+        self.assertNotIn(self.note1, self.canvas._connections_by_item)
+        self.assertEqual(self.canvas._connections_by_item[self.note2], [connection3])
 
     def test_connection_start_workflow(self):
         """Test starting connection creation workflow."""
@@ -127,6 +140,10 @@ class TestConnectionCreation(unittest.TestCase):
         # Verify connection mode is active
         self.assertTrue(self.canvas._connection_mode)
         self.assertEqual(self.canvas._connection_start_note, self.note1)
+        self.assertEqual(
+            self.canvas._connection_start_scene_pos,
+            self.note1.mapToScene(self.note1.boundingRect().center()),
+        )
 
     def test_connection_cancellation(self):
         """Test connection creation cancellation."""
@@ -140,7 +157,34 @@ class TestConnectionCreation(unittest.TestCase):
         # Verify connection mode is inactive
         self.assertFalse(self.canvas._connection_mode)
         self.assertIsNone(self.canvas._connection_start_note)
-        self.assertIsNone(self.canvas._connection_preview_line)
+        self.assertIsNone(self.canvas._connection_start_scene_pos)
+        self.assertFalse(self.canvas._connection_preview_line.isVisible())
+
+    def test_connection_preview_updates_are_coalesced(self):
+        """Test that queued preview updates collapse to the latest position."""
+        self.canvas._start_connection_creation(self.note1, QPointF(100, 100))
+
+        with patch.object(self.canvas, "mapToScene") as mock_map:
+            mock_map.return_value = QPointF(400, 400)
+            self.canvas._update_connection_preview(QPointF(150, 150))
+            self.canvas._update_connection_preview(QPointF(160, 160))
+            self.assertTrue(self.canvas._preview_timer.isActive())
+
+            QApplication.processEvents()
+
+        mock_map.assert_called_once()
+        self.assertIsNone(self.canvas._preview_pending_pos)
+        self.assertTrue(self.canvas._connection_preview_line.isVisible())
+
+    def test_connection_preview_line_reused(self):
+        """Test that the preview line is created once and reused across gestures."""
+        self.canvas._start_connection_creation(self.note1, QPointF(100, 100))
+        preview_line = self.canvas._connection_preview_line
+        self.canvas._cancel_connection_creation()
+
+        self.canvas._start_connection_creation(self.note2, QPointF(100, 100))
+        self.assertIs(self.canvas._connection_preview_line, preview_line)
+        self.assertIn(preview_line, self.scene.items())
 
     def test_connection_preview_creation(self):
         """Test connection preview line creation during drag."""
@@ -151,6 +195,7 @@ class TestConnectionCreation(unittest.TestCase):
         # Move mouse to trigger preview (beyond threshold)
         new_mouse_pos = QPointF(150, 150)
         self.canvas._update_connection_preview(new_mouse_pos)
+        self.canvas._flush_preview()
 
         # Verify preview line was created
         self.assertIsNotNone(self.canvas._connection_preview_line)
@@ -322,6 +367,7 @@ class TestConnectionCreation(unittest.TestCase):
                 # Update connection preview (beyond drag threshold)
                 mouse_pos = QPointF(200, 200)
                 self.canvas._update_connection_preview(mouse_pos)
+                self.canvas._flush_preview()
 
         # Verify preview line was created
         self.assertIsNotNone(self.canvas._connection_preview_line)
@@ -330,6 +376,26 @@ class TestConnectionCreation(unittest.TestCase):
         self.assertEqual(self.canvas._connection_target_note, self.note2)
         self.assertTrue(self.note2.isSelected())
 
+    def test_mouse_move_skips_preview_for_small_motion(self):
+        """Test that sub-threshold mouse jitter doesn't refresh the preview."""
+        self.canvas._start_connection_creation(self.note1, QPointF(100, 100))
+
+        def move_event(pos):
+            return QMouseEvent(
+                QMouseEvent.Type.MouseMove,
+                pos,
+                Qt.MouseButton.NoButton,
+                Qt.MouseButton.LeftButton,
+                Qt.KeyboardModifier.NoModifier,
+            )
+
+        with patch.object(self.canvas, "_update_connection_preview") as mock_update:
+            self.canvas.mouseMoveEvent(move_event(QPointF(101, 100)))
+            mock_update.assert_not_called()
+
+            self.canvas.mouseMoveEvent(move_event(QPointF(120, 120)))
+            mock_update.assert_called_once()
+
     def tearDown(self):
         """Clean up after each test."""
         # Clear the scene
@@ -5,12 +5,20 @@ Tests connection path calculations, rendering, styling, and dynamic updates
 when connected notes are moved.
 """
 
+import math
 import unittest
-from PyQt6.QtWidgets import QApplication, QGraphicsScene
+from unittest.mock import Mock, patch
+from PyQt6.QtWidgets import (
+    QApplication,
+    QGraphicsPathItem,
+    QGraphicsScene,
+    QGraphicsView,
+    QStyleOptionGraphicsItem,
+)
 from PyQt6.QtCore import QPointF, QRectF
-from PyQt6.QtGui import QColor, QPainterPath
+from PyQt6.QtGui import QColor, QImage, QPainter, QPainterPath
 
-from src.whiteboard.connection_item import ConnectionItem
+from src.whiteboard.connection_item import ConnectionItem, ConnectionStyle
 from src.whiteboard.note_item import NoteItem
 
 
@@ -128,6 +136,267 @@ class TestConnectionItem(unittest.TestCase):
         # Arrow should contain the end point
         self.assertTrue(arrow_path.boundingRect().contains(end_point))
 
+    def test_arrow_polygon_is_cached(self):
+        """Test that the arrow polygon is rebuilt only when inputs change."""
+        connection = ConnectionItem(self.start_note, self.end_note)
+        start_point = QPointF(0, 0)
+        end_point = QPointF(100, 0)
+
+        first = connection._get_arrow_polygon(start_point, end_point)
+        self.assertIs(connection._get_arrow_polygon(start_point, end_point), first)
+
+        connection.set_style({"arrow_size": 20})
+        resized = connection._get_arrow_polygon(start_point, end_point)
+        self.assertIsNot(resized, first)
+        self.assertGreater(resized.boundingRect().width(), first.boundingRect().width())
+
+    def test_geometry_cache_invalidated_on_path_update(self):
+        """Test that bounds and shape are reused until the path changes."""
+        connection = ConnectionItem(self.start_note, self.end_note)
+
+        shape = connection.shape()
+        self.assertIs(connection.shape(), shape)
+        bounds = connection.boundingRect()
+
+        self.end_note.setPos(400, 300)
+        connection.update_path()
+
+        self.assertIsNot(connection.shape(), shape)
+        self.assertNotEqual(connection.boundingRect(), bounds)
+        midpoint = connection.path().pointAtPercent(0.5)
+        self.assertTrue(connection.contains(midpoint))
+
+    def test_uses_device_coordinate_cache(self):
+        """Test that connections render through Qt's device pixmap cache."""
+        connection = ConnectionItem(self.start_note, self.end_note)
+        self.assertEqual(
+            connection.cacheMode(),
+            QGraphicsPathItem.CacheMode.DeviceCoordinateCache,
+        )
+
+    def test_arrow_polygon_matches_angle_rotation(self):
+        """Test that arrow points match rotating the line angle by arrow_angle."""
+        connection = ConnectionItem(self.start_note, self.end_note)
+        start_point = QPointF(10, 20)
+        end_point = QPointF(-50, 95)
+        polygon = connection._get_arrow_polygon(start_point, end_point)
+
+        size = connection.get_style()["arrow_size"]
+        spread = math.radians(connection.get_style()["arrow_angle"])
+        angle = math.atan2(95 - 20, -50 - 10)
+        for point, offset in ((polygon[1], -spread), (polygon[2], spread)):
+            self.assertAlmostEqual(point.x(), -50 - size * math.cos(angle + offset))
+            self.assertAlmostEqual(point.y(), 95 - size * math.sin(angle + offset))
+
+    def test_update_path_skips_unchanged_geometry(self):
+        """Test that update_path only rebuilds when endpoints or style change."""
+        connection = ConnectionItem(self.start_note, self.end_note)
+
+        with patch.object(connection, "setPath") as set_path:
+            connection.update_path()
+            set_path.assert_not_called()
+
+            self.end_note.setPos(300, 250)
+            connection.update_path()
+            self.assertEqual(set_path.call_count, 1)
+
+            connection.set_style({"curve_factor": 0.3})
+            self.assertEqual(set_path.call_count, 2)
+
+    def test_pen_only_style_skips_path_rebuild(self):
+        """Test that color/width changes restyle the pen without a new path."""
+        connection = ConnectionItem(self.start_note, self.end_note)
+        bounds = connection.boundingRect()
+
+        with patch.object(connection, "setPath") as set_path:
+            connection.set_style({"line_color": QColor(255, 0, 0)})
+            connection.set_style({"line_width": 16})
+            connection.update_path()
+            set_path.assert_not_called()
+
+        self.assertEqual(connection.pen().color(), QColor(255, 0, 0))
+        self.assertEqual(connection.pen().width(), 16)
+        # Selection margin grows with the line width
+        self.assertGreater(connection.boundingRect().width(), bounds.width())
+
+    def test_connection_points_reused_until_endpoint_moves(self):
+        """Test that endpoint connection points are cached per outline."""
+        connection = ConnectionItem(self.start_note, self.end_note)
+
+        with patch.object(
+            self.end_note,
+            "get_connection_points",
+            wraps=self.end_note.get_connection_points,
+        ) as get_points:
+            connection._calculate_connection_points()
+            get_points.assert_not_called()
+
+            self.end_note.setPos(350, 40)
+            connection._calculate_connection_points()
+            connection._calculate_connection_points()
+            self.assertEqual(get_points.call_count, 1)
+
+    def test_selected_pen_cached_per_style(self):
+        """Test that the highlight pen is built once and rebuilt on style change."""
+        connection = ConnectionItem(self.start_note, self.end_note)
+
+        selected_pen = connection._get_selected_pen()
+        self.assertIs(connection._get_selected_pen(), selected_pen)
+        self.assertEqual(selected_pen.width(), connection.get_style()["line_width"] + 1)
+
+        connection.set_style({"line_width": 5, "arrow_angle": 45})
+        self.assertIsNot(connection._get_selected_pen(), selected_pen)
+        self.assertEqual(connection._get_selected_pen().width(), 6)
+        self.assertEqual(connection._base_pen.width(), 5)
+        self.assertAlmostEqual(connection._arrow_angle_rad, math.pi / 4)
+        self.assertAlmostEqual(connection._cos_arrow_angle, math.sqrt(0.5))
+        self.assertAlmostEqual(connection._sin_arrow_angle, math.sqrt(0.5))
+
+    def test_paint_fills_arrow_head(self):
+        """Test that painting draws the arrow head filled in the line color."""
+        connection = ConnectionItem(self.start_note, self.end_note)
+        connection.set_style({"line_color": QColor(255, 0, 0), "arrow_size": 20})
+        polygon = connection._get_arrow_polygon(
+            connection._start_point, connection._end_point
+        )
+        centroid = sum((polygon[i] for i in range(3)), QPointF()) / 3
+
+        bounds = connection.boundingRect()
+        image = QImage(bounds.size().toSize(), QImage.Format.Format_ARGB32)
+        image.fill(0)
+        painter = QPainter(image)
+        painter.translate(-bounds.topLeft())
+        connection.paint(painter, QStyleOptionGraphicsItem(), None)
+        painter.end()
+
+        pixel = image.pixelColor((centroid - bounds.topLeft()).toPoint())
+        self.assertEqual(pixel.red(), 255)
+        self.assertEqual(pixel.alpha(), 255)
+
+    def test_paint_does_not_fill_curved_line(self):
+        """Test that a brush left on the painter never fills under a curve."""
+        connection = ConnectionItem(self.start_note, self.end_note)
+        connection.set_style({"curve_factor": 0.5, "show_arrow": False})
+        bounds = connection.boundingRect()
+        chord_mid = (connection._start_point + connection._end_point) / 2
+
+        image = QImage(bounds.size().toSize(), QImage.Format.Format_ARGB32)
+        image.fill(0)
+        painter = QPainter(image)
+        painter.translate(-bounds.topLeft())
+        painter.setBrush(QColor(0, 0, 255))
+        connection.paint(painter, QStyleOptionGraphicsItem(), None)
+        painter.end()
+
+        pixel = image.pixelColor((chord_mid - bounds.topLeft()).toPoint())
+        self.assertEqual(pixel.alpha(), 0)
+
+    def test_paint_draws_straight_line_without_path(self):
+        """Test that straight connections are drawn with drawLine."""
+        connection = ConnectionItem(self.start_note, self.end_note)
+        painter = Mock()
+
+        connection.paint(painter, QStyleOptionGraphicsItem(), None)
+        painter.drawLine.assert_called_once_with(
+            connection._start_point, connection._end_point
+        )
+        painter.drawPath.assert_not_called()
+
+        painter.reset_mock()
+        connection.set_style({"curve_factor": 0.4})
+        connection.paint(painter, QStyleOptionGraphicsItem(), None)
+        painter.drawPath.assert_called_once_with(connection._line_path)
+        painter.drawLine.assert_not_called()
+
+    def test_paint_reuses_line_path(self):
+        """Test that painting draws the line built by update_path."""
+        connection = ConnectionItem(self.start_note, self.end_note)
+        self.assertEqual(
+            connection._line_path.pointAtPercent(1.0), connection._end_point
+        )
+
+        image = QImage(16, 16, QImage.Format.Format_ARGB32)
+        painter = QPainter(image)
+        with patch.object(connection, "_create_line_path_only") as build_line:
+            connection.paint(painter, QStyleOptionGraphicsItem(), None)
+        painter.end()
+        build_line.assert_not_called()
+
+    def test_connection_path_appends_arrow_polygon(self):
+        """Test that the arrow polygon is added to the path as one subpath."""
+        connection = ConnectionItem(self.start_note, self.end_note)
+        start_point = QPointF(0, 0)
+        end_point = QPointF(100, 0)
+
+        path = connection._create_connection_path(start_point, end_point)
+        polygon = connection._get_arrow_polygon(start_point, end_point)
+
+        # moveTo + lineTo for the line, then the three arrow vertices
+        self.assertEqual(path.elementCount(), 5)
+        for index in range(3):
+            element = path.elementAt(2 + index)
+            self.assertEqual(QPointF(element.x, element.y), polygon[index])
+
+    def test_style_dict_api_over_slotted_style(self):
+        """Test that the dict style API round-trips through ConnectionStyle."""
+        connection = ConnectionItem(self.start_note, self.end_note)
+        self.assertIsInstance(connection._style, ConnectionStyle)
+
+        connection.set_style({"line_width": 4, "unknown_key": "ignored"})
+        style = connection.get_style()
+        self.assertEqual(set(style), set(ConnectionStyle().to_dict()))
+        self.assertEqual(style["line_width"], 4)
+        self.assertNotIn("unknown_key", style)
+
+        style["line_width"] = 9
+        self.assertEqual(connection._style.line_width, 4)
+
+    def test_endpoint_moves_coalesce_into_one_path_update(self):
+        """Test that repeated endpoint moves rebuild the path once, later."""
+        connection = ConnectionItem(self.start_note, self.end_note)
+
+        with patch.object(connection, "update_path") as update_path:
+            for x in range(200, 260, 10):
+                self.end_note.setPos(x, 0)
+            self.start_note.setPos(-20, 0)
+            update_path.assert_not_called()
+            self.assertTrue(connection._path_update_timer.isActive())
+
+            QApplication.processEvents()
+            update_path.assert_called_once()
+
+    def test_closest_pair_reused_while_endpoints_unchanged(self):
+        """Test that the closest pair is only searched again after a change."""
+        connection = ConnectionItem(self.start_note, self.end_note)
+        pair = connection._calculate_connection_points()
+        self.assertIs(connection._calculate_connection_points(), pair)
+
+        connection._on_endpoint_content_changed("")
+        self.assertIsNot(connection._calculate_connection_points(), pair)
+
+    def test_note_restyle_only_reroutes_when_bounds_change(self):
+        """Test that recoloring a note does not queue a connection update."""
+        connection = ConnectionItem(self.start_note, self.end_note)
+        QApplication.processEvents()
+
+        self.start_note.set_style({"background_color": QColor(10, 200, 10)})
+        self.assertIsNone(connection._path_update_timer)
+
+        self.start_note.set_style({"padding": 40})
+        self.assertTrue(connection._path_update_timer.isActive())
+
+    def test_signals_created_on_first_access(self):
+        """Test that the signal emitter is only allocated when used."""
+        connection = ConnectionItem(self.start_note, self.end_note)
+        self.assertIsNone(connection._signals)
+
+        # Emitting paths tolerate a missing emitter
+        connection.set_style({"line_width": 3})
+        connection.delete_connection()
+        self.assertIsNone(connection._signals)
+
+        self.assertIs(connection.signals, connection.signals)
+
     def test_arrow_head_angle_calculation(self):
         """Test arrow head angle calculation for different line directions."""
         connection = ConnectionItem(self.start_note, self.end_note)
@@ -224,6 +493,39 @@ class TestConnectionItem(unittest.TestCase):
         # End point should be to the left of end note center
         self.assertLessEqual(end_point.x(), end_center.x())
 
+    def test_item_id_tracks_restored_endpoint_ids(self):
+        """Test that endpoint ids are read fresh, not memoized at creation."""
+        connection = ConnectionItem(self.start_note, self.end_note)
+        self.start_note._note_id = 4242
+
+        data = connection.get_connection_data()
+        self.assertEqual(data["start_item_id"], "note_4242")
+        self.assertEqual(connection._get_item_id(object()).split("_")[0], "item")
+
+    def test_context_menu_built_once_and_applies_presets(self):
+        """Test that the cached context menu actions restyle the connection."""
+        connection = ConnectionItem(self.start_note, self.end_note)
+        connection._build_context_menu()
+        menu = connection._context_menu
+
+        actions = {}
+        pending = [menu]
+        while pending:
+            for action in pending.pop().actions():
+                actions[action.text()] = action
+                if action.menu() is not None:
+                    pending.append(action.menu())
+
+        actions["🔵 Blue"].trigger()
+        actions["Thick (3px)"].trigger()
+        style = connection.get_style()
+        self.assertEqual(style["line_color"], QColor(0, 120, 215))
+        self.assertEqual(style["line_width"], 3)
+
+        connection._show_arrow_action.trigger()
+        self.assertFalse(connection.get_style()["show_arrow"])
+        self.assertIs(connection._context_menu, menu)
+
     def test_connection_data_serialization(self):
         """Test getting connection data for serialization."""
         connection = ConnectionItem(self.start_note, self.end_note)
@@ -321,6 +623,45 @@ class TestConnectionItem(unittest.TestCase):
         # Verify connection is removed from scene
         self.assertNotIn(connection, scene.items())
 
+    def test_delete_disconnects_endpoint_signals(self):
+        """Test that deleting a connection releases every endpoint signal."""
+        note = self.start_note
+        signals = (note.position_changed, note.geometry_changed, note.content_changed)
+        before = [note.receivers(signal) for signal in signals]
+
+        connection = ConnectionItem(note, self.end_note)
+        self.assertEqual(
+            [note.receivers(signal) for signal in signals],
+            [count + 1 for count in before],
+        )
+
+        connection.delete_connection()
+        self.assertEqual([note.receivers(signal) for signal in signals], before)
+
+        # Releasing again is a no-op once the handles are gone
+        self.assertEqual(connection._signal_tokens, [])
+        connection._disconnect_item_signals()
+        self.assertEqual([note.receivers(signal) for signal in signals], before)
+
+    def test_centralized_delete_routes_to_canvas_view(self):
+        """Test that deletion goes through the canvas view, found once."""
+        scene = QGraphicsScene()
+        scene.addItem(self.start_note)
+        scene.addItem(self.end_note)
+        connection = ConnectionItem(self.start_note, self.end_note)
+        scene.addItem(connection)
+        view = QGraphicsView(scene)
+        view.delete_items_with_confirmation = Mock(return_value=True)
+
+        connection._request_centralized_delete()
+        view.delete_items_with_confirmation.assert_called_once_with([connection])
+        self.assertIs(connection._canvas_ref(), view)
+
+        with patch.object(scene, "views") as views:
+            connection._request_centralized_delete()
+            views.assert_not_called()
+        self.assertEqual(view.delete_items_with_confirmation.call_count, 2)
+
     def test_style_signal_emission(self):
         """Test that style changes emit appropriate signals."""
         connection = ConnectionItem(self.start_note, self.end_note)
@@ -195,9 +195,7 @@ class TestContextMenuFunctionality(unittest.TestCase):
                             self.assertGreater(mock_menu.addMenu.call_count, 0)
                             self.assertGreater(mock_menu.addAction.call_count, 0)
                             mock_menu.addSeparator.assert_called()
-                            mock_populate.assert_called_once_with(
-                                mock_template_menu, QPointF(100, 100)
-                            )
+                            mock_populate.assert_called_once_with(mock_template_menu)
 
     def test_canvas_context_menu_note_creation(self):
         """Test that canvas context menu note creation works."""
@@ -371,10 +369,70 @@ class TestContextMenuFunctionality(unittest.TestCase):
                             self.canvas.contextMenuEvent(event)
 
                             # Verify template menu was populated with correct parameters
-                            mock_populate.assert_called_once_with(
-                                mock_template_menu, scene_pos
+                            mock_populate.assert_called_once_with(mock_template_menu)
+                            self.assertEqual(
+                                self.canvas._last_context_scene_pos, scene_pos
                             )
 
+    def test_context_menu_reused_across_events(self):
+        """Test that the context menu is built once and templates refresh lazily."""
+        event = Mock(spec=QContextMenuEvent)
+        event.pos.return_value = QPoint(100, 100)
+        event.globalPos.return_value = QPoint(200, 200)
+        event.accept = Mock()
+
+        mock_scene = Mock()
+        mock_scene.itemAt.return_value = None
+
+        with patch.object(self.canvas, "transform", return_value=Mock()):
+            with patch.object(self.canvas, "scene", return_value=mock_scene):
+                with patch("src.whiteboard.canvas.QMenu") as mock_menu_class:
+                    mock_menu = Mock()
+                    mock_menu_class.return_value = mock_menu
+
+                    with patch.object(
+                        self.canvas, "_populate_canvas_template_menu"
+                    ) as mock_populate:
+                        with patch.object(
+                            self.canvas, "mapToScene", return_value=QPointF(10, 10)
+                        ):
+                            self.canvas.contextMenuEvent(event)
+                        with patch.object(
+                            self.canvas, "mapToScene", return_value=QPointF(50, 60)
+                        ):
+                            self.canvas.contextMenuEvent(event)
+
+                        mock_menu_class.assert_called_once_with(self.canvas)
+                        self.assertEqual(mock_menu.exec.call_count, 2)
+                        mock_populate.assert_called_once()
+                        self.assertEqual(
+                            self.canvas._last_context_scene_pos, QPointF(50, 60)
+                        )
+
+                        # A template change repopulates the submenu on next open
+                        self.canvas._mark_template_menu_stale("New Template")
+                        with patch.object(
+                            self.canvas, "mapToScene", return_value=QPointF(50, 60)
+                        ):
+                            self.canvas.contextMenuEvent(event)
+                        self.assertEqual(mock_populate.call_count, 2)
+
+    def test_template_action_uses_last_context_position(self):
+        """Test that template actions create notes at the last menu position."""
+        from PyQt6.QtWidgets import QMenu
+
+        menu = QMenu()
+        self.canvas._populate_canvas_template_menu(menu)
+        actions = menu.actions()
+        self.assertTrue(actions)
+
+        self.canvas._last_context_scene_pos = QPointF(30, 40)
+        with patch.object(self.canvas, "_create_note_from_template") as mock_create:
+            actions[0].trigger()
+
+        template_name = actions[0].text().removeprefix("📄 ")
+        mock_create.assert_called_once_with(template_name, QPointF(30, 40))
+
     def test_context_menu_with_no_selection(self):
         """Test context menu behavior when no items are selected."""
         event = Mock(spec=QContextMenuEvent)
@@ -533,25 +591,21 @@ class TestContextMenuFunctionality(unittest.TestCase):
         mock_note1 = Mock(spec=NoteItem)
         mock_note2 = Mock(spec=NoteItem)
         mock_other_item = Mock()  # Not a NoteItem
+        mock_note1.isSelected.return_value = False
+        mock_note2.isSelected.return_value = False
 
-        # Mock isinstance to return True for NoteItems and False for others
-        with patch("src.whiteboard.canvas.isinstance") as mock_isinstance:
+        # Only the scene's note index is consulted, not every scene item
+        mock_scene.get_notes.return_value = [mock_note1, mock_note2]
+        mock_scene.items.return_value = [mock_note1, mock_note2, mock_other_item]
 
-            def isinstance_side_effect(obj, cls):
-                if cls == NoteItem:
-                    return obj in [mock_note1, mock_note2]
-                return False
-
-            mock_isinstance.side_effect = isinstance_side_effect
-            mock_scene.items.return_value = [mock_note1, mock_note2, mock_other_item]
-
-            with patch.object(self.canvas, "_scene", mock_scene):
-                self.canvas._select_all_notes()
+        with patch.object(self.canvas, "_scene", mock_scene):
+            self.canvas._select_all_notes()
 
-                # Verify only NoteItems were selected
-                mock_note1.setSelected.assert_called_once_with(True)
-                mock_note2.setSelected.assert_called_once_with(True)
-                mock_other_item.setSelected.assert_not_called()
+            # Verify only NoteItems were selected
+            mock_note1.setSelected.assert_called_once_with(True)
+            mock_note2.setSelected.assert_called_once_with(True)
+            mock_other_item.setSelected.assert_not_called()
+            mock_scene.items.assert_not_called()
 
         # Test clear selection functionality
         with patch.object(self.canvas, "_scene", mock_scene):
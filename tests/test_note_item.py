@@ -9,10 +9,10 @@ import unittest
 from unittest.mock import Mock
 from PyQt6.QtWidgets import QApplication, QGraphicsScene
 from PyQt6.QtCore import QPointF
-from PyQt6.QtGui import QColor
+from PyQt6.QtGui import QColor, QImage, QPainter
 from PyQt6.QtTest import QTest
 
-from src.whiteboard.note_item import NoteItem
+from src.whiteboard.note_item import NoteItem, _cached_brush, _cached_pen
 
 
 class TestNoteItem(unittest.TestCase):
@@ -276,6 +276,22 @@ class TestNoteItem(unittest.TestCase):
         for point in points:
             self.assertIsInstance(point, QPointF)
 
+    def test_connection_points_cached_until_geometry_changes(self):
+        """Test that connection points are reused until the note moves or resizes."""
+        note = NoteItem("Test")
+        points = note.get_connection_points()
+        cached = note._connection_points_cache
+
+        self.assertEqual(note.get_connection_points(), points)
+        self.assertIs(note._connection_points_cache, cached)
+
+        note.setPos(40, 30)
+        moved = note.get_connection_points()
+        self.assertEqual(moved[0], points[0] + QPointF(40, 30))
+
+        note.set_text("A much longer line of text that widens the note")
+        self.assertNotEqual(note.get_connection_points()[1], moved[1])
+
     def test_note_data_serialization(self):
         """Test getting complete note data for serialization."""
         note = NoteItem(self.test_text, self.test_position)
@@ -398,6 +414,25 @@ class TestNoteItem(unittest.TestCase):
         self.assertNotIn("invalid_property", style)
         self.assertNotIn("another_invalid", style)
 
+    def test_paint_shares_brushes_and_pens(self):
+        """Test that notes with the same style reuse cached brushes and pens."""
+        notes = [NoteItem("one"), NoteItem("two")]
+        for note in notes:
+            self.scene.addItem(note)
+
+        image = QImage(400, 400, QImage.Format.Format_ARGB32)
+        painter = QPainter(image)
+        try:
+            self.scene.render(painter)
+            brush_misses = _cached_brush.cache_info().misses
+            pen_misses = _cached_pen.cache_info().misses
+            self.scene.render(painter)
+        finally:
+            painter.end()
+
+        self.assertEqual(_cached_brush.cache_info().misses, brush_misses)
+        self.assertEqual(_cached_pen.cache_info().misses, pen_misses)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -12,6 +12,7 @@ from pathlib import Path
 from PyQt6.QtWidgets import QApplication, QGraphicsScene
 from PyQt6.QtCore import QPointF, QRectF
 
+from src.whiteboard.canvas import WhiteboardScene
 from src.whiteboard.session_manager import SessionManager, SessionError
 from src.whiteboard.note_item import NoteItem
 from src.whiteboard.connection_item import ConnectionItem
@@ -538,6 +539,21 @@ class TestSessionManager(unittest.TestCase):
         mock_deserialize_note.assert_called_once()
         mock_deserialize_connection.assert_called_once()
 
+    def test_deserialize_scene_items_keeps_duplicate_note_ids(self):
+        """Test that notes sharing an id are all loaded into the scene."""
+        note_data = {
+            "id": 1001,
+            "position": {"x": 0, "y": 0},
+            "content": {"text": "Same id"},
+        }
+        session_data = {"notes": [note_data, dict(note_data)], "connections": []}
+        scene = WhiteboardScene()
+
+        counts = self.session_manager._deserialize_scene_items(session_data, scene)
+
+        self.assertEqual(counts, (2, 0, 0))
+        self.assertEqual(len(scene.get_notes()), 2)
+
     def test_deserialize_scene_data_validation_failure(self):
         """Test scene data deserialization with validation failure."""
         invalid_session_data = {
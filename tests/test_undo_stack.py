@@ -0,0 +1,412 @@
+"""
+Unit tests for the undo/redo command stack.
+"""
+
+import gc
+import unittest
+
+from PyQt6.QtCore import QPointF
+from PyQt6.QtGui import QColor
+from PyQt6.QtWidgets import QApplication
+
+from src.whiteboard.canvas import WhiteboardCanvas, WhiteboardScene
+from src.whiteboard.commands.base import MERGE_WINDOW, Command
+from src.whiteboard.commands.delete_commands import DeleteItemsCommand
+from src.whiteboard.commands.note_commands import (
+    _STYLE_CACHE,
+    MoveNoteCommand,
+    UpdateNoteStyleCommand,
+    UpdateNoteTextCommand,
+)
+from src.whiteboard.commands.stack import MAX_UNDO, UndoRedoStack
+from src.whiteboard.image_item import ImageItem
+from src.whiteboard.note_item import NoteItem
+
+
+class RecordingCommand(Command):
+    """Command that records execute/undo calls into a shared log."""
+
+    def __init__(self, name: str, log: list):
+        super().__init__(description=name)
+        self.log = log
+
+    def execute(self) -> None:
+        self.log.append(("execute", self.description))
+
+    def undo(self) -> None:
+        self.log.append(("undo", self.description))
+
+
+class TestUndoRedoStack(unittest.TestCase):
+    """Test cases for UndoRedoStack."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up QApplication for testing."""
+        if not QApplication.instance():
+            cls.app = QApplication([])
+        else:
+            cls.app = QApplication.instance()
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.log = []
+
+    def test_default_depth(self):
+        """Test that the stack is bounded by MAX_UNDO by default."""
+        stack = UndoRedoStack()
+        for i in range(MAX_UNDO + 5):
+            stack.push_and_execute(RecordingCommand(f"cmd{i}", self.log))
+
+        self.assertEqual(len(stack._undo_stack), MAX_UNDO)
+
+    def test_oldest_commands_are_discarded(self):
+        """Test that only the most recent commands can be undone."""
+        stack = UndoRedoStack(max_depth=3)
+        for i in range(5):
+            stack.push_and_execute(RecordingCommand(f"cmd{i}", self.log))
+        self.log.clear()
+
+        while stack.can_undo():
+            stack.undo()
+
+        self.assertEqual(
+            self.log, [("undo", "cmd4"), ("undo", "cmd3"), ("undo", "cmd2")]
+        )
+
+    def test_set_history_limit_keeps_newest(self):
+        """Test that shrinking the history keeps the most recent commands."""
+        stack = UndoRedoStack()
+        for i in range(5):
+            stack.push_and_execute(RecordingCommand(f"cmd{i}", self.log))
+
+        stack.set_history_limit(2)
+        stack.push_and_execute(RecordingCommand("cmd5", self.log))
+
+        self.assertEqual(
+            [cmd.description for cmd in stack._undo_stack], ["cmd4", "cmd5"]
+        )
+
+    def test_availability_signals_only_on_change(self):
+        """Test that can_undo/can_redo are only emitted when they flip."""
+        stack = UndoRedoStack()
+        undo_states = []
+        redo_states = []
+        stack.can_undo_changed.connect(undo_states.append)
+        stack.can_redo_changed.connect(redo_states.append)
+
+        stack.push_and_execute(RecordingCommand("a", self.log))
+        stack.push_and_execute(RecordingCommand("b", self.log))
+        stack.undo()
+        stack.undo()
+        stack.redo()
+
+        self.assertEqual(undo_states, [True, False, True])
+        self.assertEqual(redo_states, [True])
+
+    def test_redo_after_undo(self):
+        """Test that undone commands can be redone in order."""
+        stack = UndoRedoStack(max_depth=3)
+        stack.push_and_execute(RecordingCommand("a", self.log))
+        stack.push_and_execute(RecordingCommand("b", self.log))
+
+        stack.undo()
+        self.assertTrue(stack.can_redo())
+        stack.redo()
+
+        self.assertEqual(self.log[-2:], [("undo", "b"), ("execute", "b")])
+        self.assertFalse(stack.can_redo())
+
+
+class TestNoteCommands(unittest.TestCase):
+    """Test cases for note commands."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up QApplication for testing."""
+        if not QApplication.instance():
+            cls.app = QApplication([])
+        else:
+            cls.app = QApplication.instance()
+
+    def test_move_command_stores_offset(self):
+        """Test that a move is recorded as a start point plus offset."""
+        note = NoteItem("Move me", QPointF(10, 20))
+        cmd = MoveNoteCommand(note, QPointF(10, 20), QPointF(35, 5))
+
+        self.assertEqual(cmd.payload["start"], (10.0, 20.0))
+        self.assertEqual(cmd.payload["delta"], (25.0, -15.0))
+
+        cmd.execute()
+        self.assertEqual(note.pos(), QPointF(35, 5))
+        cmd.undo()
+        self.assertEqual(note.pos(), QPointF(10, 20))
+
+    def test_rapid_moves_are_merged(self):
+        """Test that quick successive moves of one note undo together."""
+        note = NoteItem("Drag me", QPointF(0, 0))
+        stack = UndoRedoStack()
+
+        stack.push_and_execute(MoveNoteCommand(note, QPointF(0, 0), QPointF(5, 5)))
+        stack.push_and_execute(MoveNoteCommand(note, QPointF(5, 5), QPointF(20, 10)))
+
+        self.assertEqual(len(stack._undo_stack), 1)
+        self.assertEqual(note.pos(), QPointF(20, 10))
+        stack.undo()
+        self.assertEqual(note.pos(), QPointF(0, 0))
+
+    def test_moves_outside_window_are_kept_separate(self):
+        """Test that moves further apart than the merge window stay distinct."""
+        note = NoteItem("Drag me", QPointF(0, 0))
+        stack = UndoRedoStack()
+
+        first = MoveNoteCommand(note, QPointF(0, 0), QPointF(5, 5))
+        stack.push_and_execute(first)
+        first._timestamp -= MERGE_WINDOW + 1
+        stack.push_and_execute(MoveNoteCommand(note, QPointF(5, 5), QPointF(20, 10)))
+
+        self.assertEqual(len(stack._undo_stack), 2)
+        stack.undo()
+        self.assertEqual(note.pos(), QPointF(5, 5))
+
+    def test_text_command_stores_changed_span(self):
+        """Test that text commands keep only the edited span."""
+        note = NoteItem("The quick fox")
+        cmd = UpdateNoteTextCommand(note, "The quick fox", "The quick brown fox")
+
+        self.assertEqual(cmd.payload["pos"], 10)
+        self.assertEqual(cmd.payload["removed"], "")
+        self.assertEqual(cmd.payload["inserted"], "brown ")
+
+        cmd.execute()
+        self.assertEqual(note.get_text(), "The quick brown fox")
+        cmd.undo()
+        self.assertEqual(note.get_text(), "The quick fox")
+        cmd.redo()
+        self.assertEqual(note.get_text(), "The quick brown fox")
+
+    def test_text_command_after_edit_keeps_text(self):
+        """Test that executing a command recorded after an edit is harmless."""
+        note = NoteItem("aaa")
+        note.set_text("aaaa")
+        cmd = UpdateNoteTextCommand(note, "aaa", "aaaa")
+
+        cmd.execute()
+        self.assertEqual(note.get_text(), "aaaa")
+        cmd.undo()
+        self.assertEqual(note.get_text(), "aaa")
+
+    def test_text_command_ignores_untrimmed_note_text(self):
+        """Test that whitespace left in the note does not skew the edit."""
+        note = NoteItem("ab")
+        note.set_text("ab c\n")
+        cmd = UpdateNoteTextCommand(note, "ab", "ab c")
+
+        cmd.execute()
+        self.assertEqual(note.get_text(), "ab c")
+        cmd.undo()
+        self.assertEqual(note.get_text(), "ab")
+
+        note.set_text(" hello world")
+        cmd = UpdateNoteTextCommand(note, "hello", "hello world")
+        cmd.execute()
+        self.assertEqual(note.get_text(), "hello world")
+        cmd.undo()
+        self.assertEqual(note.get_text(), "hello")
+
+    def test_text_command_with_placeholder_text(self):
+        """Test clearing a note that then shows its placeholder text."""
+        note = NoteItem("hello")
+        note.set_text("Double-click to edit")
+        cmd = UpdateNoteTextCommand(note, "hello", "")
+
+        cmd.execute()
+        self.assertEqual(note.get_text(), "")
+        cmd.undo()
+        self.assertEqual(note.get_text(), "hello")
+
+    def test_rapid_text_edits_are_merged(self):
+        """Test that quick successive text edits undo together."""
+        note = NoteItem("ab")
+        stack = UndoRedoStack()
+
+        note.set_text("abc")
+        stack.push_and_execute(UpdateNoteTextCommand(note, "ab", "abc"))
+        note.set_text("xabcd")
+        stack.push_and_execute(UpdateNoteTextCommand(note, "abc", "xabcd"))
+
+        self.assertEqual(len(stack._undo_stack), 1)
+        stack.undo()
+        self.assertEqual(note.get_text(), "ab")
+        stack.redo()
+        self.assertEqual(note.get_text(), "xabcd")
+
+    def test_style_command_keeps_only_changed_keys(self):
+        """Test that style commands replay only the keys that changed."""
+        note = NoteItem("Style me")
+        old_style = note.get_style()
+        new_style = dict(old_style, background_color=QColor(200, 220, 255))
+
+        cmd = UpdateNoteStyleCommand(note, old_style, new_style)
+        self.assertEqual(list(cmd.payload["new_style"]), ["background_color"])
+
+        cmd.execute()
+        self.assertEqual(note.get_style()["background_color"], QColor(200, 220, 255))
+        cmd.undo()
+        self.assertEqual(note.get_style(), old_style)
+
+    def test_identical_style_changes_share_storage(self):
+        """Test that commands recording the same style change share dicts."""
+        first = NoteItem("One")
+        second = NoteItem("Two")
+        change = {"background_color": QColor(255, 200, 220)}
+
+        cmd_one = UpdateNoteStyleCommand(first, first.get_style(), change)
+        cmd_two = UpdateNoteStyleCommand(second, second.get_style(), dict(change))
+
+        self.assertIs(cmd_one.payload["new_style"], cmd_two.payload["new_style"])
+        self.assertIs(cmd_one.payload["old_style"], cmd_two.payload["old_style"])
+
+    def test_interned_styles_are_read_only(self):
+        """Test that a payload cannot corrupt other commands' shared styles."""
+        first = NoteItem("One")
+        second = NoteItem("Two")
+        change = {"background_color": QColor(10, 20, 30)}
+        cmd_one = UpdateNoteStyleCommand(first, first.get_style(), change)
+        cmd_two = UpdateNoteStyleCommand(second, second.get_style(), dict(change))
+
+        with self.assertRaises(TypeError):
+            cmd_one.payload["new_style"]["background_color"] = QColor(0, 0, 0)
+        self.assertEqual(
+            cmd_two.payload["new_style"]["background_color"], QColor(10, 20, 30)
+        )
+
+    def test_interned_style_released_with_last_command(self):
+        """Test that interned styles do not outlive the commands using them."""
+        note = NoteItem("Short lived")
+        cmd = UpdateNoteStyleCommand(
+            note, note.get_style(), {"background_color": QColor(1, 2, 3)}
+        )
+        cached = len(_STYLE_CACHE)
+
+        del cmd
+        gc.collect()
+        self.assertLess(len(_STYLE_CACHE), cached)
+
+
+class TestDeleteItemsCommand(unittest.TestCase):
+    """Test cases for DeleteItemsCommand."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up QApplication for testing."""
+        if not QApplication.instance():
+            cls.app = QApplication([])
+        else:
+            cls.app = QApplication.instance()
+
+    def setUp(self):
+        """Set up a scene with two connected notes."""
+        self.scene = WhiteboardScene()
+        self.canvas = WhiteboardCanvas(self.scene)
+        self.first = NoteItem("First", QPointF(0, 0))
+        self.second = NoteItem("Second", QPointF(300, 0))
+        self.scene.addItem(self.first)
+        self.scene.addItem(self.second)
+        self.connection = self.canvas._create_connection(self.first, self.second)
+
+    def tearDown(self):
+        """Clean up after each test."""
+        self.canvas.close()
+        self.scene.clear()
+
+    def test_execute_deletes_connections_and_notes(self):
+        """Test that selected connections and notes are all removed."""
+        cmd = DeleteItemsCommand(
+            self.scene, self.canvas, [self.first, self.connection, self.second]
+        )
+        cmd.execute()
+
+        self.assertEqual(self.scene.get_notes(), [])
+        self.assertEqual(self.scene.get_connections(), [])
+        self.assertEqual(cmd._items, [self.first, self.second])
+
+    def test_note_styles_stored_as_diffs(self):
+        """Test that only non-default style keys are kept and restored."""
+        self.first.set_style({"background_color": QColor(200, 220, 255)})
+        cmd = DeleteItemsCommand(self.scene, self.canvas, [self.first, self.second])
+        cmd.execute()
+
+        styles = {data["text"]: data["style"] for data in cmd.payload["notes"]}
+        self.assertEqual(list(styles["First"]), ["background_color"])
+        self.assertEqual(styles["Second"], {})
+
+        cmd.undo()
+        restored = {note.get_text(): note for note in self.scene.get_notes()}
+        self.assertEqual(
+            restored["First"].get_style()["background_color"], QColor(200, 220, 255)
+        )
+
+    def test_style_baseline_shared_and_only_with_notes(self):
+        """Test that deletes share one baseline and skip it without notes."""
+        first = DeleteItemsCommand(self.scene, self.canvas, [self.first])
+        first.execute()
+        second = DeleteItemsCommand(self.scene, self.canvas, [self.second])
+        second.execute()
+        self.assertIs(first.payload["style_baseline"], second.payload["style_baseline"])
+
+        image = ImageItem("", QPointF(50, 60))
+        self.scene.addItem(image)
+        cmd = DeleteItemsCommand(self.scene, self.canvas, [image])
+        cmd.execute()
+        self.assertNotIn("style_baseline", cmd.payload)
+
+    def test_undo_reinserts_original_image(self):
+        """Test that undo puts the deleted image item itself back."""
+        image = ImageItem("", QPointF(50, 60))
+        self.scene.addItem(image)
+
+        cmd = DeleteItemsCommand(self.scene, self.canvas, [image])
+        cmd.execute()
+        self.assertIsNone(image.scene())
+
+        cmd.undo()
+        self.assertIs(image.scene(), self.scene)
+        self.assertEqual(image.pos(), QPointF(50, 60))
+
+    def test_undo_resolves_note_and_image_with_same_id(self):
+        """Test that endpoint lookup distinguishes notes from images."""
+        image = ImageItem("", QPointF(0, 300))
+        self.scene.addItem(image)
+        self.first._note_id = 7
+        image._image_id = 7
+        connection = self.canvas._create_connection(self.first, image)
+
+        cmd = DeleteItemsCommand(
+            self.scene, self.canvas, [self.first, image, connection]
+        )
+        cmd.execute()
+        cmd.undo()
+
+        restored = [
+            c
+            for c in self.scene.get_connections()
+            if isinstance(c.get_end_item(), ImageItem)
+        ]
+        self.assertEqual(len(restored), 1)
+        self.assertIsInstance(restored[0].get_start_item(), NoteItem)
+
+    def test_undo_restores_deleted_items(self):
+        """Test that undo recreates notes and their connection."""
+        cmd = DeleteItemsCommand(
+            self.scene, self.canvas, [self.first, self.connection, self.second]
+        )
+        cmd.execute()
+        cmd.undo()
+
+        self.assertEqual(len(self.scene.get_notes()), 2)
+        self.assertEqual(len(self.scene.get_connections()), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()